@@ -0,0 +1,267 @@
+from collections import defaultdict
+from typing import Any, TypedDict
+
+from apps.characters.models import CharacterModel
+from apps.producers.models import ProducerModel
+from apps.staffs.models import StaffModel
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .models import AnimeModel, AnimeNameSynonymModel
+from .models.anime_genre import AnimeGenreModel
+from .models.anime_theme import AnimeThemeModel
+
+# Upserts match an existing anime on any of these
+EXTERNAL_IDS = ("mal_id", "anilist_id", "kitsu_id")
+
+# Plain columns an item may set
+FIELDS = (
+    *EXTERNAL_IDS,
+    "name",
+    "name_japanese",
+    "source",
+    "aired_from",
+    "aired_to",
+    "synopsis",
+    "background",
+    "rating",
+)
+
+# M2M fields an item may set by primary key
+RELATIONS: dict[str, type[models.Model]] = {
+    "genres": AnimeGenreModel,
+    "themes": AnimeThemeModel,
+    "studios": ProducerModel,
+    "producers": ProducerModel,
+    "characters": CharacterModel,
+    "staffs": StaffModel,
+}
+
+# Sent once per committed batch, bulk writes skip `post_save` and `m2m_changed`
+anime_bulk_ingested = Signal()
+
+
+class IngestionError(TypedDict):
+    index: int
+    errors: list[str]
+
+
+class IngestionResult(TypedDict):
+    created: int
+    updated: int
+    unchanged: int
+    errors: list[IngestionError]
+
+
+def _through_fields(field: str) -> tuple[type[models.Model], str, str]:
+    """Through model of an M2M field of `AnimeModel`, with its anime and target columns."""
+    m2m = AnimeModel._meta.get_field(field)
+    return (
+        m2m.remote_field.through,
+        f"{m2m.m2m_field_name()}_id",
+        f"{m2m.m2m_reverse_field_name()}_id",
+    )
+
+
+def _sync_through(
+    field: str,
+    targets: dict[int, set[int]],
+) -> set[int]:
+    """
+    Make the `field` relation of every anime in `targets` hold exactly its set of pks.
+
+    One select, one delete and one insert for the whole batch,
+    returns the anime whose relation changed.
+    """
+    through, source, target = _through_fields(field)
+
+    current: dict[int, dict[int, int]] = defaultdict(dict)
+    for row_pk, anime_pk, target_pk in through.objects.filter(
+        **{f"{source}__in": targets}
+    ).values_list("pk", source, target):
+        current[anime_pk][target_pk] = row_pk
+
+    stale, rows, changed = [], [], set()
+    for anime_pk, wanted in targets.items():
+        existing = current[anime_pk]
+        if removed := existing.keys() - wanted:
+            stale.extend(existing[pk] for pk in removed)
+            changed.add(anime_pk)
+        if added := wanted - existing.keys():
+            rows.extend(through(**{source: anime_pk, target: pk}) for pk in added)
+            changed.add(anime_pk)
+
+    if stale:
+        through.objects.filter(pk__in=stale).delete()
+    if rows:
+        through.objects.bulk_create(rows, ignore_conflicts=True)
+    return changed
+
+
+def _resolve_synonyms(items: list[tuple[int, dict[str, Any]]]) -> dict[str, int]:
+    names = {name for _, data in items for name in data.get("name_synonyms") or []}
+    if not names:
+        return {}
+    AnimeNameSynonymModel.objects.bulk_create(
+        [AnimeNameSynonymModel(name=name) for name in names], ignore_conflicts=True
+    )
+    return dict(
+        AnimeNameSynonymModel.objects.filter(name__in=names).values_list("name", "pk")
+    )
+
+
+def _ingest(items: list[tuple[int, dict[str, Any]]]) -> IngestionResult:
+    result = IngestionResult(created=0, updated=0, unchanged=0, errors=[])
+
+    def fail(index: int, *errors: str) -> None:
+        result["errors"].append(IngestionError(index=index, errors=list(errors)))
+
+    # Every related id of the batch, one `in_bulk` per model
+    ids_by_model: dict[type[models.Model], set[int]] = defaultdict(set)
+    for _, data in items:
+        for field, model in RELATIONS.items():
+            ids_by_model[model].update(data.get(field) or [])
+    known = {
+        model: model.objects.in_bulk(ids).keys()
+        for model, ids in ids_by_model.items()
+        if ids
+    }
+
+    # Anime already stored under any external id or name of the batch, one query
+    lookup = Q(name__in=[data["name"] for _, data in items if data.get("name")])
+    for key in EXTERNAL_IDS:
+        if values := [data[key] for _, data in items if data.get(key) is not None]:
+            lookup |= Q(**{f"{key}__in": values})
+    stored = list(AnimeModel.objects.filter(lookup))
+    by_key = {
+        (key, getattr(anime, key)): anime
+        for anime in stored
+        for key in EXTERNAL_IDS
+        if getattr(anime, key) is not None
+    }
+    by_name = {anime.name: anime for anime in stored}
+
+    accepted: list[tuple[int, dict[str, Any], AnimeModel | None]] = []
+    seen_keys: set[tuple[str, int]] = set()
+    seen_names: set[str] = set()
+    for index, data in items:
+        keys = {(key, data[key]) for key in EXTERNAL_IDS if data.get(key) is not None}
+        if not keys:
+            fail(index, f"One of {', '.join(EXTERNAL_IDS)} is required")
+            continue
+        if keys & seen_keys:
+            fail(index, "External id is repeated in the batch")
+            continue
+
+        matches = {by_key[key].pk: by_key[key] for key in keys if key in by_key}
+        if len(matches) > 1:
+            fail(index, "External ids belong to different anime")
+            continue
+        instance = next(iter(matches.values()), None)
+
+        errors = [
+            f"Unknown {field}: {sorted(missing)}"
+            for field, model in RELATIONS.items()
+            if (missing := set(data.get(field) or []) - known.get(model, set()))
+        ]
+        if instance is not None and instance.is_locked:
+            errors.append("Anime is locked")
+        name = data.get("name") or (instance.name if instance else None)
+        if not name:
+            errors.append("`name` is required to create an anime")
+        elif name in seen_names:
+            errors.append("`name` is repeated in the batch")
+        elif name in by_name and by_name[name] is not instance:
+            errors.append(f"`name` belongs to anime {by_name[name].pk}")
+        if errors:
+            fail(index, *errors)
+            continue
+
+        seen_keys |= keys
+        seen_names.add(name)
+        accepted.append((index, data, instance))
+
+    created, changed, update_fields = [], set(), set()
+    for _, data, instance in accepted:
+        values = {field: data[field] for field in FIELDS if field in data}
+        if instance is None:
+            created.append(AnimeModel(**values))
+            continue
+        for field, value in values.items():
+            if getattr(instance, field) != value:
+                setattr(instance, field, value)
+                update_fields.add(field)
+                changed.add(instance.pk)
+
+    AnimeModel.objects.bulk_create(created)
+    if changed:
+        AnimeModel.objects.bulk_update(
+            [
+                instance
+                for _, _, instance in accepted
+                if instance and instance.pk in changed
+            ],
+            sorted(update_fields),
+        )
+
+    # `accepted` instances of new anime are the ones `bulk_create` assigned pks to
+    created_iter = iter(created)
+    anime_pks = [(instance or next(created_iter)).pk for _, _, instance in accepted]
+
+    synonyms = _resolve_synonyms([(index, data) for index, data, _ in accepted])
+    for field in [*RELATIONS, "name_synonyms"]:
+        targets = {
+            anime_pk: (
+                {synonyms[name] for name in data[field]}
+                if field == "name_synonyms"
+                else set(data[field])
+            )
+            for anime_pk, (_, data, _) in zip(anime_pks, accepted)
+            if data.get(field) is not None
+        }
+        if targets:
+            changed |= _sync_through(field, targets)
+
+    created_pks = {anime.pk for anime in created}
+    changed -= created_pks
+    if changed:
+        # `bulk_update` and through rows bypass `auto_now`
+        AnimeModel.objects.filter(pk__in=changed).update(updated_at=timezone.now())
+    if touched := created_pks | changed:
+        AnimeModel.objects.filter(pk__in=touched).refresh_search_document()
+
+    result["created"] = len(created_pks)
+    result["updated"] = len(changed)
+    result["unchanged"] = len(accepted) - len(touched)
+
+    transaction.on_commit(
+        lambda: anime_bulk_ingested.send(
+            sender=AnimeModel, created=created_pks, updated=changed
+        )
+    )
+    return result
+
+
+def ingest_anime(items: list[tuple[int, dict[str, Any]]]) -> IngestionResult:
+    """
+    Upsert a batch of anime in one transaction.
+
+    `items` are `(index, data)` pairs, `data` holds `FIELDS`, related pks under
+    the `RELATIONS` keys and names under `name_synonyms`.
+    Existing anime are matched on `EXTERNAL_IDS`, only the keys present in `data`
+    are written and a relation that is present replaces the stored one.
+    Items that can not be written are reported by index, the rest of the batch is.
+    """
+    try:
+        with transaction.atomic():
+            return _ingest(items)
+    except IntegrityError as e:
+        # Raced with another writer, nothing of the batch was written
+        return IngestionResult(
+            created=0,
+            updated=0,
+            unchanged=0,
+            errors=[IngestionError(index=index, errors=[str(e)]) for index, _ in items],
+        )
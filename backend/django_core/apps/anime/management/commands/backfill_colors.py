@@ -0,0 +1,112 @@
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import Any
+
+from apps.anime.ingestion import anime_bulk_ingested
+from apps.anime.models import AnimeModel
+from apps.anime.tasks import COLOR_FIELDS
+import django
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from utilities.dominant_color import dominant_color
+
+
+def _field_color(job: tuple[int, str, str]) -> tuple[int, str, str | None]:
+    """Runs in a worker process, only reads the image."""
+    pk, field, name = job
+    try:
+        with default_storage.open(name, "rb") as file:
+            return pk, field, dominant_color(file)
+    except (OSError, ValueError):
+        # Missing or unreadable image, the color stays empty
+        return pk, field, None
+
+
+class Command(BaseCommand):
+    help = "Compute the missing banner and cover colors of every anime"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Processes decoding images",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Colors written per statement",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recompute colors that are already set",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        jobs = list(self.jobs(options["force"]))
+        self.stdout.write(f"Computing {len(jobs)} colors")
+
+        # Forked workers must not share the connections of this process
+        connections.close_all()
+        colors: dict[int, dict[str, str]] = {}
+        written = failed = 0
+        with ProcessPoolExecutor(options["workers"], initializer=django.setup) as pool:
+            for pk, field, color in pool.map(_field_color, jobs, chunksize=16):
+                if color is None:
+                    failed += 1
+                    continue
+                colors.setdefault(pk, {})[field] = color
+                if len(colors) >= options["batch_size"]:
+                    written += self.write(colors)
+                    colors = {}
+        written += self.write(colors)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated {written} anime, {failed} images unreadable")
+        )
+
+    def jobs(self, force: bool) -> Iterator[tuple[int, str, str]]:
+        query = Q()
+        for field, source in COLOR_FIELDS.items():
+            missing = ~Q(**{source: ""}) & ~Q(**{f"{source}__isnull": True})
+            if not force:
+                missing &= Q(**{field: None}) | Q(**{field: ""})
+            query |= missing
+
+        for row in (
+            AnimeModel.objects.filter(query)
+            .values("pk", *COLOR_FIELDS, *COLOR_FIELDS.values())
+            .iterator(chunk_size=2000)
+        ):
+            for field, source in COLOR_FIELDS.items():
+                if row[source] and (force or not row[field]):
+                    yield row["pk"], field, row[source]
+
+    def write(self, colors: dict[int, dict[str, str]]) -> int:
+        if not colors:
+            return 0
+        # Anime deleted in the meantime are left out
+        instances = AnimeModel.objects.in_bulk(colors)
+        now = timezone.now()
+        for pk, instance in instances.items():
+            for field, color in colors[pk].items():
+                setattr(instance, field, color)
+            instance.updated_at = now
+
+        with transaction.atomic():
+            # `bulk_update` bypasses `post_save`, caches are expired through the signal
+            AnimeModel.objects.bulk_update(
+                instances.values(), [*COLOR_FIELDS, "updated_at"]
+            )
+            transaction.on_commit(
+                lambda: anime_bulk_ingested.send(
+                    sender=AnimeModel, created=set(), updated=set(instances)
+                )
+            )
+        return len(instances)
@@ -0,0 +1,30 @@
+from typing import Any
+
+from apps.anime.models import AnimeModel
+from django.core.management.base import BaseCommand, CommandParser
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored episode statistics of every anime"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Anime updated per statement",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size: int = options["batch_size"]
+        pks = list(AnimeModel.objects.order_by("pk").values_list("pk", flat=True))
+
+        updated = 0
+        # Ranges of primary keys keep every `UPDATE` and its row locks short
+        for start in range(0, len(pks), batch_size):
+            batch = pks[start : start + batch_size]
+            updated += AnimeModel.objects.filter(
+                pk__gte=batch[0], pk__lte=batch[-1]
+            ).refresh_episode_stats()
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} of {len(pks)} anime"))
@@ -0,0 +1,118 @@
+from typing import TYPE_CHECKING
+
+from apps.comments.models import CommentModel
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import models
+from django.db.models import (
+    Aggregate,
+    Avg,
+    BigIntegerField,
+    Count,
+    F,
+    Field,
+    Func,
+    IntegerField,
+    Max,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    TextField,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from .models import AnimeModel  # noqa: F401
+
+# Text search configuration of `search_vector`, queries have to use the same
+SEARCH_CONFIG = "english"
+
+
+class AnimeQuerySet(models.QuerySet["AnimeModel"]):
+    def with_api_data(self) -> "AnimeQuerySet":
+        """Prefetch everything `AnimeInfoGETSchema` reads."""
+        return self.prefetch_related(
+            "name_synonyms",
+            "openings",
+            "endings",
+            # Only primary keys are serialized for these
+            Prefetch("recommendations", queryset=self.model.objects.only("pk")),
+            Prefetch("comments", queryset=CommentModel.objects.only("pk")),
+        )
+
+    def refresh_episode_stats(self) -> int:
+        """
+        Recompute the episode columns of every anime in the queryset with a single `UPDATE`.
+
+        Only anime whose statistics changed are written, their `updated_at` is bumped
+        as the statistics are part of the anime response.
+        """
+        episodes = (
+            self.model.episodes.through.objects.filter(animemodel=OuterRef("pk"))
+            .order_by()
+            .values("animemodel")
+        )
+
+        def aggregate(function: Aggregate, output_field: Field) -> Coalesce:
+            # Anime without episodes have no row to aggregate
+            return Coalesce(
+                Cast(
+                    Subquery(episodes.annotate(value=function).values("value")),
+                    output_field,
+                ),
+                0,
+            )
+
+        stats = {
+            "episodes_count": aggregate(Count("*"), IntegerField()),
+            "average_episode_length": aggregate(
+                Avg("episodemodel__episode_length"), IntegerField()
+            ),
+            "latest_episode_number": aggregate(
+                Max("episodemodel__episode_number"), BigIntegerField()
+            ),
+        }
+        changed = Q()
+        for field in stats:
+            changed |= ~Q(**{field: F(f"new_{field}")})
+        return (
+            self.alias(**{f"new_{field}": value for field, value in stats.items()})
+            .filter(changed)
+            .update(**stats, updated_at=timezone.now())
+        )
+
+    def refresh_search_document(self) -> int:
+        """
+        Rebuild `search_document` and `search_vector` of every anime in the queryset
+        with a single `UPDATE`.
+
+        The vector weighs the names `A`, the synonyms `B`, the synopsis `C` and
+        the background `D`.
+        """
+        synonyms = (
+            self.model.name_synonyms.through.objects.filter(animemodel=OuterRef("pk"))
+            .order_by()
+            .values("animemodel")
+            .annotate(names=StringAgg("animenamesynonymmodel__name", delimiter=" "))
+            .values("names")
+        )
+        return self.update(
+            # `concat_ws` skips NULLs, anime without synonyms keep their names
+            search_document=Func(
+                Value(" "),
+                F("name"),
+                F("name_japanese"),
+                Subquery(synonyms),
+                function="CONCAT_WS",
+                output_field=TextField(),
+            ),
+            search_vector=(
+                SearchVector("name", "name_japanese", weight="A", config=SEARCH_CONFIG)
+                + SearchVector(Subquery(synonyms), weight="B", config=SEARCH_CONFIG)
+                + SearchVector("synopsis", weight="C", config=SEARCH_CONFIG)
+                + SearchVector("background", weight="D", config=SEARCH_CONFIG)
+            ),
+        )
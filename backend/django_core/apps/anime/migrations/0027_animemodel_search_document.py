@@ -0,0 +1,42 @@
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("anime", "0026_alter_animegenremodel_is_locked_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="animemodel",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunSQL(
+            sql="""
+            UPDATE anime_animemodel AS anime
+            SET search_document = CONCAT_WS(
+                ' ',
+                anime.name,
+                anime.name_japanese,
+                (
+                    SELECT STRING_AGG(synonym.name, ' ')
+                    FROM anime_animemodel_name_synonyms AS through
+                    JOIN anime_animenamesynonymmodel AS synonym
+                        ON synonym.id = through.animenamesynonymmodel_id
+                    WHERE through.animemodel_id = anime.id
+                )
+            )
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="animemodel",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="anime_search_document_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
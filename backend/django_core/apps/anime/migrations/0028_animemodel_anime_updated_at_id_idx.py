@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("anime", "0027_animemodel_search_document"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="animemodel",
+            index=models.Index(fields=["updated_at", "id"], name="anime_updated_at_id_idx"),
+        ),
+    ]
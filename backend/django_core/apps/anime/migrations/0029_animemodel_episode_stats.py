@@ -0,0 +1,47 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("anime", "0028_animemodel_anime_updated_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="animemodel",
+            name="average_episode_length",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="animemodel",
+            name="episodes_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="animemodel",
+            name="latest_episode_number",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(
+            sql="""
+            UPDATE anime_animemodel AS anime
+            SET episodes_count = stats.episodes_count,
+                average_episode_length = stats.average_episode_length,
+                latest_episode_number = stats.latest_episode_number
+            FROM (
+                SELECT
+                    through.animemodel_id,
+                    COUNT(*) AS episodes_count,
+                    COALESCE(AVG(episode.episode_length), 0)::integer
+                        AS average_episode_length,
+                    COALESCE(MAX(episode.episode_number), 0) AS latest_episode_number
+                FROM anime_animemodel_episodes AS through
+                JOIN episodes_episodemodel AS episode
+                    ON episode.id = through.episodemodel_id
+                GROUP BY through.animemodel_id
+            ) AS stats
+            WHERE stats.animemodel_id = anime.id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,58 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("anime", "0030_animemodel_image_derivatives"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="animemodel",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        # Same vector as `AnimeQuerySet.refresh_search_document`
+        migrations.RunSQL(
+            sql="""
+            UPDATE anime_animemodel AS anime
+            SET search_vector =
+                setweight(
+                    to_tsvector(
+                        'english',
+                        COALESCE(anime.name, '') || ' ' || COALESCE(anime.name_japanese, '')
+                    ),
+                    'A'
+                )
+                || setweight(
+                    to_tsvector(
+                        'english',
+                        COALESCE(
+                            (
+                                SELECT STRING_AGG(synonym.name, ' ')
+                                FROM anime_animemodel_name_synonyms AS through
+                                JOIN anime_animenamesynonymmodel AS synonym
+                                    ON synonym.id = through.animenamesynonymmodel_id
+                                WHERE through.animemodel_id = anime.id
+                            ),
+                            ''
+                        )
+                    ),
+                    'B'
+                )
+                || setweight(to_tsvector('english', COALESCE(anime.synopsis, '')), 'C')
+                || setweight(to_tsvector('english', COALESCE(anime.background, '')), 'D')
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="animemodel",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="anime_search_vector_idx"
+            ),
+        ),
+    ]
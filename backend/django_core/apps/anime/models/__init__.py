@@ -1,5 +1,6 @@
 from colorfield.fields import ColorField
 from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from dynamic_filenames import FilePattern
 from mixins.models.created_at import CreatedAtMixin
@@ -11,6 +12,7 @@ from ...comments.models import CommentModel
 from ...episodes.models import EpisodeModel
 from ...producers.models import ProducerModel
 from ...staffs.models import StaffModel
+from ..managers import AnimeQuerySet
 from .anime_genre import AnimeGenreModel
 from .anime_openings_and_endings import AnimeEndingModel, AnimeOpeningModel
 from .anime_theme import AnimeThemeModel
@@ -77,6 +79,8 @@ class AnimeModel(CreatedAtMixin, UpdatedAtMixin, IsLockedMixin):
     # Image field nearest color
     banner_background_color = ColorField(null=True, blank=True)
     cover_background_color = ColorField(null=True, blank=True)
+    # Resized copies of the images in modern formats, see `apps.api.images`
+    image_derivatives = models.JSONField(default=dict, blank=True, editable=False)
 
     synopsis = models.TextField(blank=True, null=True)
     background = models.TextField(blank=True, null=True)
@@ -95,12 +99,26 @@ class AnimeModel(CreatedAtMixin, UpdatedAtMixin, IsLockedMixin):
 
     recommendations = models.ManyToManyField("self", blank=True)
     episodes = models.ManyToManyField(EpisodeModel, blank=True)
+    # Statistics of `episodes`.
+    # Maintained by signals, see `AnimeQuerySet.refresh_episode_stats`
+    episodes_count = models.PositiveIntegerField(default=0, editable=False)
+    average_episode_length = models.PositiveIntegerField(default=0, editable=False)
+    latest_episode_number = models.BigIntegerField(default=0, editable=False)
 
     openings = models.ManyToManyField(AnimeOpeningModel, blank=True)
     endings = models.ManyToManyField(AnimeEndingModel, blank=True)
 
     comments = models.ManyToManyField(CommentModel, blank=True)
 
+    # Names, japanese name and synonyms joined together for fuzzy search.
+    # Maintained by signals, see `AnimeQuerySet.refresh_search_document`
+    search_document = models.TextField(default="", blank=True, editable=False)
+    # Weighted lexemes of the names, synonyms, synopsis and background for full-text search.
+    # Maintained along with `search_document`
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+
+    objects = AnimeQuerySet.as_manager()
+
     def __str__(self) -> str:
         return f"{self.name}"
 
@@ -111,5 +129,13 @@ class AnimeModel(CreatedAtMixin, UpdatedAtMixin, IsLockedMixin):
                 name="anime_name|name_japanese_idx",
                 opclasses=["gin_trgm_ops", "gin_trgm_ops"],
             ),
+            GinIndex(
+                fields=["search_document"],
+                name="anime_search_document_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(fields=["search_vector"], name="anime_search_vector_idx"),
+            # Keyset pagination, see `apps.api.pagination.CursorPagination`
+            models.Index(fields=["updated_at", "id"], name="anime_updated_at_id_idx"),
         ]
         verbose_name = "Anime"
@@ -1,34 +1,169 @@
-from typing import TypedDict, Unpack
+from functools import partial
+from typing import Any, TypedDict, Unpack
 
-from apps.anime.tasks import set_field_color
-from django.db.models.signals import post_save
+from apps.anime.tasks import (
+    COLOR_FIELDS,
+    FIELD_COLOR_LOCK_SECONDS,
+    field_color_key,
+    set_field_color,
+)
+from apps.api.cache import get_redis
+from apps.episodes.models import EpisodeModel
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
+from redis import RedisError
 
-from .models import AnimeModel
+from .models import AnimeModel, AnimeNameSynonymModel
 
 
 class DjangoInstance(TypedDict):
     instance: AnimeModel
 
 
+class DjangoSynonymInstance(TypedDict):
+    instance: AnimeNameSynonymModel
+    created: bool
+
+
+class DjangoEpisodeInstance(TypedDict):
+    instance: EpisodeModel
+    created: bool
+
+
+class DjangoEpisodeDeleted(TypedDict):
+    instance: EpisodeModel
+
+
+class DjangoM2MChanged(TypedDict):
+    instance: AnimeModel | AnimeNameSynonymModel | EpisodeModel
+    action: str
+    reverse: bool
+    pk_set: set[Any] | None
+
+
+def enqueue_field_color(pk: int, field: str) -> None:
+    """Queue `set_field_color`, unless the same color is already queued."""
+    # In Redis, the worker releases the key and saves of every process share it
+    try:
+        queued = not get_redis().set(
+            field_color_key(pk, field), 1, nx=True, ex=FIELD_COLOR_LOCK_SECONDS
+        )
+    except RedisError:
+        # Computing a color twice is harmless, missing it is not
+        queued = False
+    if not queued:
+        set_field_color.delay(pk, field, COLOR_FIELDS[field])
+
+
 @receiver(post_save, sender=AnimeModel)
 def banner_background_color_handler(
     **kwargs: Unpack[DjangoInstance],
 ) -> None:
     instance = kwargs["instance"]
 
-    # Set Background Banner Image Color
-    if (hasattr(instance, "banner")) and not instance.banner_background_color:
-        set_field_color.delay(
-            instance.pk,
-            "banner_background_color",
-            "banner",
-        )
+    # Set Background Banner / Cover Image Color
+    for field, source in COLOR_FIELDS.items():
+        if getattr(instance, source) and not getattr(instance, field):
+            # The worker reads the image, it has to be committed first
+            transaction.on_commit(partial(enqueue_field_color, instance.pk, field))
 
-    # Set Background Cover Image Color
-    if (hasattr(instance, "cover")) and not instance.cover_background_color:
-        set_field_color.delay(
-            instance.pk,
-            "cover_background_color",
-            "cover",
-        )
+
+@receiver(post_save, sender=AnimeModel)
+def search_document_handler(
+    **kwargs: Unpack[DjangoInstance],
+) -> None:
+    instance = kwargs["instance"]
+    AnimeModel.objects.filter(pk=instance.pk).refresh_search_document()
+
+
+@receiver(post_save, sender=AnimeNameSynonymModel)
+def synonym_search_document_handler(
+    **kwargs: Unpack[DjangoSynonymInstance],
+) -> None:
+    # A renamed synonym changes the document of every anime using it
+    if not kwargs["created"]:
+        AnimeModel.objects.filter(
+            name_synonyms=kwargs["instance"]
+        ).refresh_search_document()
+
+
+@receiver(m2m_changed, sender=AnimeModel.name_synonyms.through)
+def name_synonyms_search_document_handler(
+    **kwargs: Unpack[DjangoM2MChanged],
+) -> None:
+    instance, action = kwargs["instance"], kwargs["action"]
+
+    if not kwargs["reverse"]:
+        if action in ("post_add", "post_remove", "post_clear"):
+            AnimeModel.objects.filter(pk=instance.pk).refresh_search_document()
+        return
+
+    # Reverse side, `instance` is a synonym and `pk_set` holds anime
+    match action:
+        case "pre_clear":
+            # `pk_set` is not provided on clear, remember who is affected
+            instance._search_document_pks = list(  # type: ignore[union-attr]
+                AnimeModel.objects.filter(name_synonyms=instance).values_list(
+                    "pk", flat=True
+                )
+            )
+        case "post_clear":
+            pks = getattr(instance, "_search_document_pks", [])
+            AnimeModel.objects.filter(pk__in=pks).refresh_search_document()
+        case "post_add" | "post_remove":
+            AnimeModel.objects.filter(
+                pk__in=kwargs["pk_set"] or []
+            ).refresh_search_document()
+
+
+@receiver(m2m_changed, sender=AnimeModel.episodes.through)
+def episodes_stats_handler(
+    **kwargs: Unpack[DjangoM2MChanged],
+) -> None:
+    instance, action = kwargs["instance"], kwargs["action"]
+
+    if not kwargs["reverse"]:
+        if action in ("post_add", "post_remove", "post_clear"):
+            AnimeModel.objects.filter(pk=instance.pk).refresh_episode_stats()
+        return
+
+    # Reverse side, `instance` is an episode and `pk_set` holds anime
+    match action:
+        case "pre_clear":
+            instance._episode_stats_pks = list(  # type: ignore[union-attr]
+                AnimeModel.objects.filter(episodes=instance).values_list("pk", flat=True)
+            )
+        case "post_clear":
+            pks = getattr(instance, "_episode_stats_pks", [])
+            AnimeModel.objects.filter(pk__in=pks).refresh_episode_stats()
+        case "post_add" | "post_remove":
+            AnimeModel.objects.filter(pk__in=kwargs["pk_set"] or []).refresh_episode_stats()
+
+
+@receiver(post_save, sender=EpisodeModel)
+def episode_stats_handler(
+    **kwargs: Unpack[DjangoEpisodeInstance],
+) -> None:
+    # A new episode belongs to no anime yet, `episodes_stats_handler` picks it up
+    if not kwargs["created"]:
+        AnimeModel.objects.filter(episodes=kwargs["instance"]).refresh_episode_stats()
+
+
+@receiver(pre_delete, sender=EpisodeModel)
+def episode_delete_stats_handler(
+    **kwargs: Unpack[DjangoEpisodeDeleted],
+) -> None:
+    # Through rows are deleted without `m2m_changed`, remember who is affected
+    instance = kwargs["instance"]
+    instance._episode_stats_pks = list(  # type: ignore[attr-defined]
+        AnimeModel.objects.filter(episodes=instance).values_list("pk", flat=True)
+    )
+
+
+@receiver(post_delete, sender=EpisodeModel)
+def episode_deleted_stats_handler(
+    **kwargs: Unpack[DjangoEpisodeDeleted],
+) -> None:
+    pks = getattr(kwargs["instance"], "_episode_stats_pks", [])
+    AnimeModel.objects.filter(pk__in=pks).refresh_episode_stats()
@@ -0,0 +1,69 @@
+import logging
+
+from apps.api.cache import get_redis
+from apps.sync.pipeline import Source, SyncResult, run_sync
+from apps.sync.providers import mal
+from celery import shared_task
+from redis import RedisError
+from utilities.dominant_color import dominant_color
+
+from .models import AnimeModel
+from .models.anime_genre import AnimeGenreModel
+from .models.anime_theme import AnimeThemeModel
+
+logger = logging.getLogger(__name__)
+
+# Color field and the image field it is computed from
+COLOR_FIELDS = {
+    "banner_background_color": "banner",
+    "cover_background_color": "cover",
+}
+
+# A queued color blocks another enqueue of the same one for this long at most,
+# see `apps.anime.signals.enqueue_field_color`
+FIELD_COLOR_LOCK_SECONDS = 10 * 60
+
+
+def field_color_key(pk: int, field: str) -> str:
+    return f"anime:field_color:{pk}:{field}"
+
+
+@shared_task(ignore_result=True)
+def set_field_color(pk: int, field: str, source: str) -> None:
+    """Store the dominant color of the `source` image of an anime in `field`."""
+    try:
+        instance = AnimeModel.objects.filter(pk=pk).first()
+        if instance is None or getattr(instance, field) or not getattr(instance, source):
+            return
+        with getattr(instance, source).open("rb") as file:
+            setattr(instance, field, dominant_color(file))
+        # Saved like any edit, so the response cache lets go of the old value
+        instance.save(update_fields=[field, "updated_at"])
+    finally:
+        try:
+            get_redis().delete(field_color_key(pk, field))
+        except RedisError:
+            logger.warning("Could not release the %s of anime %s, it expires", field, pk)
+
+
+@shared_task()
+def get_periodic_anime_genres() -> dict[str, SyncResult]:
+    """Refresh genres and themes, both are only listed by MyAnimeList."""
+    return run_sync(
+        {
+            "genres": Source(
+                model=AnimeGenreModel,
+                provider="mal",
+                fetch=mal.genres,
+                creates=True,
+                overwrites=True,
+            ),
+            "themes": Source(
+                model=AnimeThemeModel,
+                provider="mal",
+                fetch=mal.themes,
+                creates=True,
+                overwrites=True,
+            ),
+        }
+    )
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.api"
+
+    def ready(self) -> None:
+        from .signals import connect_signals
+
+        connect_signals()
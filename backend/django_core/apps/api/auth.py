@@ -1,16 +1,227 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+import copy
+import hashlib
 import logging
+import pickle
+import threading
+import time
 from typing import Any
 
 from apps.user.models import CustomUser
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
 from django.http import HttpRequest
 from ninja.security import HttpBearer
+from redis import RedisError
 
+from .cache import METRICS_KEY, get_redis
 from .models import Token
 
 logger = logging.getLogger("django")
 
+AUTH_GENERATION_KEY = "api:auth:generation"
+
+# KEYS: generation, token, metrics | ARGV: process hits, process misses
+# Counters of the process tier are reported in batches along with its misses.
+# Returns the generation and the Redis entry
+AUTH_LOOKUP_SCRIPT = """
+redis.call('HINCRBY', KEYS[3], 'auth:process:hits', ARGV[1])
+redis.call('HINCRBY', KEYS[3], 'auth:process:misses', ARGV[2])
+local generation = redis.call('GET', KEYS[1]) or '0'
+local entry = redis.call('GET', KEYS[2])
+if entry then
+    redis.call('HINCRBY', KEYS[3], 'auth:redis:hits', 1)
+    return {generation, entry}
+end
+redis.call('HINCRBY', KEYS[3], 'auth:redis:misses', 1)
+return {generation}
+"""
+
+# KEYS: token, user, user invalidation | ARGV: generation, entry, timeout
+# Like `STORE_SCRIPT`, a user invalidated while it was loaded is not stored.
+# The user set holds every token key of the user, it outlives the newest of them
+AUTH_STORE_SCRIPT = """
+if tonumber(redis.call('GET', KEYS[3]) or '0') > tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+redis.call('SADD', KEYS[2], KEYS[1])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return 1
+"""
+
+# KEYS: generation, pairs of user and user invalidation... | ARGV: timeout
+AUTH_INVALIDATE_SCRIPT = """
+local generation = redis.call('INCR', KEYS[1])
+for index = 2, #KEYS, 2 do
+    for _, token in ipairs(redis.call('SMEMBERS', KEYS[index])) do
+        redis.call('DEL', token)
+    end
+    redis.call('DEL', KEYS[index])
+    redis.call('SET', KEYS[index + 1], generation, 'EX', ARGV[1])
+end
+"""
+
+
+def token_key(token: str) -> str:
+    # Tokens are never stored as they are
+    return f"api:auth:token:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def user_key(pk: Any) -> str:
+    # Set of the token keys of the user
+    return f"api:auth:user:{pk}"
+
+
+def user_invalidation_key(pk: Any) -> str:
+    # Generation of the last invalidation of the user
+    return f"api:auth:user:{pk}:invalidated"
+
+
+class ProcessCache:
+    """
+    Least recently used users of this process, keyed by token.
+
+    Entries are served without asking Redis for `AUTH_CACHE_PROCESS_SECONDS`,
+    the hits and misses are counted until they are reported.
+    """
+
+    def __init__(self) -> None:
+        self.entries: OrderedDict[str, tuple[float, CustomUser]] = OrderedDict()
+        self.hits = self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, token: str) -> CustomUser | None:
+        with self.lock:
+            entry = self.entries.get(token)
+            if entry is None or entry[0] <= time.monotonic():
+                self.entries.pop(token, None)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(token)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, token: str, user: CustomUser) -> None:
+        with self.lock:
+            expires_at = time.monotonic() + settings.AUTH_CACHE_PROCESS_SECONDS
+            self.entries[token] = (expires_at, user)
+            self.entries.move_to_end(token)
+            while len(self.entries) > settings.AUTH_CACHE_PROCESS_SIZE:
+                self.entries.popitem(last=False)
+
+    def discard_users(self, pks: Iterable[Any]) -> None:
+        pks = set(pks)
+        with self.lock:
+            for token in [t for t, (_, user) in self.entries.items() if user.pk in pks]:
+                del self.entries[token]
+
+    def take_counts(self) -> tuple[int, int]:
+        """Hits and misses since the last call."""
+        with self.lock:
+            counts = (self.hits, self.misses)
+            self.hits = self.misses = 0
+            return counts
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+process_cache = ProcessCache()
+
+
+def load_user(token: str) -> CustomUser | None:
+    try:
+        return (
+            Token.objects.select_related("user").get(token=token, user__is_active=True).user
+        )
+    except Token.DoesNotExist:
+        return None
+
+
+def resolve_token(token: str) -> CustomUser | None:
+    """
+    Active user of `token`, from this process, from Redis or from the database.
+
+    Entries of this process are served without a round trip to Redis, other
+    processes see an invalidation once their entries expire. Unknown tokens are
+    not cached.
+    """
+    if not settings.AUTH_CACHE_SECONDS:
+        return load_user(token)
+
+    if (user := process_cache.get(token)) is not None:
+        # Requests of other threads share the cached instance
+        return copy.copy(user)
+
+    key = token_key(token)
+    try:
+        redis = get_redis()
+        generation, *entry = redis.eval(
+            AUTH_LOOKUP_SCRIPT,
+            3,
+            AUTH_GENERATION_KEY,
+            key,
+            METRICS_KEY,
+            *process_cache.take_counts(),
+        )
+    except RedisError:
+        logger.warning("Auth cache is unavailable, loading the token from the database")
+        return load_user(token)
+
+    if entry:
+        user = pickle.loads(entry[0])
+    else:
+        user = load_user(token)
+        if user is None:
+            return None
+        try:
+            redis.eval(
+                AUTH_STORE_SCRIPT,
+                3,
+                key,
+                user_key(user.pk),
+                user_invalidation_key(user.pk),
+                generation,
+                pickle.dumps(user),
+                settings.AUTH_CACHE_SECONDS,
+            )
+        except RedisError:
+            logger.warning("Could not store the token in the auth cache")
+
+    process_cache.set(token, user)
+    return copy.copy(user)
+
+
+def invalidate_users(pks: Iterable[Any]) -> None:
+    """Forget the tokens of the users `pks` once the transaction commits."""
+    if not settings.AUTH_CACHE_SECONDS:
+        return
+    pks = sorted(set(pks))
+    keys = [key for pk in pks for key in (user_key(pk), user_invalidation_key(pk))]
+    if not keys:
+        return
+
+    def invalidate() -> None:
+        # Only the entries of this process, the others expire on their own
+        process_cache.discard_users(pks)
+        try:
+            get_redis().eval(
+                AUTH_INVALIDATE_SCRIPT,
+                len(keys) + 1,
+                AUTH_GENERATION_KEY,
+                *keys,
+                settings.AUTH_CACHE_SECONDS,
+            )
+        except RedisError:
+            # Entries stay valid until `AUTH_CACHE_SECONDS` runs out
+            logger.exception("Could not invalidate the auth cache of users %s", pks)
+
+    transaction.on_commit(invalidate)
+
 
 class AuthBearer(HttpBearer):
     def authenticate(
@@ -18,12 +229,7 @@ class AuthBearer(HttpBearer):
         request: HttpRequest,
         token: str,
     ) -> CustomUser | AnonymousUser:
-        try:
-            token_data = Token.objects.get(token=token)
-            return token_data.user
-
-        except Token.DoesNotExist:
-            return AnonymousUser
+        return resolve_token(token) or AnonymousUser
 
 
 class OptionalAuthBearer(AuthBearer):
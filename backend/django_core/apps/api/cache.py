@@ -0,0 +1,323 @@
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import secrets
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe, urlencode
+from ninja.operation import Operation
+from ninja.utils import contribute_operation_callback
+from redis import Redis, RedisError
+
+logger = logging.getLogger("django")
+
+# Tag prefix of every model whose instances appear in API responses,
+# `<prefix>:<pk>` names one instance and `<prefix>:*` every list of that model
+MODEL_TAGS = {
+    "anime.AnimeModel": "anime",
+    "anime.AnimeNameSynonymModel": "anime_synonym",
+    "anime.AnimeGenreModel": "genre",
+    "anime.AnimeThemeModel": "theme",
+    "anime.AnimeOpeningModel": "opening",
+    "anime.AnimeEndingModel": "ending",
+    "characters.CharacterModel": "character",
+    "producers.ProducerModel": "producer",
+    "staffs.StaffModel": "staff",
+    "staffs.StaffAlternateNameModel": "staff_alternate_name",
+    "episodes.EpisodeModel": "episode",
+}
+
+GENERATION_KEY = "api:cache:generation"
+METRICS_KEY = "api:cache:metrics"
+
+# Headers stored along with the body, the validators answer conditional hits
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+# KEYS: response, generation, metrics | ARGV: operation
+# Returns the cached entry, or the generation the response has to be stored against
+LOOKUP_SCRIPT = """
+local entry = redis.call('GET', KEYS[1])
+if entry then
+    redis.call('HINCRBY', KEYS[3], ARGV[1] .. ':hits', 1)
+    return {1, entry}
+end
+redis.call('HINCRBY', KEYS[3], ARGV[1] .. ':misses', 1)
+return {0, redis.call('GET', KEYS[2]) or '0'}
+"""
+
+# KEYS: response, pairs of tag set and tag invalidation... | ARGV: generation, entry, timeout
+# An invalidation of one of its tags that ran while the response was rendered
+# is newer than the generation of the lookup, the response may hold the old rows
+# and is not stored. Invalidations of other tags do not matter
+STORE_SCRIPT = """
+for index = 2, #KEYS, 2 do
+    if tonumber(redis.call('GET', KEYS[index + 1]) or '0') > tonumber(ARGV[1]) then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+for index = 2, #KEYS, 2 do
+    redis.call('SADD', KEYS[index], KEYS[1])
+    redis.call('EXPIRE', KEYS[index], ARGV[3])
+end
+return 1
+"""
+
+# KEYS: generation, pairs of tag set and tag invalidation... | ARGV: timeout
+# Every tag records the generation it was last invalidated at, for as long as
+# a response rendered before may still be stored
+INVALIDATE_SCRIPT = """
+local generation = redis.call('INCR', KEYS[1])
+local deleted = 0
+for index = 2, #KEYS, 2 do
+    local members = redis.call('SMEMBERS', KEYS[index])
+    for start = 1, #members, 1000 do
+        deleted = deleted + redis.call(
+            'DEL', unpack(members, start, math.min(start + 999, #members))
+        )
+    end
+    redis.call('DEL', KEYS[index])
+    redis.call('SET', KEYS[index + 1], generation, 'EX', ARGV[1])
+end
+return deleted
+"""
+
+
+@functools.cache
+def get_redis() -> Redis:
+    return Redis.from_url(
+        settings.API_CACHE_LOCATION,
+        socket_timeout=settings.API_CACHE_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.API_CACHE_SOCKET_TIMEOUT,
+    )
+
+
+# KEYS: lock | ARGV: token
+# A holder that outlived its timeout must not release the lock of the next one
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@contextlib.contextmanager
+def redis_lock(key: str, timeout: int) -> Iterator[bool]:
+    """
+    Hold `key` in Redis for `timeout` seconds at most, across every process.
+
+    Yields whether the lock was taken, only the holder releases it.
+    """
+    redis = get_redis()
+    token = secrets.token_hex(16)
+    acquired = bool(redis.set(key, token, nx=True, ex=timeout))
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            redis.eval(RELEASE_LOCK_SCRIPT, 1, key, token)
+
+
+def tag_key(tag: str) -> str:
+    return f"api:cache:tag:{tag}"
+
+
+def tag_keys(tags: Iterable[str]) -> list[str]:
+    """Set of the responses and generation of the last invalidation of every tag."""
+    return [
+        key
+        for tag in sorted(set(tags))
+        for key in (tag_key(tag), f"api:cache:invalidated:{tag}")
+    ]
+
+
+def response_key(request: HttpRequest) -> str:
+    # Parameter order must not split the cache
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    digest = hashlib.sha256(f"{request.path}?{query}".encode()).hexdigest()
+    return f"api:cache:response:{digest}"
+
+
+def instance_tags(instance: Any) -> list[str]:
+    """Tags of a saved or deleted instance, its own and the lists of its model."""
+    prefix = MODEL_TAGS[instance._meta.label]
+    return [f"{prefix}:{instance.pk}", f"{prefix}:*"]
+
+
+def invalidate_tags(tags: Iterable[str]) -> None:
+    """
+    Drop every response tagged with any of `tags` once the transaction commits.
+
+    Readers inside the transaction would otherwise refill the cache with rows
+    that are about to change.
+    """
+    if not settings.API_CACHE_SECONDS:
+        return
+    keys = tag_keys(tags)
+    if not keys:
+        return
+
+    def invalidate() -> None:
+        try:
+            get_redis().eval(
+                INVALIDATE_SCRIPT,
+                len(keys) + 1,
+                GENERATION_KEY,
+                *keys,
+                settings.API_CACHE_SECONDS,
+            )
+        except RedisError:
+            # Entries stay stale until `API_CACHE_SECONDS` runs out
+            logger.exception("Could not invalidate API cache tags %s", keys)
+
+    transaction.on_commit(invalidate)
+
+
+def contained_tags(prefix: str, body: bytes) -> list[str]:
+    """Tags of the objects serialized in a list, paginated or detail response."""
+    data = json.loads(body)
+    if isinstance(data, dict):
+        data = data.get("items", [data])
+    return [
+        f"{prefix}:{item['id']}" for item in data if isinstance(item, dict) and "id" in item
+    ]
+
+
+def cache_metrics() -> list[dict[str, Any]]:
+    """Hits, misses and hit rate of every cached operation since the last flush."""
+    counters = {
+        key.decode(): int(value) for key, value in get_redis().hgetall(METRICS_KEY).items()
+    }
+    metrics = []
+    for operation in sorted({key.rpartition(":")[0] for key in counters}):
+        hits = counters.get(f"{operation}:hits", 0)
+        misses = counters.get(f"{operation}:misses", 0)
+        metrics.append(
+            {
+                "operation": operation,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            }
+        )
+    return metrics
+
+
+TagType = str | Callable[..., Iterable[str]]
+
+
+def _cached_run(
+    operation: Operation,
+    tags: tuple[TagType, ...],
+    contains: str | None,
+) -> Callable[..., HttpResponseBase]:
+    run = operation.run
+    name = operation.view_func.__name__
+
+    @functools.wraps(run)
+    def wrapper(request: HttpRequest, **kwargs: Any) -> HttpResponseBase:
+        # Only anonymous reads are shared between clients
+        if (
+            not settings.API_CACHE_SECONDS
+            or request.method != "GET"
+            or "Authorization" in request.headers
+        ):
+            return run(request, **kwargs)
+
+        key = response_key(request)
+        try:
+            redis = get_redis()
+            hit, value = redis.eval(
+                LOOKUP_SCRIPT, 3, key, GENERATION_KEY, METRICS_KEY, name
+            )
+        except RedisError:
+            logger.warning("API cache is unavailable, serving %s uncached", request.path)
+            return run(request, **kwargs)
+
+        if hit:
+            headers, _, body = value.partition(b"\n")
+            response = HttpResponse(body)
+            for header, header_value in json.loads(headers).items():
+                response[header] = header_value
+            response["X-Cache"] = "HIT"
+            return get_conditional_response(
+                request,
+                etag=response.get("ETag"),
+                last_modified=parse_http_date_safe(response.get("Last-Modified", "")),
+                response=response,
+            )
+
+        response = run(request, **kwargs)
+        if response.status_code != 200 or not isinstance(response, HttpResponse):
+            return response
+
+        entry_tags = set()
+        for tag in tags:
+            if callable(tag):
+                entry_tags.update(tag(request, **kwargs))
+            else:
+                entry_tags.add(tag.format(**kwargs))
+        if contains:
+            entry_tags.update(contained_tags(contains, response.content))
+
+        headers = {
+            header: response[header] for header in STORED_HEADERS if header in response
+        }
+        entry = json.dumps(headers).encode() + b"\n" + response.content
+        keys = tag_keys(entry_tags)
+        try:
+            redis.eval(
+                STORE_SCRIPT,
+                len(keys) + 1,
+                key,
+                *keys,
+                value,
+                entry,
+                settings.API_CACHE_SECONDS,
+            )
+        except RedisError:
+            logger.warning("Could not store %s in the API cache", request.path)
+
+        response["X-Cache"] = "MISS"
+        return response
+
+    return wrapper
+
+
+def cache_response(
+    *tags: TagType,
+    contains: str | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Serve anonymous `GET` requests of an operation from Redis.
+
+    `tags` are formatted with the path parameters ( `"anime:{anime_id}"` ),
+    or are callables taking the request and path parameters.
+    `contains` names the tag prefix of the serialized objects,
+    every `id` in the response body is added as `<contains>:<id>`.
+    Responses are dropped as soon as one of their tags is invalidated,
+    see `apps.api.signals`.
+
+    Goes below `@router.get`, like `@paginate`.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        def callback(operation: Operation) -> None:
+            operation.run = _cached_run(operation, tags, contains)  # type: ignore[method-assign]
+
+        if hasattr(func, "_ninja_operation"):
+            callback(func._ninja_operation)
+        else:
+            contribute_operation_callback(func, callback)
+        return func
+
+    return decorator
@@ -0,0 +1,144 @@
+import datetime
+import functools
+import hashlib
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.db import models
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date, urlencode
+from ninja.operation import Operation
+from ninja.utils import contribute_operation_callback
+
+ValidatorType = Callable[..., datetime.datetime | None]
+
+
+class NotModified(Exception):
+    """Raised where the body would be built, carries the `304` ( or `412` )."""
+
+    def __init__(self, response: HttpResponse) -> None:
+        super().__init__(response.status_code)
+        self.response = response
+
+
+def make_etag(request: HttpRequest, *parts: Any) -> str:
+    # Weak, equal validators mean an equal payload and not equal bytes
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    digest = hashlib.sha1(repr((request.path, query, parts)).encode()).hexdigest()
+    return f"W/{quote_etag(digest)}"
+
+
+def set_validators(
+    request: HttpRequest,
+    etag: str,
+    last_modified: datetime.datetime | None,
+) -> None:
+    """
+    Attach the validators of the response to the request.
+
+    :raises NotModified: if the request preconditions already match them
+    """
+    headers = HttpResponse()
+    headers["ETag"] = etag
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    if timestamp is not None:
+        headers["Last-Modified"] = http_date(timestamp)
+    request.validators = headers  # type: ignore[attr-defined]
+
+    if request.method not in ("GET", "HEAD"):
+        return
+    response = get_conditional_response(
+        request, etag=etag, last_modified=timestamp, response=headers
+    )
+    if response is not headers:
+        raise NotModified(response)
+
+
+def set_page_validators(
+    request: HttpRequest,
+    rows: Iterable[tuple[Any, datetime.datetime]],
+    has_next: bool,
+) -> None:
+    """
+    Validators of a page of `(pk, updated_at)` rows.
+
+    Keys are part of the tag, so rows leaving the page change it
+    even when the newest `updated_at` stays the same.
+    """
+    rows = list(rows)
+    set_validators(
+        request,
+        make_etag(request, rows, has_next),
+        max((updated_at for _, updated_at in rows), default=None),
+    )
+
+
+def updated_at_of(model: type[models.Model], param: str) -> ValidatorType:
+    """Validator reading `updated_at` of the instance named by the path parameter `param`."""
+
+    def validator(request: HttpRequest, **kwargs: Any) -> datetime.datetime | None:
+        return (
+            model._default_manager.filter(pk=kwargs[param])
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+
+    return validator
+
+
+def _conditional_run(
+    operation: Operation,
+    validator: ValidatorType | None,
+) -> Callable[..., HttpResponseBase]:
+    run = operation.run
+
+    @functools.wraps(run)
+    def wrapper(request: HttpRequest, **kwargs: Any) -> HttpResponseBase:
+        if validator is not None and request.method in ("GET", "HEAD"):
+            # Missing instances fall through to the `404` of the view
+            if (last_modified := validator(request, **kwargs)) is not None:
+                try:
+                    set_validators(
+                        request, make_etag(request, last_modified), last_modified
+                    )
+                except NotModified as e:
+                    return e.response
+
+        response = run(request, **kwargs)
+        validators = getattr(request, "validators", None)
+        if validators is not None and response.status_code == 200:
+            for header in ("ETag", "Last-Modified"):
+                if header in validators:
+                    response[header] = validators[header]
+        return response
+
+    return wrapper
+
+
+def conditional_response(
+    validator: ValidatorType | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Answer `If-None-Match` / `If-Modified-Since` with a `304` before the body is built.
+
+    `validator` takes the request and path parameters and returns the `updated_at`
+    of the resource, it runs before the view.
+    Without it, the validators are set by the view itself, `CursorPagination` sets
+    them from the page it fetched.
+
+    Goes below `@cache_response`, cached entries keep their validators.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        def callback(operation: Operation) -> None:
+            operation.run = _conditional_run(operation, validator)  # type: ignore[method-assign]
+
+        if hasattr(func, "_ninja_operation"):
+            callback(func._ninja_operation)
+        else:
+            contribute_operation_callback(func, callback)
+        return func
+
+    return decorator
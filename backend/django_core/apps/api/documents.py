@@ -0,0 +1,76 @@
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from apps.anime.models import AnimeModel
+from django.db import transaction
+from django.db.models import F, TextField
+from django.db.models.functions import Cast
+from ninja.responses import NinjaJSONEncoder
+
+from .models import AnimeDocumentModel
+from .schemas.anime import AnimeInfoGETSchema
+
+# Bump whenever `AnimeInfoGETSchema` changes, stored documents are then rebuilt on read
+DOCUMENT_VERSION = 4
+
+
+def render_anime_document(anime: AnimeModel) -> dict[str, Any]:
+    """
+    `AnimeInfoGETSchema` of an anime from `AnimeModel.objects.with_api_data()`.
+
+    Encoded like the API renders it, so the stored document and a live
+    response are the same JSON.
+    """
+    data = AnimeInfoGETSchema.from_orm(anime).model_dump()
+    return json.loads(json.dumps(data, cls=NinjaJSONEncoder))
+
+
+def store_anime_documents(animes: Iterable[AnimeModel]) -> dict[int, dict[str, Any]]:
+    """Render and upsert the documents of `animes`, in one statement."""
+    animes = list(animes)
+    documents = {anime.pk: render_anime_document(anime) for anime in animes}
+    AnimeDocumentModel.objects.bulk_create(
+        [
+            AnimeDocumentModel(
+                anime=anime,
+                document=documents[anime.pk],
+                version=DOCUMENT_VERSION,
+                built_from=anime.updated_at,
+            )
+            for anime in animes
+        ],
+        update_conflicts=True,
+        unique_fields=["anime"],
+        update_fields=["document", "version", "built_from"],
+    )
+    return documents
+
+
+def get_anime_document(anime_id: int) -> str | None:
+    """
+    The stored document as JSON text, `None` when it is missing or stale.
+
+    A document rendered before the last write to the anime is stale,
+    even if the rebuild that replaces it has not run yet.
+    """
+    return (
+        AnimeDocumentModel.objects.filter(
+            anime_id=anime_id,
+            version=DOCUMENT_VERSION,
+            built_from=F("anime__updated_at"),
+        )
+        .annotate(text=Cast("document", TextField()))
+        .values_list("text", flat=True)
+        .first()
+    )
+
+
+def expire_anime_documents(pks: Iterable[int]) -> None:
+    """Drop the documents of `pks` now and rebuild them once the transaction commits."""
+    from .tasks import build_anime_documents
+
+    if not (pks := list(pks)):
+        return
+    AnimeDocumentModel.objects.filter(anime_id__in=pks).delete()
+    transaction.on_commit(lambda: build_anime_documents.delay(pks))
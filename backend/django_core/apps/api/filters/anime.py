@@ -11,6 +11,9 @@ class AnimeInfoFilters(Schema):
     #       * name_japanese
     #       * name_synonyms__name
     name: str | None = None
+    # Full-text search of the names, synonyms, synopsis and background,
+    # in the syntax of web search engines
+    q: str | None = None
 
     # Map as closely to model fields as possible.
     # So we can do something like
@@ -0,0 +1,107 @@
+import hashlib
+import io
+from typing import Any, TypedDict
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.db import models
+from PIL import Image, ImageOps
+
+# Image fields with derivatives, they are stored in the `image_derivatives` column
+# of the model keyed by field name
+IMAGE_FIELDS = {
+    "anime.AnimeModel": ("cover", "banner"),
+    "episodes.EpisodeModel": ("episode_thumbnail",),
+    "characters.CharacterModel": ("character_image",),
+    "staffs.StaffModel": ("staff_image",),
+    "user.CustomUser": ("avatar",),
+}
+
+# Widths derivatives are rendered at, never wider than the original
+WIDTHS = (320, 640, 1280)
+
+# Extension, Pillow format, MIME type and encoder options of every derivative format
+FORMATS = (
+    ("webp", "WEBP", "image/webp", {"quality": 80, "method": 4}),
+    ("avif", "AVIF", "image/avif", {"quality": 60, "speed": 6}),
+)
+
+
+class Derivatives(TypedDict):
+    # Name of the original the derivatives were rendered from
+    source: str
+    # MIME type to `{width: name}`
+    formats: dict[str, dict[str, str]]
+
+
+def available_formats() -> list[tuple[str, str, str, dict[str, Any]]]:
+    """`FORMATS` the installed Pillow can encode, AVIF needs libavif."""
+    Image.init()
+    return [entry for entry in FORMATS if entry[1] in Image.SAVE]
+
+
+def render_derivatives(storage: Storage, name: str) -> Derivatives:
+    """
+    Render every width and format of the image `name` next to it.
+
+    Names carry a hash of the original, so an unchanged image is never
+    rendered twice and a replaced one never reuses stale files.
+    """
+    with storage.open(name, "rb") as file:
+        data = file.read()
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    stem = name.rsplit(".", 1)[0]
+
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    derivatives = Derivatives(source=name, formats={})
+    for width in sorted({min(width, image.width) for width in WIDTHS}):
+        resized = image.copy()
+        resized.thumbnail((width, image.height), Image.Resampling.LANCZOS)
+        for extension, format, mime, options in available_formats():
+            target = f"{stem}.{digest}.{width}w.{extension}"
+            if not storage.exists(target):
+                buffer = io.BytesIO()
+                resized.save(buffer, format, **options)
+                target = storage.save(target, ContentFile(buffer.getvalue()))
+            derivatives["formats"].setdefault(mime, {})[str(width)] = target
+    return derivatives
+
+
+def delete_derivatives(storage: Storage, derivatives: Derivatives) -> None:
+    for names in derivatives["formats"].values():
+        for name in names.values():
+            storage.delete(name)
+
+
+def stale_fields(instance: models.Model) -> list[str]:
+    """Image fields of `instance` whose derivatives do not match the stored image."""
+    derivatives = instance.image_derivatives  # type: ignore[attr-defined]
+    return [
+        field
+        for field in IMAGE_FIELDS[instance._meta.label]
+        if (getattr(instance, field).name or None)
+        != (derivatives.get(field) or {}).get("source")
+    ]
+
+
+def srcset(instance: models.Model, field: str) -> dict[str, str]:
+    """
+    `srcset` of every derivative format of an image field, keyed by MIME type.
+
+    Empty until the derivatives of the current image are rendered,
+    clients fall back to the original.
+    """
+    file = getattr(instance, field)
+    derivatives = instance.image_derivatives.get(field)  # type: ignore[attr-defined]
+    if not file or not derivatives or derivatives["source"] != file.name:
+        return {}
+    return {
+        mime: ", ".join(
+            f"{file.storage.url(name)} {width}w"
+            for width, name in sorted(names.items(), key=lambda item: int(item[0]))
+        )
+        for mime, names in derivatives["formats"].items()
+    }
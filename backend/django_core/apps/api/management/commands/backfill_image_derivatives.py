@@ -0,0 +1,113 @@
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import Any
+
+from apps.anime.models import AnimeModel
+from apps.api.cache import invalidate_tags
+from apps.api.documents import expire_anime_documents
+from apps.api.images import (
+    IMAGE_FIELDS,
+    Derivatives,
+    delete_derivatives,
+    render_derivatives,
+    stale_fields,
+)
+from apps.api.signals import model_tags
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections, transaction
+from django.utils import timezone
+
+Job = tuple[str, Any, str, str]
+
+
+def _render(job: Job) -> tuple[Job, Derivatives]:
+    """Runs in a worker process, only touches the storage."""
+    label, _, field, name = job
+    storage = apps.get_model(label)._meta.get_field(field).storage
+    try:
+        return job, render_derivatives(storage, name)
+    except OSError:
+        # Recorded without formats, like `build_image_derivatives` does
+        return job, Derivatives(source=name, formats={})
+
+
+class Command(BaseCommand):
+    help = "Render the missing image derivatives of every model in `IMAGE_FIELDS`"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Processes rendering images",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Instances written per statement",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        jobs = list(self.jobs())
+        self.stdout.write(f"Rendering {len(jobs)} images")
+
+        # Forked workers must not share the connections of this process
+        connections.close_all()
+        pending: dict[str, dict[Any, dict[str, Derivatives]]] = defaultdict(dict)
+        written = 0
+        with ProcessPoolExecutor(options["workers"], initializer=django.setup) as pool:
+            for (label, pk, field, _), derivatives in pool.map(_render, jobs, chunksize=4):
+                pending[label].setdefault(pk, {})[field] = derivatives
+                if len(pending[label]) >= options["batch_size"]:
+                    written += self.write(label, pending.pop(label))
+        for label, rendered in pending.items():
+            written += self.write(label, rendered)
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {written} instances"))
+
+    def jobs(self) -> Iterator[Job]:
+        for label, fields in IMAGE_FIELDS.items():
+            model = apps.get_model(label)
+            for instance in (
+                model._default_manager.only("pk", "image_derivatives", *fields)
+                .order_by("pk")
+                .iterator(chunk_size=2000)
+            ):
+                for field in stale_fields(instance):
+                    if name := getattr(instance, field).name:
+                        yield label, instance.pk, field, name
+
+    def write(self, label: str, rendered: dict[Any, dict[str, Derivatives]]) -> int:
+        model = apps.get_model(label)
+        instances = model._default_manager.in_bulk(rendered)
+        fields = ["image_derivatives"]
+        if any(field.name == "updated_at" for field in model._meta.concrete_fields):
+            fields.append("updated_at")
+
+        now = timezone.now()
+        for pk, instance in instances.items():
+            derivatives = dict(instance.image_derivatives)
+            for field, entry in rendered[pk].items():
+                # The image was replaced while it rendered, the task renders the new one
+                if getattr(instance, field).name != entry["source"]:
+                    continue
+                previous = derivatives.get(field)
+                if previous and previous["source"] != entry["source"]:
+                    delete_derivatives(getattr(instance, field).storage, previous)
+                derivatives[field] = entry
+            instance.image_derivatives = derivatives
+            if "updated_at" in fields:
+                instance.updated_at = now
+
+        with transaction.atomic():
+            # `bulk_update` bypasses `post_save`, caches are expired here instead
+            model._default_manager.bulk_update(instances.values(), fields)
+            invalidate_tags(model_tags(model, instances))
+            if model is AnimeModel:
+                expire_anime_documents(instances)
+        return len(instances)
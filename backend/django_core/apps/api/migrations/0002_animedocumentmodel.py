@@ -0,0 +1,28 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('anime', '0028_animemodel_anime_updated_at_id_idx'),
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnimeDocumentModel',
+            fields=[
+                ('anime', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='document', serialize=False, to='anime.animemodel')),
+                ('document', models.JSONField()),
+                ('version', models.PositiveSmallIntegerField()),
+                ('built_from', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'anime document',
+                'verbose_name_plural': 'anime documents',
+            },
+        ),
+    ]
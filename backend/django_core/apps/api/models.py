@@ -1,5 +1,6 @@
 from functools import partial
 
+from apps.anime.models import AnimeModel
 from apps.user.models import CustomUser
 from django.db import models
 from django.utils.crypto import get_random_string
@@ -27,3 +28,30 @@ class Token(models.Model):
         ]
         verbose_name = _("token")
         verbose_name_plural = _("tokens")
+
+
+class AnimeDocumentModel(models.Model):
+    """
+    Rendered `AnimeInfoGETSchema` of an anime, served as is by the detail endpoint.
+
+    Maintained by `apps.api.documents`.
+    """
+
+    anime = models.OneToOneField(
+        AnimeModel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="document",
+    )
+    document = models.JSONField()
+    # Documents of another schema version are ignored and rebuilt
+    version = models.PositiveSmallIntegerField()
+    # `updated_at` of the anime when the document was rendered
+    built_from = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"Document of {self.anime_id} (v{self.version})"
+
+    class Meta:
+        verbose_name = _("anime document")
+        verbose_name_plural = _("anime documents")
@@ -0,0 +1,157 @@
+import datetime
+import decimal
+import json
+from typing import Any, Literal
+
+from django.core import signing
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import DecimalField, Expression, FloatField, Q, QuerySet
+from django.db.models.functions import Cast
+from django.http import HttpRequest
+from ninja import Field, Schema
+from ninja.conf import settings
+from ninja.errors import HttpError
+from ninja.pagination import PaginationBase
+
+from .conditional import set_page_validators
+
+# Orderings a client may ask for, `pk` is always appended as the tie breaker
+ORDERINGS = {
+    "pk": ["pk"],
+    "updated_at": ["updated_at", "pk"],
+}
+
+
+def exact_score(expression: Expression) -> Cast:
+    """
+    Similarity or rank to order a paginated queryset by.
+
+    Scores are `real`, a float does not round trip through the cursor and rows
+    tied on their score would be skipped or repeated. Ordered and compared as
+    `numeric`, the key of the last row is matched exactly.
+    """
+    return Cast(expression, DecimalField(max_digits=12, decimal_places=6))
+
+
+def estimate_count(queryset: QuerySet[Any]) -> int:
+    """Row estimate of the planner, avoids the `COUNT(*)` over a `DISTINCT` join."""
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CursorPagination(PaginationBase):
+    """
+    Keyset pagination over a stable ordering.
+
+    Views that order the queryset themselves (search similarity) keep their ordering,
+    `pk` is appended so every key is unique. Scores are wrapped in `exact_score`.
+    The cursor is a signed token holding the ordering and the key of the last row,
+    the next page is fetched with a `WHERE` on that key instead of an `OFFSET`.
+
+    Pages of models with `updated_at` carry an ETag and Last-Modified,
+    a conditional request is answered from the keys of the page alone.
+    """
+
+    class Input(Schema):
+        cursor: str | None = None
+        limit: int = Field(settings.PAGINATION_PER_PAGE, ge=1, le=100)
+        ordering: Literal["pk", "updated_at"] = "pk"
+        estimate_total: bool = False
+
+    class Output(Schema):
+        items: list[Any]
+        next: str | None
+        estimated_total: int | None = None
+
+    salt = "apps.api.pagination.cursor"
+
+    def _ordering(self, queryset: QuerySet[Any], ordering: str) -> list[str]:
+        keys = [str(key) for key in queryset.query.order_by] or ORDERINGS[ordering]
+        if keys[-1].lstrip("-") not in ("pk", "id"):
+            keys.append("pk")
+        for key in keys:
+            annotation = queryset.query.annotations.get(key.lstrip("-"))
+            if annotation is not None and isinstance(annotation.output_field, FloatField):
+                raise ImproperlyConfigured(
+                    f"Order by `exact_score()` instead of the float `{key}`"
+                )
+        return keys
+
+    def _encode(self, keys: list[str], instance: Any) -> str:
+        values = []
+        for key in keys:
+            value = getattr(instance, key.lstrip("-"))
+            if isinstance(value, datetime.datetime):
+                # Keep the microseconds, the key must round trip exactly
+                value = value.isoformat()
+            elif isinstance(value, decimal.Decimal):
+                value = str(value)
+            values.append(value)
+        return signing.dumps({"keys": keys, "values": values}, salt=self.salt)
+
+    def _decode(self, cursor: str, keys: list[str]) -> list[Any]:
+        try:
+            payload = signing.loads(cursor, salt=self.salt)
+        except signing.BadSignature:
+            raise HttpError(400, "Invalid cursor")
+        if payload["keys"] != keys:
+            raise HttpError(400, "Cursor does not match the requested ordering")
+        return payload["values"]
+
+    @staticmethod
+    def _has_updated_at(queryset: QuerySet[Any]) -> bool:
+        return any(field.name == "updated_at" for field in queryset.model._meta.fields)
+
+    @staticmethod
+    def _after(keys: list[str], values: list[Any]) -> Q:
+        """Rows strictly after `values` in the lexicographic order of `keys`."""
+        after = Q()
+        for index, key in enumerate(keys):
+            field = key.lstrip("-")
+            lookup = "lt" if key.startswith("-") else "gt"
+
+            step = Q(**{f"{field}__{lookup}": values[index]})
+            for previous_key, previous_value in zip(keys[:index], values[:index]):
+                step &= Q(**{previous_key.lstrip("-"): previous_value})
+            after |= step
+        return after
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet[Any],
+        pagination: Input,
+        **params: Any,
+    ) -> Any:
+        keys = self._ordering(queryset, pagination.ordering)
+        page = queryset.order_by(*keys)
+        if pagination.cursor:
+            page = page.filter(self._after(keys, self._decode(pagination.cursor, keys)))
+
+        request: HttpRequest = params["request"]
+        conditional = self._has_updated_at(queryset) and (
+            "If-None-Match" in request.headers or "If-Modified-Since" in request.headers
+        )
+        if conditional:
+            # Raises `NotModified` before the rows are fetched and serialized
+            rows = list(page.values_list("pk", "updated_at")[: pagination.limit + 1])
+            set_page_validators(
+                request, rows[: pagination.limit], len(rows) > pagination.limit
+            )
+
+        # One extra row tells whether there is a next page
+        items = list(page[: pagination.limit + 1])
+        has_next = len(items) > pagination.limit
+        items = items[: pagination.limit]
+
+        if self._has_updated_at(queryset) and not conditional:
+            set_page_validators(
+                request, [(item.pk, item.updated_at) for item in items], has_next
+            )
+
+        return {
+            "items": items,
+            "next": self._encode(keys, items[-1]) if has_next else None,
+            "estimated_total": estimate_count(queryset)
+            if pagination.estimate_total
+            else None,
+        }
@@ -1,5 +1,5 @@
 from apps.anime.models import AnimeModel, AnimeNameSynonymModel
-from django.db.models import Avg
+from apps.api.images import srcset
 from django.shortcuts import resolve_url
 from ninja import ModelSchema
 
@@ -35,27 +35,26 @@ class AnimeInfoGETSchema(ModelSchema):
     characters: str
     themes: str
     episodes: str
-    episodes_count: int
-    average_episode_length: int
+    cover_srcset: dict[str, str]
+    banner_srcset: dict[str, str]
     name_synonyms: list[AnimeNameSynonymSchema] = []
     openings: list[AnimeOpeningAndEndingGETSchema] = []
     endings: list[AnimeOpeningAndEndingGETSchema] = []
+    # Matching excerpt of the synopsis, only set by the `q` filter of the list
+    headline: str | None = None
 
     class Config:
         model = AnimeModel
-        model_fields = "__all__"
+        # Internal, denormalized for search and rendered images
+        model_exclude = ["search_document", "search_vector", "image_derivatives"]
 
     @staticmethod
-    def resolve_average_episode_length(obj: AnimeModel) -> int:
-        if instance := obj.episodes.all():
-            avg = instance.aggregate(value=Avg("episode_length"))
-            return avg["value"]
-        else:
-            return 0
+    def resolve_cover_srcset(obj: AnimeModel) -> dict[str, str]:
+        return srcset(obj, "cover")
 
     @staticmethod
-    def resolve_episodes_count(obj: AnimeModel) -> int:
-        return obj.episodes.count()
+    def resolve_banner_srcset(obj: AnimeModel) -> dict[str, str]:
+        return srcset(obj, "banner")
 
     @staticmethod
     def resolve_staffs(obj: AnimeModel) -> str:
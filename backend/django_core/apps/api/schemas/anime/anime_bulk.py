@@ -0,0 +1,39 @@
+import datetime
+from typing import Annotated
+
+from ninja import Field, Schema
+
+
+class AnimeBulkItemSchema(Schema):
+    mal_id: int | None = None
+    anilist_id: int | None = None
+    kitsu_id: int | None = None
+    # Unset on updates keeps the stored name, `null` is rejected
+    name: str = Field(None, max_length=1024)
+    name_japanese: str = Field("", max_length=1024)
+    name_synonyms: list[Annotated[str, Field(max_length=100)]] | None = None
+    source: str | None = Field(None, max_length=128)
+    aired_from: datetime.datetime | None = None
+    aired_to: datetime.datetime | None = None
+    synopsis: str | None = None
+    background: str | None = None
+    rating: str = Field("", max_length=50)
+    # Primary keys, a list replaces the stored relation
+    genres: list[int] | None = None
+    themes: list[int] | None = None
+    studios: list[int] | None = None
+    producers: list[int] | None = None
+    characters: list[int] | None = None
+    staffs: list[int] | None = None
+
+
+class AnimeBulkErrorSchema(Schema):
+    index: int
+    errors: list[str]
+
+
+class AnimeBulkResultSchema(Schema):
+    created: int
+    updated: int
+    unchanged: int
+    errors: list[AnimeBulkErrorSchema]
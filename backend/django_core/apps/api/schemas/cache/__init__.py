@@ -0,0 +1,8 @@
+from ninja import Schema
+
+
+class CacheMetricsSchema(Schema):
+    operation: str
+    hits: int
+    misses: int
+    hit_rate: float
@@ -1,12 +1,19 @@
 from ninja import ModelSchema
 
 from ....characters.models import CharacterModel
+from ...images import srcset
 
 
 class CharacterGETSchema(ModelSchema):
+    character_image_srcset: dict[str, str]
+
     class Config:
         model = CharacterModel
-        model_fields = "__all__"
+        model_exclude = ["image_derivatives"]
+
+    @staticmethod
+    def resolve_character_image_srcset(obj: CharacterModel) -> dict[str, str]:
+        return srcset(obj, "character_image")
 
 
 class CharacterPOSTSchema(ModelSchema):
@@ -17,4 +24,5 @@ class CharacterPOSTSchema(ModelSchema):
             "created_at",
             "updated_at",
             "is_locked",
+            "image_derivatives",
         ]
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Literal
+
+from ninja import Field, Schema
+
+
+class CommentVotePOSTSchema(Schema):
+    # `1` upvotes, `-1` downvotes and `0` takes the vote back
+    vote: Literal[-1, 0, 1]
+
+
+class CommentVoteSchema(Schema):
+    id: int
+    vote: int
+    upvote_count: int
+    downvote_count: int
+    score: int
+
+
+class CommentThreadQuerySchema(Schema):
+    cursor: str | None = None
+    # Comments of the first level
+    limit: int = Field(20, ge=1, le=100)
+    # Replies per comment on every level below
+    replies: int = Field(3, ge=1, le=20)
+    # Levels of replies below the first one
+    depth: int = Field(2, ge=1, le=5)
+
+
+class CommentThreadItemSchema(Schema):
+    id: int
+    # Hidden along with the text of deleted comments
+    user: str | None
+    text: str
+    created_at: datetime
+    upvote_count: int
+    downvote_count: int
+    score: int
+    deleted: bool
+    reply_count: int
+    replies: list["CommentThreadItemSchema"]
+    # Cursor of `/comments/{id}/replies` loading the remaining replies
+    next: str | None
+
+
+class CommentThreadSchema(Schema):
+    items: list[CommentThreadItemSchema]
+    next: str | None
@@ -1,8 +1,15 @@
+from apps.api.images import srcset
 from apps.episodes.models import EpisodeModel
 from ninja import ModelSchema
 
 
 class EpisodeGETSchema(ModelSchema):
+    episode_thumbnail_srcset: dict[str, str]
+
     class Config:
         model = EpisodeModel
-        model_fields = "__all__"
+        model_exclude = ["image_derivatives"]
+
+    @staticmethod
+    def resolve_episode_thumbnail_srcset(obj: EpisodeModel) -> dict[str, str]:
+        return srcset(obj, "episode_thumbnail")
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from apps.episodes.models.episode_timestamp import EpisodeTimestampModel
 from ninja import Field, ModelSchema, Schema
 
@@ -17,4 +19,15 @@ class EpisodeTimestampGETSchema(ModelSchema):
 class EpisodeTimestampPOSTSchema(ModelSchema):
     class Config:
         model = EpisodeTimestampModel
-        model_exclude = ["episode", "id", "user", "created_at"]
+        model_exclude = ["episode", "id", "user", "created_at", "updated_at"]
+
+
+class WatchProgressPOSTSchema(Schema):
+    # Seconds into the episode
+    timestamp: int = Field(..., ge=0)
+
+
+class WatchProgressSchema(Schema):
+    episode_number: int
+    timestamp: int
+    updated_at: datetime
@@ -0,0 +1,36 @@
+from typing import Literal
+
+from ninja import Field, Schema
+
+SearchKind = Literal["anime", "character", "staff", "producer"]
+
+
+class SearchQuerySchema(Schema):
+    q: str = Field(..., min_length=2, max_length=100)
+    # Every kind by default
+    types: list[SearchKind] | None = None
+    # Results of every kind
+    limit: int = Field(5, ge=1, le=20)
+
+
+class SearchResultSchema(Schema):
+    id: int = Field(..., alias="object_id")
+    name: str
+    score: float
+
+
+class SearchResultsSchema(Schema):
+    anime: list[SearchResultSchema]
+    character: list[SearchResultSchema]
+    staff: list[SearchResultSchema]
+    producer: list[SearchResultSchema]
+
+
+class AutocompleteQuerySchema(Schema):
+    q: str = Field(..., min_length=1, max_length=100)
+    limit: int = Field(10, ge=1, le=20)
+
+
+class AutocompleteSchema(Schema):
+    id: int
+    name: str
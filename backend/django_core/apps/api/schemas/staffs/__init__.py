@@ -1,6 +1,7 @@
 from ninja import ModelSchema
 
 from ....staffs.models import StaffAlternateNameModel, StaffModel
+from ...images import srcset
 
 
 class StaffAlternateNameSchema(ModelSchema):
@@ -11,10 +12,15 @@ class StaffAlternateNameSchema(ModelSchema):
 
 class StaffGETSchema(ModelSchema):
     alternate_names: list[StaffAlternateNameSchema] = []
+    staff_image_srcset: dict[str, str]
 
     class Config:
         model = StaffModel
-        model_fields = "__all__"
+        model_exclude = ["image_derivatives"]
+
+    @staticmethod
+    def resolve_staff_image_srcset(obj: StaffModel) -> dict[str, str]:
+        return srcset(obj, "staff_image")
 
 
 class StaffPOSTSchema(ModelSchema):
@@ -27,4 +33,5 @@ class StaffPOSTSchema(ModelSchema):
             "created_at",
             "updated_at",
             "is_locked",
+            "image_derivatives",
         ]
@@ -1,9 +1,9 @@
-import datetime
-
 from ninja.schema import Schema
 
 
 class HistogramSchema(Schema):
-    year: datetime.datetime
-    month: datetime.datetime
+    year: int
+    month: int
     count: int
+    # Seconds watched of the counted episodes
+    watchtime: int
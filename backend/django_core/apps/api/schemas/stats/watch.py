@@ -0,0 +1,5 @@
+from ..episodes.episode_timestamp import EpisodeTimestampTotalTimestampSchema
+
+
+class WatchStatsSchema(EpisodeTimestampTotalTimestampSchema):
+    episodes_completed: int
@@ -1,3 +1,4 @@
+from apps.api.images import srcset
 from apps.user.models import CustomUser
 from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
@@ -6,12 +7,14 @@ from ninja import ModelSchema
 
 class UserSchema(ModelSchema):
     avatar: str
+    avatar_srcset: dict[str, str]
 
     class Config:
         model = get_user_model()
         model_exclude = [
             "password",
             "avatar",
+            "image_derivatives",
         ]
 
     @staticmethod
@@ -23,3 +26,7 @@ class UserSchema(ModelSchema):
             },
         )
         return f"{url}"
+
+    @staticmethod
+    def resolve_avatar_srcset(obj: CustomUser) -> dict[str, str]:
+        return srcset(obj, "avatar")
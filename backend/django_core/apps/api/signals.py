@@ -0,0 +1,275 @@
+from collections.abc import Iterable
+from functools import partial
+from typing import Any, TypedDict, Unpack
+
+from apps.anime.ingestion import anime_bulk_ingested
+from apps.anime.models import AnimeModel
+from apps.sync.pipeline import rows_synced
+from django.apps import apps
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.utils import timezone
+from redis import RedisError
+
+from .auth import invalidate_users
+from .cache import MODEL_TAGS, get_redis, instance_tags, invalidate_tags
+from .documents import expire_anime_documents
+from .images import IMAGE_FIELDS, stale_fields
+from .models import Token
+from .tasks import (
+    IMAGE_DERIVATIVES_LOCK_SECONDS,
+    build_image_derivatives,
+    image_derivatives_key,
+)
+
+# Models nested into the response of another model,
+# their changes go stale in every instance using them
+NESTED_FIELDS = {
+    "anime.AnimeNameSynonymModel": ("anime.AnimeModel", "name_synonyms"),
+    "anime.AnimeOpeningModel": ("anime.AnimeModel", "openings"),
+    "anime.AnimeEndingModel": ("anime.AnimeModel", "endings"),
+    # Episode statistics are stored on the anime, see `AnimeQuerySet.refresh_episode_stats`
+    "episodes.EpisodeModel": ("anime.AnimeModel", "episodes"),
+    "staffs.StaffAlternateNameModel": ("staffs.StaffModel", "alternate_names"),
+}
+
+# Fields of the user deciding whether, and with which rights, its tokens authenticate
+AUTH_FIELDS = ("is_active", "password", "is_staff", "is_superuser")
+
+
+class DjangoInstance(TypedDict):
+    instance: models.Model
+
+
+class DjangoSave(TypedDict):
+    instance: models.Model
+    update_fields: frozenset[str] | None
+
+
+class AnimeBulkIngested(TypedDict):
+    created: set[int]
+    updated: set[int]
+
+
+class RowsSynced(TypedDict):
+    created: set[int]
+    updated: set[int]
+
+
+class DjangoM2MChanged(TypedDict):
+    instance: models.Model
+    action: str
+    reverse: bool
+    model: type[models.Model]
+    pk_set: set[Any] | None
+
+
+def model_tags(model: type[models.Model], pks: Iterable[Any]) -> list[str]:
+    if (prefix := MODEL_TAGS.get(model._meta.label)) is None:
+        return []
+    return [f"{prefix}:{pk}" for pk in pks] + [f"{prefix}:*"]
+
+
+def parent_pks(instance: models.Model) -> tuple[type[models.Model], list[Any]] | None:
+    """Model and pks of the instances nesting `instance` into their response."""
+    if instance._meta.label not in NESTED_FIELDS:
+        return None
+    label, field = NESTED_FIELDS[instance._meta.label]
+    parent = apps.get_model(label)
+    return parent, list(
+        parent.objects.filter(**{field: instance}).values_list("pk", flat=True)
+    )
+
+
+def touch(model: type[models.Model], pks: Iterable[Any]) -> None:
+    """
+    Bump `updated_at` of the instances `pks`, their relations are part of their payload.
+
+    `updated_at` drives the ETag and Last-Modified of the responses.
+    """
+    if any(field.name == "updated_at" for field in model._meta.fields):
+        model.objects.filter(pk__in=list(pks)).update(updated_at=timezone.now())
+
+
+def instance_handler(**kwargs: Unpack[DjangoInstance]) -> None:
+    instance = kwargs["instance"]
+    parent = parent_pks(instance)
+    if parent is not None:
+        touch(*parent)
+
+    if isinstance(instance, AnimeModel):
+        expire_anime_documents([instance.pk])
+    elif parent is not None and parent[0] is AnimeModel:
+        expire_anime_documents(parent[1])
+
+    if not settings.API_CACHE_SECONDS:
+        return
+    invalidate_tags(instance_tags(instance) + (model_tags(*parent) if parent else []))
+
+
+def m2m_handler(field: models.ManyToManyField, **kwargs: Unpack[DjangoM2MChanged]) -> None:
+    instance, action = kwargs["instance"], kwargs["action"]
+
+    # `pk_set` is not provided on clear, remember what is on the other side
+    if action == "pre_clear":
+        if kwargs["reverse"]:
+            related = field.model.objects.filter(**{field.name: instance})
+        else:
+            related = getattr(instance, field.name).all()
+        instance._m2m_related_pks = list(related.values_list("pk", flat=True))  # type: ignore[attr-defined]
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if action == "post_clear":
+        pks = getattr(instance, "_m2m_related_pks", [])
+    else:
+        pks = kwargs["pk_set"] or []
+
+    # The relation is part of the payload of the model declaring it
+    owners = pks if kwargs["reverse"] else [instance.pk]
+    touch(field.model, owners)
+    if field.model is AnimeModel:
+        expire_anime_documents(owners)
+
+    if not settings.API_CACHE_SECONDS:
+        return
+    # Both sides changed, along with every list that can be filtered by the relation
+    parent = parent_pks(instance)
+    invalidate_tags(
+        model_tags(type(instance), [instance.pk])
+        + (model_tags(*parent) if parent else [])
+        + model_tags(kwargs["model"], pks)
+    )
+
+
+def bulk_ingested_handler(**kwargs: Unpack[AnimeBulkIngested]) -> None:
+    pks = kwargs["created"] | kwargs["updated"]
+    expire_anime_documents(pks)
+    invalidate_tags(model_tags(AnimeModel, pks))
+
+
+def rows_synced_handler(sender: type[models.Model], **kwargs: Unpack[RowsSynced]) -> None:
+    invalidate_tags(model_tags(sender, kwargs["created"] | kwargs["updated"]))
+
+
+def user_pre_save_handler(**kwargs: Unpack[DjangoSave]) -> None:
+    instance = kwargs["instance"]
+    update_fields = kwargs["update_fields"]
+    # Logins only save `last_login`, they keep the cached users
+    if instance._state.adding or (
+        update_fields is not None and not set(update_fields) & set(AUTH_FIELDS)
+    ):
+        instance._auth_changed = False  # type: ignore[attr-defined]
+        return
+    stored = type(instance).objects.filter(pk=instance.pk).values_list(*AUTH_FIELDS).first()
+    instance._auth_changed = stored != tuple(  # type: ignore[attr-defined]
+        getattr(instance, field) for field in AUTH_FIELDS
+    )
+
+
+def user_handler(**kwargs: Unpack[DjangoInstance]) -> None:
+    # Deactivations and permission changes apply to tokens in use right away
+    instance = kwargs["instance"]
+    if getattr(instance, "_auth_changed", True):
+        invalidate_users([instance.pk])
+
+
+def user_m2m_handler(
+    field: models.ManyToManyField, **kwargs: Unpack[DjangoM2MChanged]
+) -> None:
+    instance, action = kwargs["instance"], kwargs["action"]
+    if not kwargs["reverse"]:
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate_users([instance.pk])
+        return
+
+    # Every user of the group or permission, `pk_set` is not provided on clear
+    if action == "pre_clear":
+        related = field.model.objects.filter(**{field.name: instance})
+        instance._m2m_related_pks = list(related.values_list("pk", flat=True))  # type: ignore[attr-defined]
+    elif action == "post_clear":
+        invalidate_users(getattr(instance, "_m2m_related_pks", []))
+    elif action in ("post_add", "post_remove"):
+        invalidate_users(kwargs["pk_set"] or [])
+
+
+def token_handler(**kwargs: Unpack[DjangoInstance]) -> None:
+    invalidate_users([kwargs["instance"].user_id])  # type: ignore[attr-defined]
+
+
+def enqueue_image_derivatives(label: str, pk: Any) -> None:
+    """Queue `build_image_derivatives`, unless it is already queued for the instance."""
+    # In Redis, the worker releases the key and uploads of every process share it
+    key = image_derivatives_key(label, pk)
+    try:
+        queued = not get_redis().set(key, 1, nx=True, ex=IMAGE_DERIVATIVES_LOCK_SECONDS)
+    except RedisError:
+        # Rendering twice is harmless, missing a render is not
+        queued = False
+    if not queued:
+        build_image_derivatives.delay(label, pk)
+
+
+def image_handler(**kwargs: Unpack[DjangoInstance]) -> None:
+    instance = kwargs["instance"]
+    if stale_fields(instance):
+        # The worker reads the upload, it has to be committed first
+        transaction.on_commit(
+            partial(enqueue_image_derivatives, instance._meta.label, instance.pk)
+        )
+
+
+def connect_signals() -> None:
+    for label in MODEL_TAGS:
+        model = apps.get_model(label)
+        post_save.connect(
+            instance_handler, sender=model, dispatch_uid=f"api_cache_save_{label}"
+        )
+        # Before the delete, the relations to the anime are still there
+        pre_delete.connect(
+            instance_handler, sender=model, dispatch_uid=f"api_cache_delete_{label}"
+        )
+
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                partial(m2m_handler, field),
+                sender=field.remote_field.through,
+                weak=False,
+                dispatch_uid=f"api_m2m_{label}_{field.name}",
+            )
+
+    anime_bulk_ingested.connect(bulk_ingested_handler, dispatch_uid="api_bulk_ingested")
+    rows_synced.connect(rows_synced_handler, dispatch_uid="api_rows_synced")
+
+    user = apps.get_model(settings.AUTH_USER_MODEL)
+    pre_save.connect(
+        user_pre_save_handler, sender=user, dispatch_uid="api_auth_user_pre_save"
+    )
+    post_save.connect(user_handler, sender=user, dispatch_uid="api_auth_user_save")
+    # Permissions are granted directly or through groups
+    for name in ("groups", "user_permissions"):
+        field = user._meta.get_field(name)
+        m2m_changed.connect(
+            partial(user_m2m_handler, field),
+            sender=field.remote_field.through,
+            weak=False,
+            dispatch_uid=f"api_auth_user_{name}",
+        )
+    post_delete.connect(user_handler, sender=user, dispatch_uid="api_auth_user_delete")
+    # Logging out deletes the token
+    post_delete.connect(token_handler, sender=Token, dispatch_uid="api_auth_token_delete")
+
+    for label in IMAGE_FIELDS:
+        post_save.connect(
+            image_handler,
+            sender=apps.get_model(label),
+            dispatch_uid=f"api_image_derivatives_{label}",
+        )
@@ -0,0 +1,63 @@
+import logging
+from typing import Any
+
+from apps.anime.models import AnimeModel
+from celery import shared_task
+from django.apps import apps
+from redis import RedisError
+
+from .cache import get_redis
+from .documents import store_anime_documents
+from .images import delete_derivatives, render_derivatives, stale_fields
+
+logger = logging.getLogger(__name__)
+
+# A queued render blocks another enqueue for the same instance this long at most,
+# see `apps.api.signals.enqueue_image_derivatives`
+IMAGE_DERIVATIVES_LOCK_SECONDS = 30 * 60
+
+
+def image_derivatives_key(label: str, pk: Any) -> str:
+    return f"api:image_derivatives:{label}:{pk}"
+
+
+@shared_task()
+def build_anime_documents(pks: list[int]) -> int:
+    """Rebuild the stored detail documents of the anime `pks`, deleted anime are skipped."""
+    animes = AnimeModel.objects.with_api_data().filter(pk__in=pks)
+    return len(store_anime_documents(animes))
+
+
+@shared_task(ignore_result=True)
+def build_image_derivatives(label: str, pk: Any) -> None:
+    """Render the derivatives of every image of an instance that changed since the last run."""
+    # Released before reading, an image uploaded from now on queues another run
+    try:
+        get_redis().delete(image_derivatives_key(label, pk))
+    except RedisError:
+        logger.warning("Could not release %s %s, it expires on its own", label, pk)
+    model = apps.get_model(label)
+    instance = model._default_manager.filter(pk=pk).first()
+    if instance is None or not (fields := stale_fields(instance)):
+        return
+
+    derivatives = dict(instance.image_derivatives)
+    for field in fields:
+        file = getattr(instance, field)
+        # Names are unique to the replaced image, nothing else uses its files
+        if previous := derivatives.pop(field, None):
+            delete_derivatives(file.storage, previous)
+        if not file:
+            continue
+        try:
+            derivatives[field] = render_derivatives(file.storage, file.name)
+        except OSError:
+            # Recorded without formats, so an unreadable image is not retried
+            logger.exception("Can not render derivatives of %s", file.name)
+            derivatives[field] = {"source": file.name, "formats": {}}
+
+    instance.image_derivatives = derivatives
+    update_fields = ["image_derivatives"]
+    if any(field.name == "updated_at" for field in model._meta.concrete_fields):
+        update_fields.append("updated_at")
+    instance.save(update_fields=update_fields)
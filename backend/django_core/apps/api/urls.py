@@ -1,12 +1,14 @@
 from django.utils.module_loading import import_string
 from ninja import NinjaAPI
 
+from .conditional import NotModified
 from .parser import CustomParser
 
 api = NinjaAPI(
     title="CoreProjectAPI",
     parser=CustomParser(),
 )
+api.add_exception_handler(NotModified, lambda request, exc: exc.response)
 
 # Router Configurations
 
@@ -96,6 +98,25 @@ anime_router.add_router(
     import_string("apps.api.views.anime.anime_endings.router"),
     tags=["anime_info"],
 )
+anime_router.add_router(
+    "",
+    import_string("apps.api.views.anime.bulk.router"),
+    tags=["anime_info"],
+)
+# Comments
+
+anime_router.add_router(
+    "",
+    import_string("apps.api.views.anime.comments.router"),
+    tags=["comments"],
+)
+# Watch progress
+
+anime_router.add_router(
+    "",
+    import_string("apps.api.views.anime.progress.router"),
+    tags=["progress"],
+)
 # Episodes
 
 anime_router.add_router(
@@ -138,6 +159,24 @@ api.add_router(
     tags=["staffs"],
 )
 
+# __ COMMENT ROUTER __
+
+from .views.comments import router as comment_router  # noqa
+
+api.add_router("/comments", comment_router, tags=["comments"])
+
+# __ SEARCH ROUTER __
+
+from .views.search import router as search_router  # noqa
+
+api.add_router("/search", search_router, tags=["search"])
+
+# __ CACHE ROUTER __
+
+from .views.cache import router as cache_router  # noqa
+
+api.add_router("/cache", cache_router, tags=["cache"])
+
 # __ USER ROUTER __
 
 from .views.user import router as user_router  # noqa
@@ -172,3 +211,10 @@ user_router.add_router(
     ),
     tags=["user"],
 )
+user_router.add_router(
+    "",
+    import_string(
+        "apps.api.views.user.stats.router",
+    ),
+    tags=["user"],
+)
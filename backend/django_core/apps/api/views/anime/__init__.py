@@ -1,20 +1,30 @@
 import datetime
+import json
 
+from apps.anime.managers import SEARCH_CONFIG
 from apps.anime.models import AnimeModel, AnimeNameSynonymModel
 from apps.anime.models.anime_genre import AnimeGenreModel
 from apps.anime.models.anime_theme import AnimeThemeModel
 from apps.api.auth import AuthBearer
+from apps.api.cache import cache_response
+from apps.api.conditional import conditional_response, updated_at_of
 from apps.api.http import HttpRequest
+from apps.api.pagination import CursorPagination, exact_score
 from apps.api.decorator import permission_required
+from apps.api.documents import get_anime_document, store_anime_documents
 from apps.api.filters.anime import AnimeInfoFilters
 from apps.api.permissions import IsSuperUser
 from apps.characters.models import CharacterModel
 from apps.producers.models import ProducerModel
 from apps.staffs.models import StaffModel
-from django.contrib.postgres.search import TrigramSimilarity
-from django.db.models import Q, QuerySet
-from django.db.models.functions import Greatest
-from django.http import Http404
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, Q, QuerySet
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
 from ninja import File, Form, Query, Router, UploadedFile
 from ninja.pagination import paginate
@@ -23,9 +33,28 @@ from ...schemas.anime import AnimeInfoGETSchema
 
 router = Router()
 
+# Filters of the list matching on the names of related models
+RELATED_FILTER_TAGS = {
+    "genres": "genre:*",
+    "themes": "theme:*",
+    "studios": "producer:*",
+    "producers": "producer:*",
+    "characters": "character:*",
+    "staffs": "staff:*",
+}
+
+
+def anime_list_tags(request: HttpRequest) -> list[str]:
+    """Any anime can enter a filtered list, renaming a related object can too."""
+    return ["anime:*"] + [
+        tag for param, tag in RELATED_FILTER_TAGS.items() if param in request.GET
+    ]
+
 
 @router.get("", response=list[AnimeInfoGETSchema])
-@paginate
+@cache_response(anime_list_tags)
+@conditional_response()
+@paginate(CursorPagination)
 def get_anime_info(
     request: HttpRequest,
     filters: AnimeInfoFilters = Query(...),
@@ -35,24 +64,36 @@ def get_anime_info(
     # 2 Step get query
     # There wont be a performance hit if we do all().filter()
     # https://docs.djangoproject.com/en/4.0/topics/db/queries/#retrieving-specific-objects-with-filters
-    query = AnimeModel.objects.all()
+    query = AnimeModel.objects.with_api_data()
 
     # We must pop this to filter other fields on the later stage
+    # `search_document` holds every name and synonym of an anime,
+    # the word similarity operator ( `%>` ) is backed by its trigram index
     if name := query_dict.pop("name", None):
         query = (
-            query.annotate(
-                similiarity=Greatest(
-                    TrigramSimilarity("name", name),
-                    TrigramSimilarity("name_japanese", name),
-                    TrigramSimilarity("name_synonyms__name", name),
-                )
-            )
-            .filter(
-                similiarity__gte=0.3,
+            query.filter(search_document__trigram_word_similar=name)
+            .annotate(
+                similiarity=exact_score(TrigramWordSimilarity(name, "search_document"))
             )
             .order_by("-similiarity")
         )
 
+    # `search_vector` holds the weighted lexemes of the names and the texts,
+    # the match operator ( `@@` ) is backed by its GIN index.
+    # The rank takes over the ordering, the headline is only rendered for the page
+    if q := query_dict.pop("q", None):
+        search = SearchQuery(q, search_type="websearch", config=SEARCH_CONFIG)
+        query = (
+            query.filter(search_vector=search)
+            .annotate(
+                rank=exact_score(SearchRank(F("search_vector"), search)),
+                headline=SearchHeadline(
+                    "synopsis", search, config=SEARCH_CONFIG, max_words=35, min_words=15
+                ),
+            )
+            .order_by("-rank")
+        )
+
     # Same here but with ids
     for id in [
         "mal_id",
@@ -103,7 +144,8 @@ def get_anime_info(
     if query_object:
         query = query.filter(query_object).distinct()
 
-    if not query:
+    # `exists()` asks for a single row, the page itself is fetched by the paginator
+    if not query.exists():
         raise Http404(
             "No {} matches the given query with {}".format(
                 query.model._meta.object_name,
@@ -226,16 +268,22 @@ def post_anime_info(
             staff_instance = StaffModel.objects.get(pk=staff)
             database.staffs.add(staff_instance)
 
-    return database
+    return AnimeModel.objects.with_api_data().get(pk=database.pk)
 
 
 @router.get("/{int:anime_id}", response=AnimeInfoGETSchema)
+@cache_response("anime:{anime_id}")
+@conditional_response(updated_at_of(AnimeModel, "anime_id"))
 def get_individual_anime_info(
     request: HttpRequest,
     anime_id: int,
-) -> AnimeModel:
-    query = get_object_or_404(AnimeModel, pk=anime_id)
-    return query
+) -> HttpResponse:
+    # The document is rebuilt by celery after every write,
+    # until then the response is rendered live and stored for the next request
+    if (document := get_anime_document(anime_id)) is None:
+        anime = get_object_or_404(AnimeModel.objects.with_api_data(), pk=anime_id)
+        document = json.dumps(store_anime_documents([anime])[anime.pk])
+    return HttpResponse(document, content_type="application/json; charset=utf-8")
 
 
 @router.patch("/{int:anime_id}", response=AnimeInfoGETSchema, auth=AuthBearer())
@@ -309,4 +357,4 @@ def patch_individual_anime_info(
             specific_field.set(value)
 
     instance.save()
-    return instance
+    return AnimeModel.objects.with_api_data().get(pk=instance.pk)
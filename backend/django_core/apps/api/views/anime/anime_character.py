@@ -1,5 +1,6 @@
 from apps.anime.models import AnimeModel
 from apps.api.auth import AuthBearer
+from apps.api.cache import cache_response
 from apps.api.decorator import permission_required
 from apps.api.permissions import IsSuperUser
 from apps.characters.models import CharacterModel
@@ -13,6 +14,7 @@ router = Router()
 
 
 @router.get("/{int:anime_id}/character", response=list[CharacterGETSchema])
+@cache_response("anime:{anime_id}", contains="character")
 def get_individual_anime_character_info(
     request: HttpRequest,
     anime_id: int,
@@ -1,4 +1,5 @@
 from apps.anime.models import AnimeModel
+from apps.api.cache import cache_response
 from apps.api.http import HttpRequest
 from django.shortcuts import get_list_or_404, get_object_or_404
 from ninja import Router
@@ -10,6 +11,7 @@ router = Router()
 
 
 @router.get("/{int:anime_id}/studios", response=list[ProducerGETSchema])
+@cache_response("anime:{anime_id}", contains="producer")
 def get_individual_anime_studio_info(
     request: HttpRequest,
     anime_id: int,
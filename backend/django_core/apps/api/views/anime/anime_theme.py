@@ -1,5 +1,6 @@
 from apps.anime.models import AnimeModel
 from apps.anime.models.anime_theme import AnimeThemeModel
+from apps.api.cache import cache_response
 from apps.api.http import HttpRequest
 from django.shortcuts import get_list_or_404, get_object_or_404
 from ninja import Router
@@ -10,6 +11,7 @@ router = Router()
 
 
 @router.get("/{int:anime_id}/themes", response=list[AnimeThemeGETSchema])
+@cache_response("anime:{anime_id}", contains="theme")
 def get_individual_anime_theme_info(
     request: HttpRequest,
     anime_id: int,
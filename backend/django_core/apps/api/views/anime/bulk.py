@@ -0,0 +1,112 @@
+import json
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Any
+
+from apps.anime.ingestion import IngestionResult, ingest_anime
+from apps.api.auth import AuthBearer
+from apps.api.decorator import permission_required
+from apps.api.http import HttpRequest
+from apps.api.permissions import IsSuperUser
+from ninja import Query, Router
+from ninja.errors import HttpError
+from pydantic import ValidationError
+
+from ...schemas.anime.anime_bulk import AnimeBulkItemSchema, AnimeBulkResultSchema
+
+router = Router()
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl")
+
+
+def _json_items(request: HttpRequest) -> Iterator[tuple[int, Any]]:
+    try:
+        items = json.loads(request.body)
+    except ValueError as e:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+    if not isinstance(items, list):
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Expected an array of anime")
+    yield from enumerate(items)
+
+
+def _ndjson_items(request: HttpRequest) -> Iterator[tuple[int, Any]]:
+    # Read line by line, a season does not have to fit in `DATA_UPLOAD_MAX_MEMORY_SIZE`
+    index = 0
+    for line in request:
+        if not line.strip():
+            continue
+        try:
+            yield index, json.loads(line)
+        except ValueError as e:
+            yield index, e
+        index += 1
+
+
+@router.post(
+    "/bulk",
+    response=AnimeBulkResultSchema,
+    auth=AuthBearer(),
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                content_type: {"schema": {"type": "array", "items": {}}}
+                for content_type in ("application/json", *NDJSON_CONTENT_TYPES)
+            },
+        }
+    },
+)
+@permission_required([IsSuperUser])
+def post_anime_bulk(
+    request: HttpRequest,
+    batch_size: int = Query(500, ge=1, le=5_000),
+) -> IngestionResult:
+    """
+    Create or update many anime, a JSON array or one JSON object per line (NDJSON).
+
+    Anime are matched on `mal_id`, `anilist_id` or `kitsu_id`.
+    Every batch of `batch_size` items is written in its own transaction,
+    items that fail are reported by their position and do not stop the rest.
+    """
+    content_type = request.content_type or "application/json"
+    items = (
+        _ndjson_items(request)
+        if content_type in NDJSON_CONTENT_TYPES
+        else _json_items(request)
+    )
+
+    result = IngestionResult(created=0, updated=0, unchanged=0, errors=[])
+    batch: list[tuple[int, dict[str, Any]]] = []
+
+    def flush() -> None:
+        batch_result = ingest_anime(batch)
+        for key in ("created", "updated", "unchanged"):
+            result[key] += batch_result[key]  # type: ignore[literal-required]
+        result["errors"].extend(batch_result["errors"])
+        batch.clear()
+
+    for index, item in items:
+        if isinstance(item, ValueError):
+            result["errors"].append({"index": index, "errors": [f"Invalid JSON: {item}"]})
+            continue
+        try:
+            data = AnimeBulkItemSchema.model_validate(item)
+        except ValidationError as e:
+            result["errors"].append(
+                {
+                    "index": index,
+                    "errors": [
+                        f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                        for error in e.errors()
+                    ],
+                }
+            )
+            continue
+
+        batch.append((index, data.model_dump(exclude_unset=True)))
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    result["errors"].sort(key=lambda error: error["index"])
+    return result
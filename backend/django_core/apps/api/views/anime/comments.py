@@ -0,0 +1,41 @@
+from apps.anime.models import AnimeModel
+from apps.api.http import HttpRequest
+from apps.comments.threads import Thread
+from apps.episodes.models import EpisodeModel
+from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from ninja import Query, Router
+
+from ...schemas.comments import CommentThreadQuerySchema, CommentThreadSchema
+from ..comments import load_thread
+
+router = Router()
+
+
+@router.get("/{int:anime_id}/comments", response=CommentThreadSchema)
+def get_anime_comments(
+    request: HttpRequest,
+    anime_id: int,
+    query: CommentThreadQuerySchema = Query(...),
+) -> Thread:
+    anime = get_object_or_404(AnimeModel.objects.only("pk"), pk=anime_id)
+    # The comments of an anime are the roots of its threads
+    return load_thread(Q(animemodel=anime), None, query)
+
+
+@router.get(
+    "/{int:anime_id}/episodes/{int:episode_number}/comments",
+    response=CommentThreadSchema,
+)
+def get_episode_comments(
+    request: HttpRequest,
+    anime_id: int,
+    episode_number: int,
+    query: CommentThreadQuerySchema = Query(...),
+) -> Thread:
+    episode = get_object_or_404(
+        EpisodeModel.objects.only("pk"),
+        animemodel=anime_id,
+        episode_number=episode_number,
+    )
+    return load_thread(Q(episodemodel=episode), None, query)
@@ -1,5 +1,6 @@
 from apps.anime.models.anime_openings_and_endings import AnimeEndingModel
 from apps.api.auth import AuthBearer
+from apps.api.cache import cache_response
 from apps.api.decorator import permission_required
 from apps.api.permissions import IsSuperUser
 from apps.api.http import HttpRequest
@@ -14,6 +15,7 @@ router = Router()
 
 
 @router.get("/endings", response=list[AnimeOpeningAndEndingGETSchema])
+@cache_response("ending:*")
 def get_anime_ending_info(
     request: HttpRequest,
     filters: OpeningAndEndingFilter = Query(...),
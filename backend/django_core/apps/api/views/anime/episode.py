@@ -2,6 +2,7 @@ from typing import AnyStr
 
 from apps.anime.models import AnimeModel
 from apps.api.auth import AuthBearer
+from apps.api.cache import cache_response
 from apps.api.decorator import permission_required
 from apps.api.permissions import IsSuperUser
 from apps.episodes.models import EpisodeModel
@@ -17,6 +18,7 @@ router = Router()
 
 
 @router.get("/{int:anime_id}/episodes", response=list[EpisodeGETSchema])
+@cache_response("anime:{anime_id}", contains="episode")
 def get_individual_episodes(
     request: HttpRequest,
     anime_id: int,
@@ -68,6 +70,7 @@ def post_individual_episodes(
     "/{int:anime_id}/episodes/{int:episode_number}",
     response=EpisodeGETSchema,
 )
+@cache_response("anime:{anime_id}", contains="episode")
 def get_individual_episode(
     request: HttpRequest,
     anime_id: int,
@@ -1,5 +1,6 @@
 from apps.anime.models.anime_genre import AnimeGenreModel
 from apps.api.auth import AuthBearer
+from apps.api.cache import cache_response
 from apps.api.decorator import permission_required
 from apps.api.permissions import IsSuperUser
 from apps.api.http import HttpRequest
@@ -12,6 +13,7 @@ router = Router()
 
 
 @router.get("/genres", response=list[AnimeGenreGETSchema])
+@cache_response("genre:*")
 def get_anime_genre_info(
     request: HttpRequest,
     filters: GenreFilter = Query(...),
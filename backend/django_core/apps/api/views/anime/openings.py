@@ -1,5 +1,6 @@
 from apps.anime.models.anime_openings_and_endings import AnimeOpeningModel
 from apps.api.auth import AuthBearer
+from apps.api.cache import cache_response
 from apps.api.decorator import permission_required
 from apps.api.permissions import IsSuperUser
 from apps.api.http import HttpRequest
@@ -14,6 +15,7 @@ router = Router()
 
 
 @router.get("/openings", response=list[AnimeOpeningAndEndingGETSchema])
+@cache_response("opening:*")
 def get_anime_opening_info(
     request: HttpRequest,
     filters: OpeningAndEndingFilter = Query(...),
@@ -0,0 +1,88 @@
+from http import HTTPStatus
+
+from apps.anime.models import AnimeModel
+from apps.api.auth import AuthBearer
+from apps.api.http import HttpRequest
+from apps.episodes.models import EpisodeModel
+from apps.episodes.progress import (
+    Progress,
+    buffered_progress,
+    merge_progress,
+    report_progress,
+)
+from apps.user.models import CustomUser
+from django.db.models import FilteredRelation, Q
+from django.shortcuts import get_object_or_404
+from ninja import Router
+from ninja.errors import HttpError
+
+from ...schemas.episodes.episode_timestamp import (
+    WatchProgressPOSTSchema,
+    WatchProgressSchema,
+)
+
+router = Router()
+
+
+def get_user(request: HttpRequest) -> CustomUser:
+    if not isinstance(request.auth, CustomUser):
+        raise HttpError(HTTPStatus.UNAUTHORIZED, "Watch progress requires a user")
+    return request.auth
+
+
+@router.put(
+    "/{int:anime_id}/episodes/{int:episode_number}/progress",
+    response=WatchProgressSchema,
+    auth=AuthBearer(),
+)
+def put_watch_progress(
+    request: HttpRequest,
+    anime_id: int,
+    episode_number: int,
+    payload: WatchProgressPOSTSchema,
+) -> dict:
+    user = get_user(request)
+    episode = get_object_or_404(
+        EpisodeModel.objects.only("pk"),
+        animemodel=anime_id,
+        episode_number=episode_number,
+    )
+    progress = report_progress(user, episode.pk, payload.timestamp)
+    return {"episode_number": episode_number, **progress}
+
+
+@router.get(
+    "/{int:anime_id}/progress",
+    response=list[WatchProgressSchema],
+    auth=AuthBearer(),
+)
+def get_watch_progress(request: HttpRequest, anime_id: int) -> list[dict]:
+    user = get_user(request)
+    anime = get_object_or_404(AnimeModel.objects.only("pk"), pk=anime_id)
+    # Every episode with the stored position of the user, if any
+    episodes = (
+        EpisodeModel.objects.filter(animemodel=anime)
+        .annotate(
+            progress=FilteredRelation(
+                "episode_timestamps", condition=Q(episode_timestamps__user=user)
+            )
+        )
+        .order_by("episode_number")
+        .values("pk", "episode_number", "progress__timestamp", "progress__updated_at")
+    )
+    numbers: dict[int, int] = {}
+    stored: dict[int, Progress] = {}
+    for episode in episodes:
+        numbers[episode["pk"]] = episode["episode_number"]
+        if episode["progress__updated_at"] is not None:
+            stored[episode["pk"]] = Progress(
+                timestamp=episode["progress__timestamp"],
+                updated_at=episode["progress__updated_at"],
+            )
+
+    merged = merge_progress(stored, buffered_progress(user, numbers))
+    return [
+        {"episode_number": number, **merged[pk]}
+        for pk, number in numbers.items()
+        if pk in merged
+    ]
@@ -0,0 +1,16 @@
+from apps.api.auth import AuthBearer
+from apps.api.cache import cache_metrics
+from apps.api.decorator import permission_required
+from apps.api.http import HttpRequest
+from apps.api.permissions import IsSuperUser
+from ninja import Router
+
+from ...schemas.cache import CacheMetricsSchema
+
+router = Router()
+
+
+@router.get("/metrics", response=list[CacheMetricsSchema], auth=AuthBearer())
+@permission_required([IsSuperUser])
+def get_cache_metrics(request: HttpRequest) -> list[dict]:
+    return cache_metrics()
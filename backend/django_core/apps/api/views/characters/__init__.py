@@ -1,10 +1,13 @@
 from apps.api.auth import AuthBearer
+from apps.api.cache import cache_response
+from apps.api.conditional import conditional_response, updated_at_of
 from apps.api.decorator import permission_required
 from apps.api.permissions import IsSuperUser
 from apps.characters.models import CharacterModel
 from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import Q, QuerySet
 from apps.api.http import HttpRequest
+from apps.api.pagination import CursorPagination, exact_score
 from django.shortcuts import get_object_or_404
 from ninja import File, Form, Query, Router
 from ninja.files import UploadedFile
@@ -17,7 +20,9 @@ router = Router()
 
 
 @router.get("", response=list[CharacterGETSchema])
-@paginate
+@cache_response("character:*")
+@conditional_response()
+@paginate(CursorPagination)
 def get_character_info(
     request: HttpRequest,
     filters: CharacterFilter = Query(...),
@@ -29,7 +34,7 @@ def get_character_info(
     character_name = query_dict.pop("name", None)
     if character_name:
         query = query.annotate(
-            similarity=TrigramSimilarity("name", character_name)
+            similarity=exact_score(TrigramSimilarity("name", character_name))
         ).order_by("-similarity")
 
     # Same here but with ids
@@ -76,6 +81,8 @@ def post_character_info(
 
 
 @router.get("/{int:character_id}/", response=CharacterGETSchema)
+@cache_response("character:{character_id}")
+@conditional_response(updated_at_of(CharacterModel, "character_id"))
 def get_individual_character_info(
     request: HttpRequest,
     character_id: int,
@@ -0,0 +1,80 @@
+from http import HTTPStatus
+
+from apps.api.auth import AuthBearer
+from apps.api.http import HttpRequest
+from apps.comments.models import CommentModel
+from apps.comments.threads import Thread, build_thread, decode_cursor
+from apps.comments.votes import cast_vote, pending_deltas
+from apps.user.models import CustomUser
+from django.core import signing
+from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from ninja import Query, Router
+from ninja.errors import HttpError
+
+from ...schemas.comments import (
+    CommentThreadQuerySchema,
+    CommentThreadSchema,
+    CommentVotePOSTSchema,
+    CommentVoteSchema,
+)
+
+router = Router()
+
+
+def load_thread(
+    scope: Q,
+    parent: CommentModel | None,
+    query: CommentThreadQuerySchema,
+) -> Thread:
+    after = None
+    if query.cursor:
+        try:
+            cursor_parent, after = decode_cursor(query.cursor)
+        except signing.BadSignature:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid cursor")
+        if cursor_parent != (parent.pk if parent else None):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Cursor belongs to another thread")
+    return build_thread(scope, parent, after, query.limit, query.replies, query.depth)
+
+
+@router.get("/{int:comment_id}/replies", response=CommentThreadSchema)
+def get_comment_replies(
+    request: HttpRequest,
+    comment_id: int,
+    query: CommentThreadQuerySchema = Query(...),
+) -> Thread:
+    parent = get_object_or_404(CommentModel.objects.only("pk", "path"), pk=comment_id)
+    return load_thread(
+        Q(path__descendants=parent.path, path__depth=len(parent.path) + 1),
+        parent,
+        query,
+    )
+
+
+@router.post("/{int:comment_id}/vote", response=CommentVoteSchema, auth=AuthBearer())
+def post_comment_vote(
+    request: HttpRequest,
+    comment_id: int,
+    payload: CommentVotePOSTSchema,
+) -> dict[str, int]:
+    if not isinstance(request.auth, CustomUser):
+        raise HttpError(HTTPStatus.UNAUTHORIZED, "Voting requires a user")
+    comment = get_object_or_404(
+        CommentModel.objects.only("pk", "upvote_count", "downvote_count"),
+        pk=comment_id,
+        deleted=False,
+    )
+    deltas = cast_vote(comment, request.auth, payload.vote)
+
+    # The stored counts trail the buffered deltas, this vote included
+    up, down = pending_deltas([comment.pk]).get(comment.pk, deltas[comment.pk])
+    upvote_count = comment.upvote_count + up
+    downvote_count = comment.downvote_count + down
+    return {
+        "id": comment.pk,
+        "vote": payload.vote,
+        "upvote_count": upvote_count,
+        "downvote_count": downvote_count,
+        "score": upvote_count - downvote_count,
+    }
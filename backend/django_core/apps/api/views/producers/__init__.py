@@ -1,7 +1,10 @@
+from apps.api.cache import cache_response
+from apps.api.conditional import conditional_response, updated_at_of
 from apps.api.decorator import permission_required
 from apps.api.permissions import IsSuperUser
 from django.db.models import Q
 from apps.api.http import HttpRequest
+from apps.api.pagination import CursorPagination
 from django.shortcuts import get_object_or_404
 from ninja import Query, Router
 from ninja.pagination import paginate
@@ -15,7 +18,9 @@ router = Router()
 
 
 @router.get("", response=list[ProducerGETSchema])
-@paginate
+@cache_response("producer:*")
+@conditional_response()
+@paginate(CursorPagination)
 def get_producer_info(
     request: HttpRequest,
     filters: ProducerFilter = Query(...),
@@ -53,6 +58,8 @@ def post_producer_info(request: HttpRequest, payload: ProducerPOSTSchema) -> Pro
 
 
 @router.get("/{int:producer_id}/", response=ProducerGETSchema)
+@cache_response("producer:{producer_id}")
+@conditional_response(updated_at_of(ProducerModel, "producer_id"))
 def get_individual_producer_info(
     request: HttpRequest,
     producer_id: int,
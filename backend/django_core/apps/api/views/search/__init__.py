@@ -0,0 +1,42 @@
+from http import HTTPStatus
+
+from apps.api.http import HttpRequest
+from apps.search.autocomplete import IndexNotLoaded, complete
+from apps.search.index import SearchResult, search_entries
+from apps.search.models import SEARCH_KINDS
+from ninja import Query, Router
+from ninja.errors import HttpError
+
+from ...schemas.search import (
+    AutocompleteQuerySchema,
+    AutocompleteSchema,
+    SearchQuerySchema,
+    SearchResultsSchema,
+)
+
+router = Router()
+
+
+@router.get("/", response=SearchResultsSchema)
+def get_search_results(
+    request: HttpRequest,
+    query: SearchQuerySchema = Query(...),
+) -> dict[str, list[SearchResult]]:
+    results: dict[str, list[SearchResult]] = {kind: [] for kind, _ in SEARCH_KINDS}
+    kinds = query.types or list(results)
+    for result in search_entries(query.q.strip(), kinds, query.limit):
+        results[result["kind"]].append(result)
+    return results
+
+
+@router.get("/autocomplete", response=list[AutocompleteSchema])
+def get_autocomplete(
+    request: HttpRequest,
+    query: AutocompleteQuerySchema = Query(...),
+) -> list[dict]:
+    # Served from the snapshot loaded in this process, see `apps.search.autocomplete`
+    try:
+        results = complete(query.q, query.limit)
+    except IndexNotLoaded:
+        raise HttpError(HTTPStatus.SERVICE_UNAVAILABLE, "Autocomplete is loading")
+    return [{"id": pk, "name": name} for pk, name in results]
@@ -1,10 +1,13 @@
 from apps.api.auth import AuthBearer
+from apps.api.cache import cache_response
+from apps.api.conditional import conditional_response, updated_at_of
 from apps.api.decorator import permission_required
 from apps.api.permissions import IsSuperUser
 from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import Q, QuerySet
 from django.db.models.functions import Greatest
 from apps.api.http import HttpRequest
+from apps.api.pagination import CursorPagination, exact_score
 from django.shortcuts import get_object_or_404
 from ninja import File, Form, Query, Router
 from ninja.files import UploadedFile
@@ -18,7 +21,9 @@ router = Router()
 
 
 @router.get("", response=list[StaffPOSTSchema])
-@paginate
+@cache_response("staff:*")
+@conditional_response()
+@paginate(CursorPagination)
 def get_staff_info(
     request: HttpRequest,
     filters: StaffFilter = Query(...),
@@ -33,11 +38,13 @@ def get_staff_info(
         # Modify this
         query = (
             query.annotate(
-                similiarity=Greatest(
-                    TrigramSimilarity("name", staff_name),
-                    TrigramSimilarity("alternate_names__name", staff_name),
-                    TrigramSimilarity("family_name", staff_name),
-                    TrigramSimilarity("given_name", staff_name),
+                similiarity=exact_score(
+                    Greatest(
+                        TrigramSimilarity("name", staff_name),
+                        TrigramSimilarity("alternate_names__name", staff_name),
+                        TrigramSimilarity("family_name", staff_name),
+                        TrigramSimilarity("given_name", staff_name),
+                    )
                 )
             )
             .filter(
@@ -128,6 +135,8 @@ def post_staff_info(
 
 
 @router.get("/{str:staff_id}/", response=StaffPOSTSchema)
+@cache_response("staff:{staff_id}")
+@conditional_response(updated_at_of(StaffModel, "staff_id"))
 def get_individual_staff_info(
     request: HttpRequest,
     staff_id: str,
@@ -0,0 +1,42 @@
+from http import HTTPStatus
+
+from apps.api.http import HttpRequest
+from apps.episodes.models import WatchHistogramModel, WatchStatsModel
+from apps.user.models import CustomUser
+from ninja import Router
+from ninja.errors import HttpError
+
+from ...auth import AuthBearer
+from ...schemas.stats.histogram import HistogramSchema
+from ...schemas.stats.watch import WatchStatsSchema
+
+router = Router()
+
+
+def get_user(request: HttpRequest) -> CustomUser:
+    if not isinstance(request.auth, CustomUser):
+        raise HttpError(HTTPStatus.UNAUTHORIZED, "Watch statistics require a user")
+    return request.auth
+
+
+@router.get("/stats", response=WatchStatsSchema, auth=AuthBearer())
+def get_watch_stats(request: HttpRequest) -> WatchStatsModel:
+    user = get_user(request)
+    # Users who never reported a position have no row
+    return WatchStatsModel.objects.filter(user=user).first() or WatchStatsModel(user=user)
+
+
+@router.get("/stats/histogram", response=list[HistogramSchema], auth=AuthBearer())
+def get_watch_histogram(request: HttpRequest) -> list[dict]:
+    user = get_user(request)
+    return [
+        {
+            "year": month.year,
+            "month": month.month,
+            "count": count,
+            "watchtime": watchtime,
+        }
+        for month, count, watchtime in WatchHistogramModel.objects.filter(
+            user=user
+        ).values_list("month", "count", "watchtime")
+    ]
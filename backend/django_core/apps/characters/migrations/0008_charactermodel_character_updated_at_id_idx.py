@@ -0,0 +1,17 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0007_alter_charactermodel_is_locked'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='charactermodel',
+            index=models.Index(fields=['updated_at', 'id'], name='character_updated_at_id_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0008_charactermodel_character_updated_at_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='charactermodel',
+            name='image_derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -24,10 +24,16 @@ class CharacterModel(CreatedAtMixin, UpdatedAtMixin, IsLockedMixin):
         null=True,
     )
     about = models.TextField(null=True, blank=True)
+    # Resized copies of the images in modern formats, see `apps.api.images`
+    image_derivatives = models.JSONField(default=dict, blank=True, editable=False)
 
     def __str__(self) -> str:
         return f"{self.pk}. {self.name}"
 
     class Meta:
+        indexes = [
+            # Keyset pagination, see `apps.api.pagination.CursorPagination`
+            models.Index(fields=["updated_at", "id"], name="character_updated_at_id_idx"),
+        ]
         verbose_name = "Character"
         verbose_name_plural = "Characters"
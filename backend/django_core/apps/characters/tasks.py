@@ -0,0 +1,40 @@
+from functools import partial
+
+from apps.sync.pipeline import Source, SyncResult, run_sync
+from apps.sync.providers import anilist, kitsu, mal
+from celery import shared_task
+
+from .models import CharacterModel
+
+
+@shared_task()
+def get_periodic_character() -> dict[str, SyncResult]:
+    """Refresh characters, MyAnimeList creates them and the others fill in blanks."""
+    anilist_ids = sorted(
+        CharacterModel.objects.exclude(anilist_id=None).values_list("anilist_id", flat=True)
+    )
+    return run_sync(
+        {
+            "mal": Source(
+                model=CharacterModel,
+                provider="mal",
+                fetch=mal.characters,
+                creates=True,
+                overwrites=True,
+            ),
+            "kitsu": Source(
+                model=CharacterModel,
+                provider="kitsu",
+                fetch=kitsu.characters,
+                creates=False,
+                overwrites=False,
+            ),
+            "anilist": Source(
+                model=CharacterModel,
+                provider="anilist",
+                fetch=partial(anilist.characters, anilist_ids),
+                creates=False,
+                overwrites=False,
+            ),
+        }
+    )
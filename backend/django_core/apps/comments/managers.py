@@ -0,0 +1,59 @@
+from typing import TYPE_CHECKING
+
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django_ltree.managers import TreeManager
+from django_ltree.querysets import TreeQuerySet
+
+if TYPE_CHECKING:
+    from .models import CommentModel  # noqa: F401
+
+
+class CommentQuerySet(TreeQuerySet["CommentModel"]):
+    def refresh_vote_counts(self, pending: dict[int, tuple[int, int]] | None = None) -> int:
+        """
+        Recompute the vote columns of every comment in the queryset from the vote
+        tables with a single `UPDATE`, only comments that drifted are written.
+
+        `pending` are the `(upvote, downvote)` deltas by pk of votes in the tables
+        whose deltas are still buffered, the columns are left behind by them.
+        """
+        pending = pending or {}
+
+        def count(field: str, direction: int) -> Coalesce:
+            votes = (
+                getattr(self.model, field)
+                .through.objects.filter(commentmodel=OuterRef("pk"))
+                .order_by()
+                .values("commentmodel")
+            )
+            # Comments without votes have no row to count
+            value = Coalesce(Subquery(votes.annotate(value=Count("*")).values("value")), 0)
+            if offsets := [
+                When(pk=pk, then=Value(delta[direction]))
+                for pk, delta in pending.items()
+                if delta[direction]
+            ]:
+                value = value - Case(*offsets, default=Value(0))
+            return value
+
+        upvotes, downvotes = count("upvotes", 0), count("downvotes", 1)
+        return (
+            self.alias(new_upvote_count=upvotes, new_downvote_count=downvotes)
+            .filter(
+                ~Q(upvote_count=F("new_upvote_count"))
+                | ~Q(downvote_count=F("new_downvote_count"))
+                | ~Q(score=F("new_upvote_count") - F("new_downvote_count"))
+            )
+            .update(
+                upvote_count=upvotes,
+                downvote_count=downvotes,
+                score=upvotes - downvotes,
+            )
+        )
+
+
+class CommentManager(TreeManager.from_queryset(CommentQuerySet)):  # type: ignore[misc]
+    def get_queryset(self) -> CommentQuerySet:
+        # `TreeManager` builds a plain `TreeQuerySet`
+        return CommentQuerySet(model=self.model, using=self._db).order_by("path")
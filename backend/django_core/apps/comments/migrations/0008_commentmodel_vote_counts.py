@@ -0,0 +1,47 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0007_alter_commentmodel_user'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='commentmodel',
+            name='downvote_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='commentmodel',
+            name='score',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='commentmodel',
+            name='upvote_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(
+            sql="""
+            UPDATE comments_commentmodel AS comment
+            SET upvote_count = votes.upvote_count,
+                downvote_count = votes.downvote_count,
+                score = votes.upvote_count - votes.downvote_count
+            FROM (
+                SELECT
+                    comment.id,
+                    (SELECT COUNT(*) FROM comments_commentmodel_upvotes AS vote
+                        WHERE vote.commentmodel_id = comment.id) AS upvote_count,
+                    (SELECT COUNT(*) FROM comments_commentmodel_downvotes AS vote
+                        WHERE vote.commentmodel_id = comment.id) AS downvote_count
+                FROM comments_commentmodel AS comment
+            ) AS votes
+            WHERE votes.id = comment.id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
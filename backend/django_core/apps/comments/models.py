@@ -4,6 +4,8 @@ from django.db import models
 from django_ltree.models import TreeModel
 from mixins.models.created_at import CreatedAtMixin
 
+from .managers import CommentManager
+
 
 # Create your models here.
 
@@ -15,12 +17,19 @@ class CommentModel(CreatedAtMixin, TreeModel):
     upvotes = models.ManyToManyField(CustomUser, blank=True, related_name="upvotes")
     downvotes = models.ManyToManyField(CustomUser, blank=True, related_name="downvotes")
 
+    # Counts of `upvotes` and `downvotes`, see `apps.comments.votes`
+    upvote_count = models.PositiveIntegerField(default=0, editable=False)
+    downvote_count = models.PositiveIntegerField(default=0, editable=False)
+    score = models.IntegerField(default=0, editable=False)
+
     deleted = models.BooleanField(default=False)
 
+    objects = CommentManager()
+
     @property
     def ratio(self) -> int:
         # Formula : <like> - <dislike>
-        return self.upvotes.count() - self.downvotes.count()
+        return self.score
 
     @property
     def childrens(self) -> int:
@@ -0,0 +1,30 @@
+from apps.api.cache import redis_lock
+from celery import shared_task
+
+from .models import CommentModel
+from .votes import buffered_deltas, flush_deltas
+
+# A flush blocks the next one for this long at most, two flushes would both
+# apply the deltas left by a failed one. Held in the Redis of the buffer,
+# every worker process has to see it
+FLUSH_VOTES_LOCK_SECONDS = 5 * 60
+FLUSH_VOTES_KEY = "comments:votes:flush_lock"
+
+
+@shared_task(ignore_result=True)
+def flush_comment_votes() -> int:
+    """Write the vote counter deltas buffered in Redis to the comments."""
+    with redis_lock(FLUSH_VOTES_KEY, FLUSH_VOTES_LOCK_SECONDS) as acquired:
+        return flush_deltas() if acquired else 0
+
+
+@shared_task(ignore_result=True)
+def reconcile_comment_votes() -> int:
+    """Repair vote counters that drifted from the vote tables."""
+    # A flush running meanwhile would add deltas already counted from the tables
+    with redis_lock(FLUSH_VOTES_KEY, FLUSH_VOTES_LOCK_SECONDS) as acquired:
+        if not acquired:
+            return 0
+        flush_deltas()
+        # Votes cast since the flush are in the tables and still in the buffer
+        return CommentModel.objects.refresh_vote_counts(buffered_deltas())
@@ -0,0 +1,168 @@
+from typing import Any, TypedDict
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core import signing
+from django.db.models import Case, Count, F, Func, Q, Value, When, Window
+from django.db.models.functions import RowNumber
+from django_ltree.fields import PathField
+from django_ltree.functions import NLevel
+
+from .models import CommentModel
+
+# Siblings are ranked by score, the pk breaks ties and keeps cursors stable
+SIBLING_ORDERING = (F("score").desc(), F("pk").asc())
+
+CURSOR_SALT = "apps.comments.threads.cursor"
+
+
+class Comment(TypedDict):
+    id: int
+    user: str | None
+    text: str
+    created_at: Any
+    upvote_count: int
+    downvote_count: int
+    score: int
+    deleted: bool
+    # Replies including the ones not loaded yet
+    reply_count: int
+    replies: list["Comment"]
+    # Cursor loading the replies after the loaded ones
+    next: str | None
+
+
+class Thread(TypedDict):
+    items: list[Comment]
+    next: str | None
+
+
+def encode_cursor(parent: int | None, comment: Comment | None) -> str:
+    after = [comment["score"], comment["id"]] if comment else None
+    return signing.dumps({"parent": parent, "after": after}, salt=CURSOR_SALT)
+
+
+def decode_cursor(cursor: str) -> tuple[int | None, list[int] | None]:
+    """Parent comment and the `(score, pk)` key the next siblings come after."""
+    payload = signing.loads(cursor, salt=CURSOR_SALT)
+    return payload["parent"], payload["after"]
+
+
+def build_thread(
+    scope: Q,
+    parent: CommentModel | None,
+    after: list[int] | None,
+    limit: int,
+    replies: int,
+    depth: int,
+) -> Thread:
+    """
+    Load a window of a comment tree with a single path-prefix query.
+
+    `scope` selects the first level, the roots of an anime or the children of
+    `parent`. `limit` of them are loaded after the `after` key, each with the
+    best `replies` replies per level down to `depth` levels below them.
+    The query ranks the siblings of every level with a window function, the
+    level below the window only tells which comments have more replies.
+    """
+    base = len(parent.path) if parent else 0
+    # One extra comment tells whether there is a next page
+    top = CommentModel.objects.filter(scope).order_by(*SIBLING_ORDERING)
+    if after:
+        score, pk = after
+        top = top.filter(Q(score__lt=score) | Q(score=score, pk__gt=pk))
+    top = top.values("path")[: limit + 1]
+
+    level = NLevel(F("path"))
+    parent_path = Func(
+        F("path"), Value(0), level - 1, function="subpath", output_field=PathField()
+    )
+    rows = (
+        CommentModel.objects.filter(path__descendants=ArraySubquery(top))
+        .annotate(level=level)
+        .filter(level__lte=base + depth + 1)
+        .annotate(
+            rank=Window(RowNumber(), partition_by=parent_path, order_by=SIBLING_ORDERING),
+            siblings=Window(Count("*"), partition_by=parent_path),
+            rank_limit=Case(
+                When(level=base + 1, then=Value(limit + 1)),
+                When(level__lte=base + depth, then=Value(replies)),
+                default=Value(1),
+            ),
+        )
+        .filter(rank__lte=F("rank_limit"))
+        .order_by("level", "rank")
+        .values(
+            "pk",
+            "path",
+            "user__username",
+            "text",
+            "created_at",
+            "upvote_count",
+            "downvote_count",
+            "score",
+            "deleted",
+            "level",
+            "siblings",
+        )
+    )
+
+    nodes: dict[str, Comment] = {}
+    items: list[Comment] = []
+    for row in rows:
+        path = str(row["path"])
+        parent_key = path.rpartition(".")[0]
+        if row["level"] > base + depth:
+            # Below the window, only counted
+            if parent_key in nodes:
+                nodes[parent_key]["reply_count"] = row["siblings"]
+            continue
+
+        node = Comment(
+            id=row["pk"],
+            user=row["user__username"],
+            text=row["text"],
+            created_at=row["created_at"],
+            upvote_count=row["upvote_count"],
+            downvote_count=row["downvote_count"],
+            score=row["score"],
+            deleted=row["deleted"],
+            reply_count=0,
+            replies=[],
+            next=None,
+        )
+        if row["level"] == base + 1:
+            items.append(node)
+        elif parent_key in nodes:
+            nodes[parent_key]["reply_count"] = row["siblings"]
+            nodes[parent_key]["replies"].append(node)
+        else:
+            # Its parent is out of the window
+            continue
+        nodes[path] = node
+
+    cursor = None
+    if len(items) > limit:
+        # Taken before collapsing, dropped comments must not be loaded again
+        cursor = encode_cursor(parent.pk if parent else None, items[limit - 1])
+    return Thread(items=collapse(items[:limit]), next=cursor)
+
+
+def collapse(comments: list[Comment]) -> list[Comment]:
+    """
+    Hide the content of deleted comments and drop the ones left without replies.
+
+    Sets the cursors of the comments with replies that were not loaded.
+    """
+    kept = []
+    for comment in comments:
+        loaded = comment["replies"]
+        if comment["reply_count"] > len(loaded):
+            comment["next"] = encode_cursor(comment["id"], loaded[-1] if loaded else None)
+        comment["replies"] = collapse(loaded)
+        if comment["deleted"]:
+            if not comment["replies"] and not comment["next"]:
+                continue
+            comment["user"] = None
+            comment["text"] = ""
+        kept.append(comment)
+    return kept
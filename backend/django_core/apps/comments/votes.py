@@ -0,0 +1,188 @@
+from collections import defaultdict
+from collections.abc import Iterable
+import logging
+
+from apps.api.cache import get_redis
+from apps.user.models import CustomUser
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from redis import RedisError
+
+from .models import CommentModel
+
+logger = logging.getLogger("django")
+
+# Vote value and the relation recording it, `0` removes the vote
+VOTE_FIELDS = {1: "upvotes", -1: "downvotes"}
+
+# Hash of `<pk>:up` and `<pk>:down` counter deltas not written to the comments yet
+DELTAS_KEY = "comments:votes:deltas"
+# Deltas a flush took, a failed flush leaves them here for the next one
+FLUSHING_KEY = "comments:votes:flushing"
+
+# KEYS: deltas, flushing
+TAKE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return {}
+    end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('HGETALL', KEYS[2])
+"""
+
+# `(upvote delta, downvote delta)` by comment pk
+Deltas = dict[int, tuple[int, int]]
+
+
+def apply_deltas(deltas: Deltas, batch_size: int = 1000) -> int:
+    """
+    Add `deltas` to the vote columns.
+
+    Comments with the same delta, usually a single upvote, share an `UPDATE`.
+    Returns the number of comments written.
+    """
+    groups: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for pk, delta in deltas.items():
+        if delta != (0, 0):
+            groups[delta].append(pk)
+
+    written = 0
+    for (up, down), pks in groups.items():
+        for start in range(0, len(pks), batch_size):
+            written += CommentModel.objects.filter(
+                pk__in=pks[start : start + batch_size]
+            ).update(
+                upvote_count=F("upvote_count") + up,
+                downvote_count=F("downvote_count") + down,
+                score=F("score") + up - down,
+            )
+    return written
+
+
+def buffer_deltas(deltas: Deltas) -> None:
+    """Queue `deltas` for `flush_deltas`, they are written right away without Redis."""
+    if not settings.COMMENT_VOTE_BUFFER:
+        apply_deltas(deltas)
+        return
+    try:
+        with get_redis().pipeline() as pipeline:
+            for pk, (up, down) in deltas.items():
+                if up:
+                    pipeline.hincrby(DELTAS_KEY, f"{pk}:up", up)
+                if down:
+                    pipeline.hincrby(DELTAS_KEY, f"{pk}:down", down)
+            pipeline.execute()
+    except RedisError:
+        logger.warning("Vote buffer is unavailable, writing the vote counts directly")
+        apply_deltas(deltas)
+
+
+def parse_deltas(values: Iterable[bytes]) -> Deltas:
+    """`Deltas` of a flat `HGETALL` or `HMGET` reply of field and value pairs."""
+    parsed: dict[int, list[int]] = defaultdict(lambda: [0, 0])
+    items = iter(values)
+    for field, value in zip(items, items):
+        pk, _, direction = field.decode().partition(":")
+        parsed[int(pk)][direction == "down"] += int(value or 0)
+    return {pk: (up, down) for pk, (up, down) in parsed.items()}
+
+
+def pending_deltas(pks: Iterable[int]) -> Deltas:
+    """Deltas of `pks` still waiting in the buffer, added to the stored counts on reads."""
+    if not settings.COMMENT_VOTE_BUFFER:
+        return {}
+    fields = [f"{pk}:{direction}" for pk in pks for direction in ("up", "down")]
+    if not fields:
+        return {}
+    try:
+        with get_redis().pipeline(transaction=False) as pipeline:
+            pipeline.hmget(DELTAS_KEY, fields)
+            pipeline.hmget(FLUSHING_KEY, fields)
+            buffered, flushing = pipeline.execute()
+    except RedisError:
+        return {}
+
+    deltas: Deltas = {}
+    for values in (buffered, flushing):
+        pairs = [
+            item for pair in zip(fields, values) for item in (pair[0].encode(), pair[1])
+        ]
+        for pk, (up, down) in parse_deltas(pairs).items():
+            previous = deltas.get(pk, (0, 0))
+            deltas[pk] = (previous[0] + up, previous[1] + down)
+    return deltas
+
+
+def buffered_deltas() -> Deltas:
+    """Every delta waiting in the buffer, including the ones of a failed flush."""
+    if not settings.COMMENT_VOTE_BUFFER:
+        return {}
+    with get_redis().pipeline(transaction=False) as pipeline:
+        pipeline.hgetall(DELTAS_KEY)
+        pipeline.hgetall(FLUSHING_KEY)
+        replies = pipeline.execute()
+
+    deltas: Deltas = {}
+    for reply in replies:
+        for pk, (up, down) in parse_deltas(
+            item for pair in reply.items() for item in pair
+        ).items():
+            previous = deltas.get(pk, (0, 0))
+            deltas[pk] = (previous[0] + up, previous[1] + down)
+    return deltas
+
+
+def flush_deltas(batch_size: int = 1000) -> int:
+    """
+    Write the buffered deltas to the comments, in one transaction.
+
+    The buffer is swapped out atomically, votes cast during the flush go to a
+    fresh one. Returns the number of comments written.
+    """
+    redis = get_redis()
+    deltas = parse_deltas(redis.eval(TAKE_SCRIPT, 2, DELTAS_KEY, FLUSHING_KEY))
+    if not deltas:
+        return 0
+    with transaction.atomic():
+        written = apply_deltas(deltas, batch_size)
+    # Should this fail, the next flush applies the deltas again,
+    # `CommentQuerySet.refresh_vote_counts` repairs the counts
+    redis.delete(FLUSHING_KEY)
+    return written
+
+
+def cast_vote(comment: CommentModel, user: CustomUser, vote: int) -> Deltas:
+    """
+    Make `vote` the vote of `user` on `comment`, casting it again changes nothing.
+
+    The vote tables are the truth, the counter columns follow them through
+    the buffered deltas. Returns the delta of the comment.
+    """
+    up = down = 0
+    with transaction.atomic():
+        # Concurrent votes of the user on the comment would both see no previous vote
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+                [f"comment_vote:{comment.pk}:{user.pk}"],
+            )
+        for value, field in VOTE_FIELDS.items():
+            votes = getattr(CommentModel, field).through.objects
+            lookup = {"commentmodel": comment, "customuser": user}
+            if value == vote:
+                _, created = votes.get_or_create(**lookup)
+                delta = int(created)
+            else:
+                deleted, _ = votes.filter(**lookup).delete()
+                delta = -deleted
+            if value == 1:
+                up = delta
+            else:
+                down = delta
+
+        deltas = {comment.pk: (up, down)}
+        if deltas[comment.pk] != (0, 0):
+            transaction.on_commit(lambda: buffer_deltas(deltas))
+    return deltas
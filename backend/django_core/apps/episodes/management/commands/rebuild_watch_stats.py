@@ -0,0 +1,37 @@
+from typing import Any
+
+from apps.episodes.stats import rebuild_stats
+from apps.user.models import CustomUser
+from django.core.management.base import BaseCommand, CommandParser
+
+
+class Command(BaseCommand):
+    help = "Recompute the watch statistics of users from their stored positions"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "users",
+            nargs="*",
+            type=int,
+            help="Primary keys of the users, every user by default",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Users rebuilt per transaction",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size: int = options["batch_size"]
+        pks = options["users"] or list(
+            CustomUser.objects.order_by("pk").values_list("pk", flat=True)
+        )
+
+        # Short transactions keep the progress writes of the users waiting briefly
+        for start in range(0, len(pks), batch_size):
+            rebuild_stats(pks[start : start + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt the watch statistics of {len(pks)} users")
+        )
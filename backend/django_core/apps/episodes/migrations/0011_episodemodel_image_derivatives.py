@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('episodes', '0010_alter_episodemodel_episode_comments_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='episodemodel',
+            name='image_derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,87 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("episodes", "0011_episodemodel_image_derivatives"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="episodetimestampmodel",
+            name="episode",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="episodes.episodemodel",
+            ),
+        ),
+        migrations.AddField(
+            model_name="episodetimestampmodel",
+            name="updated_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        # The join rows become the foreign key, a timestamp linked to several
+        # episodes is copied for each of them. Only the latest position of a user
+        # on an episode is kept. Constraints are checked right away, pending
+        # trigger events would block the `ALTER TABLE`s below
+        migrations.RunSQL(
+            sql="""
+            SET CONSTRAINTS ALL IMMEDIATE;
+
+            UPDATE episodes_episodetimestampmodel AS timestamp
+            SET episode_id = link.episodemodel_id,
+                updated_at = timestamp.created_at
+            FROM (
+                SELECT DISTINCT ON (episodetimestampmodel_id)
+                    episodetimestampmodel_id, episodemodel_id
+                FROM episodes_episodemodel_episode_timestamps
+                ORDER BY episodetimestampmodel_id, episodemodel_id
+            ) AS link
+            WHERE link.episodetimestampmodel_id = timestamp.id;
+
+            INSERT INTO episodes_episodetimestampmodel
+                (created_at, updated_at, timestamp, user_id, episode_id)
+            SELECT timestamp.created_at, timestamp.created_at, timestamp.timestamp,
+                timestamp.user_id, link.episodemodel_id
+            FROM episodes_episodemodel_episode_timestamps AS link
+            JOIN episodes_episodetimestampmodel AS timestamp
+                ON timestamp.id = link.episodetimestampmodel_id
+            WHERE link.episodemodel_id <> timestamp.episode_id;
+
+            -- Dropped below, its rows would block deleting the duplicates
+            DELETE FROM episodes_episodemodel_episode_timestamps;
+
+            DELETE FROM episodes_episodetimestampmodel
+            WHERE episode_id IS NULL
+                OR id NOT IN (
+                    SELECT DISTINCT ON (user_id, episode_id) id
+                    FROM episodes_episodetimestampmodel
+                    ORDER BY user_id, episode_id, created_at DESC, id DESC
+                );
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RemoveField(
+            model_name="episodemodel",
+            name="episode_timestamps",
+        ),
+        migrations.AlterField(
+            model_name="episodetimestampmodel",
+            name="episode",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="episode_timestamps",
+                to="episodes.episodemodel",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="episodetimestampmodel",
+            constraint=models.UniqueConstraint(
+                fields=("user", "episode"), name="episode_timestamp_user_episode_unique"
+            ),
+        ),
+    ]
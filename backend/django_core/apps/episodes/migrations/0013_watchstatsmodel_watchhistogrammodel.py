@@ -0,0 +1,45 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('episodes', '0012_episodetimestampmodel_episode'),
+        ('user', '0012_customuser_image_derivatives'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WatchStatsModel',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='watch_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_watchtime', models.BigIntegerField(default=0)),
+                ('episodes_completed', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Watch Stats',
+                'verbose_name_plural': 'Watch Stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='WatchHistogramModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('count', models.IntegerField(default=0)),
+                ('watchtime', models.BigIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='watch_histogram', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Watch Histogram',
+                'ordering': ['user', 'month'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'month'), name='watch_histogram_user_month_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("episodes", "0013_watchstatsmodel_watchhistogrammodel"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="episodetimestampmodel",
+            name="completed",
+            field=models.BooleanField(default=False),
+        ),
+        # Same rule as `apps.episodes.stats.COMPLETED_RATIO`
+        migrations.RunSQL(
+            sql="""
+            UPDATE episodes_episodetimestampmodel AS position
+            SET completed = TRUE
+            FROM episodes_episodemodel AS episode
+            WHERE episode.id = position.episode_id
+                AND episode.episode_length > 0
+                AND position."timestamp" >= episode.episode_length * 0.9
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
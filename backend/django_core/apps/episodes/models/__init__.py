@@ -5,8 +5,6 @@ from dynamic_filenames import FilePattern
 from mixins.models.created_at import CreatedAtMixin
 from mixins.models.updated_at import UpdatedAtMixin
 
-from .episode_timestamp import EpisodeTimestampModel
-
 episode_pattern = FilePattern(filename_pattern="episode/{uuid:s}{ext}")
 episode_thumbnail_pattern = FilePattern(filename_pattern="thumbnail/{uuid:s}{ext}")
 
@@ -28,9 +26,10 @@ class EpisodeModel(UpdatedAtMixin, CreatedAtMixin):
     )
 
     episode_summary = models.TextField(default="", blank=True, null=True)
+    # Resized copies of the images in modern formats, see `apps.api.images`
+    image_derivatives = models.JSONField(default=dict, blank=True, editable=False)
 
     episode_comments = models.ManyToManyField(CommentModel, blank=True)
-    episode_timestamps = models.ManyToManyField(EpisodeTimestampModel, blank=True)
 
     episode_length = models.PositiveIntegerField(
         default=None,
@@ -58,3 +57,5 @@ class EpisodeModel(UpdatedAtMixin, CreatedAtMixin):
 
 
 from .episode_timestamp import EpisodeTimestampModel as EpisodeTimestampModel
+from .watch_stats import WatchHistogramModel as WatchHistogramModel
+from .watch_stats import WatchStatsModel as WatchStatsModel
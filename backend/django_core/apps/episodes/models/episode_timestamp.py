@@ -1,20 +1,38 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
 from mixins.models.created_at import CreatedAtMixin
 
 # Create your models here.
 
 
 class EpisodeTimestampModel(CreatedAtMixin):
+    # Latest playback position, see `apps.episodes.progress`
     timestamp = models.IntegerField(default=0)
+    # When the position was reported, buffered reports are written later
+    updated_at = models.DateTimeField(default=timezone.now)
+    # Whether the position counts as completed in the watch statistics, decided by
+    # the episode length when it was written, see `apps.episodes.stats`
+    completed = models.BooleanField(default=False)
 
     user = models.ForeignKey(
         get_user_model(),
         on_delete=models.CASCADE,
     )
+    episode = models.ForeignKey(
+        "episodes.EpisodeModel",
+        on_delete=models.CASCADE,
+        related_name="episode_timestamps",
+    )
 
     def __str__(self) -> str:
         return f"{self.user} | {self.timestamp} seconds"
 
     class Meta:
+        constraints = [
+            # Target of the upserts of the progress flush
+            models.UniqueConstraint(
+                fields=["user", "episode"], name="episode_timestamp_user_episode_unique"
+            ),
+        ]
         verbose_name = "Episode Timestamp"
@@ -0,0 +1,55 @@
+from django.contrib.auth import get_user_model
+from django.db import models
+
+# Create your models here.
+
+
+class WatchStatsModel(models.Model):
+    """Totals of the stored positions of a user, see `apps.episodes.stats`."""
+
+    user = models.OneToOneField(
+        get_user_model(),
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="watch_stats",
+    )
+    # Sum of the positions, in seconds
+    total_watchtime = models.BigIntegerField(default=0)
+    # Episodes watched up to `COMPLETED_RATIO` of their length
+    episodes_completed = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.user} | {self.total_watchtime} seconds"
+
+    class Meta:
+        verbose_name = "Watch Stats"
+        verbose_name_plural = "Watch Stats"
+
+
+class WatchHistogramModel(models.Model):
+    """Stored positions of a user by the month they were reported in."""
+
+    user = models.ForeignKey(
+        get_user_model(),
+        on_delete=models.CASCADE,
+        related_name="watch_histogram",
+    )
+    # First day of the month, in UTC
+    month = models.DateField()
+    # Episodes last watched in the month
+    count = models.IntegerField(default=0)
+    watchtime = models.BigIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.user} | {self.month:%Y-%m} | {self.count}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "month"], name="watch_histogram_user_month_unique"
+            ),
+        ]
+        ordering = ["user", "month"]
+        verbose_name = "Watch Histogram"
@@ -0,0 +1,194 @@
+from collections.abc import Iterable
+import datetime
+import logging
+from typing import TypedDict
+
+from apps.api.cache import get_redis
+from apps.user.models import CustomUser
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from redis import RedisError
+
+from .models import EpisodeModel, EpisodeTimestampModel
+from .stats import COMPLETED_RATIO, lock_users, stored_positions, update_stats
+
+logger = logging.getLogger("django")
+
+# Hash of `<user pk>:<episode pk>` to `<timestamp>:<reported at>`, the latest report wins
+PROGRESS_KEY = "episodes:progress"
+# Reports a flush took, a failed flush leaves them here for the next one
+FLUSHING_KEY = "episodes:progress:flushing"
+
+# KEYS: progress, flushing
+TAKE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return {}
+    end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('HGETALL', KEYS[2])
+"""
+
+# An older report never replaces a newer position, direct writes and
+# buffered ones may arrive out of order. Positions record whether they count
+# as completed with the current episode length, see `apps.episodes.stats`
+UPSERT_SQL = """
+INSERT INTO {timestamps}
+    (user_id, episode_id, "timestamp", created_at, updated_at, completed)
+SELECT report.user_id, report.episode_id, report.timestamp, report.updated_at,
+    report.updated_at,
+    COALESCE(
+        episode.episode_length > 0
+        AND report.timestamp >= episode.episode_length * %s,
+        FALSE
+    )
+FROM (VALUES {values}) AS report (user_id, episode_id, timestamp, updated_at)
+JOIN {episodes} AS episode ON episode.id = report.episode_id
+JOIN {users} AS account ON account.id = report.user_id
+ON CONFLICT (user_id, episode_id) DO UPDATE
+SET "timestamp" = EXCLUDED."timestamp",
+    updated_at = EXCLUDED.updated_at,
+    completed = EXCLUDED.completed
+WHERE {timestamps}.updated_at < EXCLUDED.updated_at
+RETURNING user_id, episode_id, "timestamp", updated_at, completed
+"""
+
+
+class Progress(TypedDict):
+    # Seconds into the episode
+    timestamp: int
+    updated_at: datetime.datetime
+
+
+# Progress by `(user pk, episode pk)`
+Reports = dict[tuple[int, int], Progress]
+
+
+def upsert_progress(reports: Reports, batch_size: int = 1000) -> int:
+    """
+    Write `reports` with `INSERT ... ON CONFLICT` upserts, `batch_size` rows a statement.
+
+    Reports of deleted users or episodes are skipped. The watch statistics of the
+    users follow the written rows. Returns the number of rows written.
+    """
+    quote = connection.ops.quote_name
+    items = list(reports.items())
+    written = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        lock_users(cursor, {user for user, _ in reports})
+        for start in range(0, len(items), batch_size):
+            batch = items[start : start + batch_size]
+            sql = UPSERT_SQL.format(
+                timestamps=quote(EpisodeTimestampModel._meta.db_table),
+                episodes=quote(EpisodeModel._meta.db_table),
+                users=quote(CustomUser._meta.db_table),
+                values=", ".join(
+                    ["(%s::bigint, %s::bigint, %s::integer, %s::timestamptz)"] * len(batch)
+                ),
+            )
+            params = [COMPLETED_RATIO] + [
+                value
+                for (user, episode), progress in batch
+                for value in (user, episode, progress["timestamp"], progress["updated_at"])
+            ]
+            previous = stored_positions(pair for pair, _ in batch)
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+            update_stats(cursor, previous, rows)
+            written += len(rows)
+    return written
+
+
+def report_progress(user: CustomUser, episode: int, timestamp: int) -> Progress:
+    """
+    Record the playback position of `user` in `episode`.
+
+    With `WATCH_PROGRESS_BUFFER` only the latest position is kept in Redis until
+    `flush_progress` writes it, otherwise or without Redis it is written right away.
+    """
+    progress = Progress(timestamp=timestamp, updated_at=timezone.now())
+    if settings.WATCH_PROGRESS_BUFFER:
+        try:
+            get_redis().hset(
+                PROGRESS_KEY,
+                f"{user.pk}:{episode}",
+                f"{timestamp}:{progress['updated_at'].timestamp()}",
+            )
+            return progress
+        except RedisError:
+            logger.warning("Progress buffer is unavailable, writing the position directly")
+    upsert_progress({(user.pk, episode): progress})
+    return progress
+
+
+def parse_reports(values: Iterable[bytes | None]) -> Reports:
+    """`Reports` of a flat `HGETALL` or `HMGET` reply of field and value pairs."""
+    reports: Reports = {}
+    items = iter(values)
+    for field, value in zip(items, items):
+        if value is None:
+            continue
+        user, _, episode = field.decode().partition(":")
+        timestamp, _, reported_at = value.decode().partition(":")
+        reports[int(user), int(episode)] = Progress(
+            timestamp=int(timestamp),
+            updated_at=datetime.datetime.fromtimestamp(float(reported_at), datetime.UTC),
+        )
+    return reports
+
+
+def flush_progress(batch_size: int = 1000) -> int:
+    """
+    Write the buffered positions, in one transaction.
+
+    The buffer is swapped out atomically, positions reported during the flush go
+    to a fresh one. Returns the number of rows written.
+    """
+    redis = get_redis()
+    reports = parse_reports(redis.eval(TAKE_SCRIPT, 2, PROGRESS_KEY, FLUSHING_KEY))
+    if not reports:
+        return 0
+    written = upsert_progress(reports, batch_size)
+    # Flushing these again is harmless, older reports never win
+    redis.delete(FLUSHING_KEY)
+    return written
+
+
+def buffered_progress(user: CustomUser, episodes: Iterable[int]) -> dict[int, Progress]:
+    """Positions of `user` in `episodes` that are still in the buffer, by episode pk."""
+    if not settings.WATCH_PROGRESS_BUFFER:
+        return {}
+    fields = [f"{user.pk}:{episode}" for episode in episodes]
+    if not fields:
+        return {}
+    try:
+        with get_redis().pipeline(transaction=False) as pipeline:
+            pipeline.hmget(FLUSHING_KEY, fields)
+            pipeline.hmget(PROGRESS_KEY, fields)
+            replies = pipeline.execute()
+    except RedisError:
+        logger.warning("Progress buffer is unavailable, serving the stored positions")
+        return {}
+
+    progress: dict[int, Progress] = {}
+    for values in replies:
+        pairs = [
+            item for pair in zip(fields, values) for item in (pair[0].encode(), pair[1])
+        ]
+        # The live buffer comes last, it is newer than the one being flushed
+        for (_, episode), report in parse_reports(pairs).items():
+            progress[episode] = report
+    return progress
+
+
+def merge_progress(
+    stored: dict[int, Progress], buffered: dict[int, Progress]
+) -> dict[int, Progress]:
+    """The newest position of every episode, stored or buffered."""
+    merged = dict(stored)
+    for episode, progress in buffered.items():
+        if episode not in merged or merged[episode]["updated_at"] < progress["updated_at"]:
+            merged[episode] = progress
+    return merged
@@ -0,0 +1,187 @@
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+import datetime
+
+from django.db import connection, transaction
+from django.db.backends.utils import CursorWrapper
+
+from .models import (
+    EpisodeModel,
+    EpisodeTimestampModel,
+    WatchHistogramModel,
+    WatchStatsModel,
+)
+
+# Share of its length an episode has to be watched to count as completed
+COMPLETED_RATIO = 0.9
+
+# Position of a user in an episode, `(timestamp, updated_at, completed)`
+Position = tuple[int, datetime.datetime, bool]
+# Written positions, `(user pk, episode pk, timestamp, updated_at, completed)`
+Written = tuple[int, int, int, datetime.datetime, bool]
+
+# Positions and rollups of a user change together, writers of a user are serialized.
+# The keys are sorted, concurrent writers always lock in the same order
+LOCK_SQL = """
+SELECT pg_advisory_xact_lock(hashtextextended('watch_stats:' || pk, 0))
+FROM unnest(%s::bigint[]) AS pk
+"""
+
+STATS_SQL = """
+INSERT INTO {stats} (user_id, total_watchtime, episodes_completed, updated_at)
+VALUES {values}
+ON CONFLICT (user_id) DO UPDATE
+SET total_watchtime = {stats}.total_watchtime + EXCLUDED.total_watchtime,
+    episodes_completed = {stats}.episodes_completed + EXCLUDED.episodes_completed,
+    updated_at = EXCLUDED.updated_at
+"""
+
+HISTOGRAM_SQL = """
+INSERT INTO {histogram} (user_id, month, count, watchtime)
+VALUES {values}
+ON CONFLICT (user_id, month) DO UPDATE
+SET count = {histogram}.count + EXCLUDED.count,
+    watchtime = {histogram}.watchtime + EXCLUDED.watchtime
+"""
+
+# Positions of episodes whose length changed since they were written follow it
+REBUILD_COMPLETED_SQL = """
+UPDATE {timestamps} AS position
+SET completed = COALESCE(
+    episode.episode_length > 0 AND position."timestamp" >= episode.episode_length * %s,
+    FALSE
+)
+FROM {episodes} AS episode
+WHERE episode.id = position.episode_id AND position.user_id = ANY(%s)
+"""
+
+REBUILD_STATS_SQL = """
+INSERT INTO {stats} (user_id, total_watchtime, episodes_completed, updated_at)
+SELECT user_id, SUM("timestamp"), COUNT(*) FILTER (WHERE completed), NOW()
+FROM {timestamps}
+WHERE user_id = ANY(%s)
+GROUP BY user_id
+"""
+
+REBUILD_HISTOGRAM_SQL = """
+INSERT INTO {histogram} (user_id, month, count, watchtime)
+SELECT user_id, date_trunc('month', updated_at AT TIME ZONE 'UTC')::date, COUNT(*),
+    SUM("timestamp")
+FROM {timestamps}
+WHERE user_id = ANY(%s)
+GROUP BY 1, 2
+"""
+
+
+def month_of(moment: datetime.datetime) -> datetime.date:
+    return moment.astimezone(datetime.UTC).date().replace(day=1)
+
+
+def lock_users(cursor: CursorWrapper, users: Iterable[int]) -> None:
+    cursor.execute(LOCK_SQL, [sorted(set(users))])
+
+
+def stored_positions(pairs: Iterable[tuple[int, int]]) -> dict[tuple[int, int], Position]:
+    """Stored positions of the `(user pk, episode pk)` pairs, lock the users first."""
+    pairs = set(pairs)
+    rows = EpisodeTimestampModel.objects.filter(
+        user__in={user for user, _ in pairs},
+        episode__in={episode for _, episode in pairs},
+    ).values_list("user", "episode", "timestamp", "updated_at", "completed")
+    return {
+        (user, episode): (timestamp, updated_at, completed)
+        for user, episode, timestamp, updated_at, completed in rows
+        if (user, episode) in pairs
+    }
+
+
+def stat_deltas(
+    previous: dict[tuple[int, int], Position],
+    written: Iterable[Written],
+) -> tuple[dict[int, list[int]], dict[tuple[int, datetime.date], list[int]]]:
+    """
+    Changes of the rollups when `written` replace the `previous` positions.
+
+    A replaced position takes back what it added, whatever the length of its
+    episode is by now. Returns `[watchtime, completed]` by user and
+    `[count, watchtime]` by user and month.
+    """
+    totals: dict[int, list[int]] = defaultdict(lambda: [0, 0])
+    months: dict[tuple[int, datetime.date], list[int]] = defaultdict(lambda: [0, 0])
+
+    def add(user: int, position: Position, sign: int) -> None:
+        timestamp, updated_at, completed = position
+        totals[user][0] += sign * timestamp
+        totals[user][1] += sign * completed
+        month = months[user, month_of(updated_at)]
+        month[0] += sign
+        month[1] += sign * timestamp
+
+    for user, episode, timestamp, updated_at, completed in written:
+        if old := previous.get((user, episode)):
+            add(user, old, -1)
+        add(user, (timestamp, updated_at, completed), 1)
+    return totals, months
+
+
+def update_stats(
+    cursor: CursorWrapper,
+    previous: dict[tuple[int, int], Position],
+    written: Sequence[Written],
+) -> None:
+    """Add the changes of `written` positions to the rollups, lock the users first."""
+    if not written:
+        return
+    quote = connection.ops.quote_name
+    totals, months = stat_deltas(previous, written)
+
+    now = datetime.datetime.now(datetime.UTC)
+    cursor.execute(
+        STATS_SQL.format(
+            stats=quote(WatchStatsModel._meta.db_table),
+            values=", ".join(["(%s, %s, %s, %s)"] * len(totals)),
+        ),
+        [
+            value
+            for user, (watchtime, completed) in totals.items()
+            for value in (user, watchtime, completed, now)
+        ],
+    )
+    cursor.execute(
+        HISTOGRAM_SQL.format(
+            histogram=quote(WatchHistogramModel._meta.db_table),
+            values=", ".join(["(%s, %s::date, %s, %s)"] * len(months)),
+        ),
+        [
+            value
+            for (user, month), (count, watchtime) in months.items()
+            for value in (user, month, count, watchtime)
+        ],
+    )
+    # Months whose positions all moved to a later month
+    WatchHistogramModel.objects.filter(user__in=totals, count__lte=0).delete()
+
+
+def rebuild_stats(users: Sequence[int]) -> None:
+    """
+    Recompute the rollups of `users` from their stored positions.
+
+    The rollups follow the writes of positions, only positions removed along
+    with their episode, changed bypassing `apps.episodes.progress` or of
+    episodes whose length changed need it.
+    """
+    quote = connection.ops.quote_name
+    tables = {
+        "stats": quote(WatchStatsModel._meta.db_table),
+        "histogram": quote(WatchHistogramModel._meta.db_table),
+        "timestamps": quote(EpisodeTimestampModel._meta.db_table),
+        "episodes": quote(EpisodeModel._meta.db_table),
+    }
+    users = list(users)
+    with transaction.atomic(), connection.cursor() as cursor:
+        lock_users(cursor, users)
+        WatchStatsModel.objects.filter(user__in=users).delete()
+        WatchHistogramModel.objects.filter(user__in=users).delete()
+        cursor.execute(REBUILD_COMPLETED_SQL.format(**tables), [COMPLETED_RATIO, users])
+        cursor.execute(REBUILD_STATS_SQL.format(**tables), [users])
+        cursor.execute(REBUILD_HISTOGRAM_SQL.format(**tables), [users])
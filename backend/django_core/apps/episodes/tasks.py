@@ -0,0 +1,15 @@
+from apps.api.cache import redis_lock
+from celery import shared_task
+
+from .progress import flush_progress
+
+# A flush blocks the next one for this long at most, held in the Redis of the buffer
+FLUSH_PROGRESS_LOCK_SECONDS = 5 * 60
+FLUSH_PROGRESS_KEY = "episodes:progress:flush_lock"
+
+
+@shared_task(ignore_result=True)
+def flush_watch_progress() -> int:
+    """Write the playback positions buffered in Redis to `EpisodeTimestampModel`."""
+    with redis_lock(FLUSH_PROGRESS_KEY, FLUSH_PROGRESS_LOCK_SECONDS) as acquired:
+        return flush_progress() if acquired else 0
@@ -29,5 +29,9 @@ class ProducerModel(CreatedAtMixin, UpdatedAtMixin, IsLockedMixin):
         return f"{self.pk}. {self.name} | Mal_id : {self.mal_id}"
 
     class Meta:
+        indexes = [
+            # Keyset pagination, see `apps.api.pagination.CursorPagination`
+            models.Index(fields=["updated_at", "id"], name="producer_updated_at_id_idx"),
+        ]
         verbose_name = "Producer"
         verbose_name_plural = "Producers"
@@ -0,0 +1,13 @@
+from django.contrib import admin
+
+from .models import SearchEntryModel
+
+# Register your models here.
+
+
+@admin.register(SearchEntryModel)
+class SearchEntryAdmin(admin.ModelAdmin[SearchEntryModel]):
+    list_display = ["name", "kind", "object_id"]
+    list_filter = ["kind"]
+    search_fields = ["name"]
+    readonly_fields = ["kind", "object_id", "name", "document"]
@@ -0,0 +1,337 @@
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable
+import heapq
+import logging
+import pickle
+import re
+import threading
+import time
+from typing import Any, NamedTuple, Self
+import unicodedata
+import zlib
+
+from apps.anime.models import AnimeModel
+from apps.api.cache import get_redis
+from apps.episodes.models import EpisodeTimestampModel
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from redis import RedisError
+
+logger = logging.getLogger("django")
+
+SNAPSHOT_KEY = "search:autocomplete:snapshot"
+# Bumped along with every snapshot, workers only download a new one
+VERSION_KEY = "search:autocomplete:version"
+# Set of anime pks changed since the last update of the snapshot
+DIRTY_KEY = "search:autocomplete:dirty"
+# Pks an update took, a failed update leaves them here for the next one
+UPDATING_KEY = "search:autocomplete:updating"
+
+# KEYS: dirty, updating
+TAKE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return {}
+    end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('SMEMBERS', KEYS[2])
+"""
+
+MAX_LIMIT = 20
+# Prefixes this short match most of the catalogue, their results are ranked ahead
+TOP_PREFIX_LENGTH = 2
+# Upper bound of every string starting with a prefix
+LAST_CHARACTER = "\U0010ffff"
+
+
+class Row(NamedTuple):
+    pk: int
+    title: str
+    # Users watching the anime
+    weight: int
+    # Normalized names the anime is found by
+    names: list[str]
+
+
+def normalize(text: str) -> str:
+    """Casefolded words of `text` without accents, separated by single spaces."""
+    # Only Latin letters lose their marks, the dakuten of kana tell words apart
+    characters = []
+    latin = False
+    for character in unicodedata.normalize("NFKD", text.casefold()):
+        if not unicodedata.combining(character):
+            latin = unicodedata.name(character, "").startswith("LATIN")
+        elif latin:
+            continue
+        characters.append(character)
+    text = unicodedata.normalize("NFC", "".join(characters))
+    return " ".join(re.findall(r"\w+", text))
+
+
+class PrefixIndex:
+    """
+    Anime by the prefixes of the words of their names, immutable.
+
+    Every word of a name starts a suffix of it, the suffixes are sorted so the
+    ones starting with a prefix are a range found by bisection. The best anime of
+    the shortest prefixes, whose ranges span most of the catalogue, are ranked
+    when the index is loaded.
+    """
+
+    def __init__(
+        self,
+        pks: array,
+        titles: list[str],
+        weights: array,
+        names: list[str],
+        owners: array,
+        suffixes: array,
+        top: dict[str, list[int]] | None = None,
+    ) -> None:
+        self.pks = pks
+        self.titles = titles
+        self.weights = weights
+        self.names = names
+        # Anime of every name
+        self.owners = owners
+        # `<name> << 16 | <offset>` of every suffix, by the text of the suffix
+        self.suffixes = suffixes
+        # Best anime of every prefix up to `TOP_PREFIX_LENGTH`, ranked once by
+        # the task building the index rather than by every worker loading it
+        self.top = self.rank_top() if top is None else top
+
+    def rank_top(self) -> dict[str, list[int]]:
+        top: dict[str, set[int]] = defaultdict(set)
+        for code in self.suffixes:
+            suffix = self.suffix(code)
+            for length in range(1, TOP_PREFIX_LENGTH + 1):
+                top[suffix[:length]].add(self.owners[code >> 16])
+        return {
+            prefix: heapq.nsmallest(MAX_LIMIT, anime, key=self.rank)
+            for prefix, anime in top.items()
+        }
+
+    @classmethod
+    def build(cls, rows: Iterable[Row]) -> Self:
+        pks, weights, owners = array("q"), array("q"), array("I")
+        titles: list[str] = []
+        names: list[str] = []
+        for anime, row in enumerate(rows):
+            pks.append(row.pk)
+            titles.append(row.title)
+            weights.append(row.weight)
+            for name in row.names:
+                names.append(name)
+                owners.append(anime)
+
+        codes = [
+            index << 16 | offset
+            for index, name in enumerate(names)
+            for offset in [0, *(match.end() for match in re.finditer(" ", name))]
+        ]
+        codes.sort(key=lambda code: names[code >> 16][code & 0xFFFF :])
+        return cls(pks, titles, weights, names, owners, array("Q", codes))
+
+    def rows(self) -> Iterable[Row]:
+        names: list[list[str]] = [[] for _ in self.pks]
+        for name, anime in zip(self.names, self.owners):
+            names[anime].append(name)
+        for anime, pk in enumerate(self.pks):
+            yield Row(pk, self.titles[anime], self.weights[anime], names[anime])
+
+    def update(self, rows: Iterable[Row], pks: Iterable[int]) -> Self:
+        """A copy where the anime `pks` are replaced by `rows`, missing ones are removed."""
+        pks = set(pks)
+        kept = [row for row in self.rows() if row.pk not in pks]
+        return self.build([*kept, *rows])
+
+    def suffix(self, code: int) -> str:
+        return self.names[code >> 16][code & 0xFFFF :]
+
+    def rank(self, anime: int) -> tuple[int, int, int]:
+        # Popular first, then the shorter and older title
+        return (-self.weights[anime], len(self.titles[anime]), self.pks[anime])
+
+    def complete(self, query: str, limit: int) -> list[tuple[int, str]]:
+        """The best `limit` anime with a name word starting with `query`, as pk and title."""
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        if len(prefix) <= TOP_PREFIX_LENGTH:
+            anime = self.top.get(prefix, [])[:limit]
+        else:
+            start = bisect_left(self.suffixes, prefix, key=self.suffix)
+            end = bisect_left(self.suffixes, prefix + LAST_CHARACTER, key=self.suffix)
+            anime = heapq.nsmallest(
+                limit,
+                {self.owners[code >> 16] for code in self.suffixes[start:end]},
+                key=self.rank,
+            )
+        return [(self.pks[index], self.titles[index]) for index in anime]
+
+    def dumps(self) -> bytes:
+        return zlib.compress(
+            pickle.dumps(
+                (
+                    self.pks,
+                    self.titles,
+                    self.weights,
+                    self.names,
+                    self.owners,
+                    self.suffixes,
+                    self.top,
+                )
+            )
+        )
+
+    @classmethod
+    def loads(cls, snapshot: bytes) -> Self:
+        return cls(*pickle.loads(zlib.decompress(snapshot)))
+
+
+def load_rows(pks: Iterable[int] | None = None) -> list[Row]:
+    """Names and popularity of the anime `pks`, or of every anime."""
+    watchers = (
+        EpisodeTimestampModel.objects.filter(episode__animemodel=OuterRef("pk"))
+        .order_by()
+        .values("episode__animemodel")
+        .annotate(count=Count("user", distinct=True))
+        .values("count")
+    )
+    synonyms = AnimeModel.name_synonyms.through.objects.filter(
+        animemodel=OuterRef("pk")
+    ).values("animenamesynonymmodel__name")
+    anime = AnimeModel.objects.annotate(
+        synonyms=ArraySubquery(synonyms),
+        watchers=Coalesce(Subquery(watchers), 0),
+    )
+    if pks is not None:
+        anime = anime.filter(pk__in=list(pks))
+
+    rows = []
+    for pk, name, name_japanese, synonyms, watchers in anime.values_list(
+        "pk", "name", "name_japanese", "synonyms", "watchers"
+    ):
+        names = {normalize(text) for text in (name, name_japanese, *synonyms)}
+        names.discard("")
+        rows.append(Row(pk, name, watchers, sorted(names)))
+    return rows
+
+
+def store_snapshot(index: PrefixIndex) -> int:
+    """Publish `index` to every worker. Returns its version."""
+    with get_redis().pipeline() as pipeline:
+        pipeline.set(SNAPSHOT_KEY, index.dumps())
+        pipeline.incr(VERSION_KEY)
+        _, version = pipeline.execute()
+    return version
+
+
+def rebuild_snapshot() -> int:
+    """Build the index of the whole catalogue. Returns the number of anime."""
+    # Anime changed from now on are queued again, the ones before are in the rows
+    get_redis().delete(DIRTY_KEY, UPDATING_KEY)
+    index = PrefixIndex.build(load_rows())
+    store_snapshot(index)
+    return len(index.pks)
+
+
+def update_snapshot() -> int:
+    """
+    Replace the anime changed since the last update in the stored index.
+
+    Builds the whole index if there is none yet. Returns the number of anime updated.
+    """
+    redis = get_redis()
+    snapshot = redis.get(SNAPSHOT_KEY)
+    if snapshot is None:
+        return rebuild_snapshot()
+    pks = [int(pk) for pk in redis.eval(TAKE_SCRIPT, 2, DIRTY_KEY, UPDATING_KEY)]
+    if not pks:
+        return 0
+    store_snapshot(PrefixIndex.loads(snapshot).update(load_rows(pks), pks))
+    redis.delete(UPDATING_KEY)
+    return len(pks)
+
+
+def mark_changed(pks: Iterable[Any]) -> None:
+    """Queue the anime `pks` for the next `update_snapshot`."""
+    if not (pks := list(pks)):
+        return
+    try:
+        get_redis().sadd(DIRTY_KEY, *pks)
+    except RedisError:
+        # Picked up by the nightly rebuild
+        logger.warning("Autocomplete queue is unavailable, anime %s are not updated", pks)
+
+
+class SharedIndex:
+    """The latest snapshot, checked for a newer one every `AUTOCOMPLETE_REFRESH_SECONDS`."""
+
+    def __init__(self) -> None:
+        self.index: PrefixIndex | None = None
+        self.version: bytes | None = None
+        self.checked_at = -float("inf")
+        self.lock = threading.Lock()
+
+    def get(self) -> PrefixIndex | None:
+        """The loaded index, `None` while there is no snapshot to load."""
+        if self.index is None:
+            # A fresh worker has nothing to answer from, requests wait for the first load
+            with self.lock:
+                if self.index is None:
+                    self.checked_at = time.monotonic()
+                    self.load()
+            return self.index
+
+        # Loading a snapshot takes a while, a single thread loads newer ones in
+        # the background and requests keep answering from the current index
+        now = time.monotonic()
+        if now - self.checked_at >= settings.AUTOCOMPLETE_REFRESH_SECONDS and (
+            self.lock.acquire(blocking=False)
+        ):
+            self.checked_at = now
+            threading.Thread(target=self.refresh, daemon=True).start()
+        return self.index
+
+    def load(self) -> None:
+        try:
+            redis = get_redis()
+            if redis.get(VERSION_KEY) == self.version:
+                return
+            with redis.pipeline() as pipeline:
+                pipeline.get(VERSION_KEY)
+                pipeline.get(SNAPSHOT_KEY)
+                version, snapshot = pipeline.execute()
+            if snapshot is not None:
+                self.index, self.version = PrefixIndex.loads(snapshot), version
+        except RedisError:
+            logger.warning("Autocomplete snapshot is unavailable, serving the loaded one")
+
+    def refresh(self) -> None:
+        try:
+            self.load()
+        finally:
+            self.lock.release()
+
+
+shared_index = SharedIndex()
+
+
+class IndexNotLoaded(Exception):
+    """No snapshot was loaded in this process yet."""
+
+
+def complete(query: str, limit: int) -> list[tuple[int, str]]:
+    """
+    :raises IndexNotLoaded: until the first snapshot is loaded, an empty index
+        would answer every query with no anime
+    """
+    if (index := shared_index.get()) is None:
+        raise IndexNotLoaded
+    return index.complete(query, limit)
@@ -0,0 +1,112 @@
+from collections.abc import Iterable
+from typing import Any, TypedDict
+
+from apps.anime.models import AnimeModel
+from apps.characters.models import CharacterModel
+from apps.producers.models import ProducerModel
+from apps.staffs.models import StaffModel
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import models
+from django.db.models import (
+    Expression,
+    F,
+    Func,
+    OuterRef,
+    Subquery,
+    TextField,
+    Value,
+    Window,
+)
+from django.db.models.functions import RowNumber
+
+from .models import SearchEntryModel
+
+
+class SearchResult(TypedDict):
+    kind: str
+    object_id: int
+    name: str
+    score: float
+
+
+def concat(*expressions: Any) -> Func:
+    # `concat_ws` skips NULLs
+    return Func(Value(" "), *expressions, function="CONCAT_WS", output_field=TextField())
+
+
+staff_alternate_names = Subquery(
+    StaffModel.alternate_names.through.objects.filter(staffmodel=OuterRef("pk"))
+    .order_by()
+    .values("staffmodel")
+    .annotate(names=StringAgg("staffalternatenamemodel__name", delimiter=" "))
+    .values("names")
+)
+
+# Model and document of every kind
+SOURCES: dict[str, tuple[type[models.Model], Expression]] = {
+    # Already joined for the anime search, see `AnimeQuerySet.refresh_search_document`
+    "anime": (AnimeModel, F("search_document")),
+    "character": (CharacterModel, concat(F("name"), F("name_kanji"))),
+    "staff": (
+        StaffModel,
+        concat(F("name"), F("given_name"), F("family_name"), staff_alternate_names),
+    ),
+    "producer": (ProducerModel, concat(F("name"), F("name_japanese"))),
+}
+
+KINDS = {model: kind for kind, (model, _) in SOURCES.items()}
+
+
+def refresh_entries(kind: str, pks: Iterable[Any], batch_size: int = 1000) -> int:
+    """
+    Upsert the entries of the `kind` entities `pks`, removing the ones that are gone.
+
+    Returns the number of entries written.
+    """
+    model, document = SOURCES[kind]
+    pks = set(pks)
+    rows = (
+        model._default_manager.filter(pk__in=pks)
+        .annotate(entry_document=document)
+        .values_list("pk", "name", "entry_document")
+    )
+    entries = [
+        SearchEntryModel(kind=kind, object_id=pk, name=name, document=text or name)
+        for pk, name, text in rows
+    ]
+    SearchEntryModel.objects.bulk_create(
+        entries,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=["kind", "object_id"],
+        update_fields=["name", "document"],
+    )
+    if gone := pks - {entry.object_id for entry in entries}:
+        SearchEntryModel.objects.filter(kind=kind, object_id__in=gone).delete()
+    return len(entries)
+
+
+def search_entries(query: str, kinds: Iterable[str], limit: int) -> list[SearchResult]:
+    """
+    The `limit` best matches of `query` of every kind, best first, in one query.
+
+    Only entries passing the word similarity threshold are ranked, the trigram
+    index finds them without a scan of the table.
+    """
+    return list(
+        SearchEntryModel.objects.filter(
+            document__trigram_word_similar=query, kind__in=list(kinds)
+        )
+        .annotate(
+            score=TrigramWordSimilarity(query, "document"),
+            rank=Window(
+                RowNumber(),
+                partition_by=F("kind"),
+                order_by=(F("score").desc(), F("object_id").asc()),
+            ),
+        )
+        .filter(rank__lte=limit)
+        .order_by("kind", "rank")
+        .values("kind", "object_id", "name", "score")
+    )
@@ -0,0 +1,30 @@
+from typing import Any
+
+from apps.search.index import SOURCES, refresh_entries
+from apps.search.models import SearchEntryModel
+from django.core.management.base import BaseCommand, CommandParser
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search entries of every anime, character, staff and producer"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Entities written per statement",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size: int = options["batch_size"]
+        for kind, (model, _) in SOURCES.items():
+            pks = list(model._default_manager.order_by("pk").values_list("pk", flat=True))
+            written = 0
+            for start in range(0, len(pks), batch_size):
+                written += refresh_entries(
+                    kind, pks[start : start + batch_size], batch_size
+                )
+            # Entries of entities deleted while the signals were not connected
+            SearchEntryModel.objects.filter(kind=kind).exclude(object_id__in=pks).delete()
+            self.stdout.write(self.style.SUCCESS(f"Indexed {written} {kind} entries"))
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:47
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='SearchEntryModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('anime', 'anime'), ('character', 'character'), ('staff', 'staff'), ('producer', 'producer')], max_length=10)),
+                ('object_id', models.BigIntegerField()),
+                ('name', models.CharField(max_length=1024)),
+                ('document', models.TextField()),
+            ],
+            options={
+                'verbose_name': 'Search Entry',
+                'verbose_name_plural': 'Search Entries',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['document'], name='search_entry_document_idx', opclasses=['gin_trgm_ops'])],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='search_entry_kind_object_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+# Create your models here.
+SEARCH_KINDS = [
+    ("anime", "anime"),
+    ("character", "character"),
+    ("staff", "staff"),
+    ("producer", "producer"),
+]
+
+
+class SearchEntryModel(models.Model):
+    kind = models.CharField(max_length=10, choices=SEARCH_KINDS)
+    # Primary key of the entity in the model of `kind`
+    object_id = models.BigIntegerField()
+    # Shown in the results
+    name = models.CharField(max_length=1024)
+    # Every name the entity can be found by.
+    # Maintained by signals, see `apps.search.index`
+    document = models.TextField()
+
+    def __str__(self) -> str:
+        return f"{self.kind} | {self.name}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"], name="search_entry_kind_object_unique"
+            ),
+        ]
+        indexes = [
+            GinIndex(
+                fields=["document"],
+                name="search_entry_document_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
+        verbose_name = "Search Entry"
+        verbose_name_plural = "Search Entries"
@@ -0,0 +1,117 @@
+from collections.abc import Iterable
+from functools import partial
+from typing import Any, TypedDict, Unpack
+
+from apps.anime.ingestion import anime_bulk_ingested
+from apps.sync.pipeline import rows_synced
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from .autocomplete import mark_changed
+from .index import KINDS, refresh_entries
+
+# Names living in their own model, the entities they belong to are searched by them
+NAME_FIELDS = {
+    "anime.AnimeNameSynonymModel": ("anime.AnimeModel", "name_synonyms"),
+    "staffs.StaffAlternateNameModel": ("staffs.StaffModel", "alternate_names"),
+}
+
+
+class DjangoInstance(TypedDict):
+    instance: models.Model
+
+
+class DjangoM2MChanged(TypedDict):
+    instance: models.Model
+    action: str
+    reverse: bool
+    pk_set: set[Any] | None
+
+
+class RowsChanged(TypedDict):
+    created: set[int]
+    updated: set[int]
+
+
+def refresh(kind: str, pks: Iterable[Any]) -> None:
+    refresh_entries(kind, pks)
+    if kind == "anime":
+        mark_changed(pks)
+
+
+def refresh_later(model: type[models.Model], pks: Iterable[Any]) -> None:
+    # Other handlers of the save may still change the document, the anime one does
+    if pks := list(pks):
+        transaction.on_commit(partial(refresh, KINDS[model], pks))
+
+
+def instance_handler(sender: type[models.Model], **kwargs: Unpack[DjangoInstance]) -> None:
+    refresh_later(sender, [kwargs["instance"].pk])
+
+
+def name_handler(
+    owner: type[models.Model], field: str, **kwargs: Unpack[DjangoInstance]
+) -> None:
+    # Before a delete, the relations to the owners are still there
+    refresh_later(
+        owner,
+        owner._default_manager.filter(**{field: kwargs["instance"]}).values_list(
+            "pk", flat=True
+        ),
+    )
+
+
+def m2m_handler(
+    owner: type[models.Model], field: str, **kwargs: Unpack[DjangoM2MChanged]
+) -> None:
+    instance, action = kwargs["instance"], kwargs["action"]
+    if not kwargs["reverse"]:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_later(owner, [instance.pk])
+        return
+
+    # Reverse side, `instance` is a name and `pk_set` holds owners
+    match action:
+        case "pre_clear":
+            # `pk_set` is not provided on clear
+            name_handler(owner, field, instance=instance)
+        case "post_add" | "post_remove":
+            refresh_later(owner, kwargs["pk_set"] or [])
+
+
+def rows_changed_handler(sender: type[models.Model], **kwargs: Unpack[RowsChanged]) -> None:
+    # Sent once the rows are committed
+    if sender in KINDS:
+        refresh(KINDS[sender], kwargs["created"] | kwargs["updated"])
+
+
+def connect_signals() -> None:
+    for model in KINDS:
+        label = model._meta.label
+        post_save.connect(
+            instance_handler, sender=model, dispatch_uid=f"search_save_{label}"
+        )
+        post_delete.connect(
+            instance_handler, sender=model, dispatch_uid=f"search_delete_{label}"
+        )
+
+    for label, (owner_label, field) in NAME_FIELDS.items():
+        model, owner = apps.get_model(label), apps.get_model(owner_label)
+        handler = partial(name_handler, owner, field)
+        post_save.connect(
+            handler, sender=model, weak=False, dispatch_uid=f"search_save_{label}"
+        )
+        # Through rows are deleted without `m2m_changed`
+        pre_delete.connect(
+            handler, sender=model, weak=False, dispatch_uid=f"search_delete_{label}"
+        )
+        m2m_changed.connect(
+            partial(m2m_handler, owner, field),
+            sender=getattr(owner, field).through,
+            weak=False,
+            dispatch_uid=f"search_m2m_{label}",
+        )
+
+    anime_bulk_ingested.connect(rows_changed_handler, dispatch_uid="search_bulk_ingested")
+    rows_synced.connect(rows_changed_handler, dispatch_uid="search_rows_synced")
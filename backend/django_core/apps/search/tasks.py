@@ -0,0 +1,23 @@
+from apps.api.cache import redis_lock
+from celery import shared_task
+
+from .autocomplete import rebuild_snapshot, update_snapshot
+
+# An update or rebuild blocks the next one for this long at most, held in Redis
+# with the snapshot so workers on every host see it
+AUTOCOMPLETE_LOCK_SECONDS = 10 * 60
+AUTOCOMPLETE_LOCK_KEY = "search:autocomplete:lock"
+
+
+@shared_task(ignore_result=True)
+def update_autocomplete() -> int:
+    """Replace the changed anime in the autocomplete snapshot."""
+    with redis_lock(AUTOCOMPLETE_LOCK_KEY, AUTOCOMPLETE_LOCK_SECONDS) as acquired:
+        return update_snapshot() if acquired else 0
+
+
+@shared_task(ignore_result=True)
+def rebuild_autocomplete() -> int:
+    """Rebuild the autocomplete snapshot, refreshing the popularity of every anime."""
+    with redis_lock(AUTOCOMPLETE_LOCK_KEY, AUTOCOMPLETE_LOCK_SECONDS) as acquired:
+        return rebuild_snapshot() if acquired else 0
@@ -45,6 +45,8 @@ class StaffModel(CreatedAtMixin, UpdatedAtMixin, IsLockedMixin):
         null=True,
     )
     about = models.TextField(null=True, blank=True)
+    # Resized copies of the images in modern formats, see `apps.api.images`
+    image_derivatives = models.JSONField(default=dict, blank=True, editable=False)
 
     def __str__(self) -> str:
         return f"{self.pk}. {self.name}"
@@ -56,6 +58,8 @@ class StaffModel(CreatedAtMixin, UpdatedAtMixin, IsLockedMixin):
                 name="staff_name_idx",
                 opclasses=["gin_trgm_ops", "gin_trgm_ops", "gin_trgm_ops"],
             ),
+            # Keyset pagination, see `apps.api.pagination.CursorPagination`
+            models.Index(fields=["updated_at", "id"], name="staff_updated_at_id_idx"),
         ]
         verbose_name = "Staff | People"
         verbose_name_plural = "Staffs | Peoples"
@@ -0,0 +1,40 @@
+from functools import partial
+
+from apps.sync.pipeline import Source, SyncResult, run_sync
+from apps.sync.providers import anilist, kitsu, mal
+from celery import shared_task
+
+from .models import StaffModel
+
+
+@shared_task()
+def get_periodic_staff() -> dict[str, SyncResult]:
+    """Refresh staff, MyAnimeList creates them and the others fill in blanks."""
+    anilist_ids = sorted(
+        StaffModel.objects.exclude(anilist_id=None).values_list("anilist_id", flat=True)
+    )
+    return run_sync(
+        {
+            "mal": Source(
+                model=StaffModel,
+                provider="mal",
+                fetch=mal.people,
+                creates=True,
+                overwrites=True,
+            ),
+            "kitsu": Source(
+                model=StaffModel,
+                provider="kitsu",
+                fetch=kitsu.people,
+                creates=False,
+                overwrites=False,
+            ),
+            "anilist": Source(
+                model=StaffModel,
+                provider="anilist",
+                fetch=partial(anilist.staff, anilist_ids),
+                creates=False,
+                overwrites=False,
+            ),
+        }
+    )
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import SyncCheckpointModel
+
+# Register your models here.
+
+
+@admin.register(SyncCheckpointModel)
+class SyncCheckpointAdmin(admin.ModelAdmin[SyncCheckpointModel]):
+    list_display = ["name", "page", "started_at", "finished_at"]
+    readonly_fields = ["started_at", "finished_at"]
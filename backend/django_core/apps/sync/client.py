@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+from django.conf import settings
+import requests
+from requests_cache import CachedSession
+
+logger = logging.getLogger(__name__)
+
+# Answers worth another try, after `Retry-After` or a growing delay
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class ProviderError(Exception):
+    """An upstream request failed for good."""
+
+
+class RateLimiter:
+    """
+    Space requests `60 / requests_per_minute` seconds apart.
+
+    Slots are handed out in call order across every task of the event loop,
+    the limit holds per process and not across workers.
+    """
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self.interval = 60 / requests_per_minute
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        delay = self._next - now
+        self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ProviderClient:
+    """
+    HTTP client of an upstream provider in `settings.SYNC_PROVIDERS`.
+
+    Requests go through a `requests_cache` session on worker threads, so up to
+    `concurrency` of them are in flight while the event loop keeps scheduling.
+    Stored responses are revalidated with `If-None-Match` / `If-Modified-Since`,
+    a `304` comes back as the stored body flagged as unchanged.
+    """
+
+    def __init__(self, provider: str) -> None:
+        config = settings.SYNC_PROVIDERS[provider]
+        self.provider = provider
+        self.url = config["url"].rstrip("/")
+        self.concurrency: int = config.get("concurrency", 1)
+        self.timeout: float = config.get("timeout", 30)
+        self.retries: int = config.get("retries", 3)
+        self.limiter = RateLimiter(config["requests_per_minute"])
+        self.session = CachedSession(
+            **settings.SYNC_HTTP_CACHE,
+            cache_control=True,
+            # Cached until the provider says otherwise, and revalidated from then on
+            expire_after=0,
+            allowable_methods=("GET", "HEAD", "POST"),
+        )
+        self.session.headers.update(config.get("headers", {}))
+        self._slots = asyncio.Semaphore(self.concurrency)
+
+    def close(self) -> None:
+        self.session.close()
+
+    async def request(self, method: str, path: str = "", **kwargs: Any) -> tuple[Any, bool]:
+        """
+        JSON body of the response and whether it is unchanged since it was stored.
+
+        :raises ProviderError: if the request still fails after `retries`
+        """
+        url = f"{self.url}{path}"
+        for attempt in range(self.retries + 1):
+            async with self._slots:
+                await self.limiter.wait()
+                try:
+                    response = await asyncio.to_thread(
+                        self.session.request, method, url, timeout=self.timeout, **kwargs
+                    )
+                except requests.RequestException as e:
+                    error: str = str(e)
+                    delay = 2**attempt
+                else:
+                    if response.status_code not in RETRY_STATUSES:
+                        if not response.ok:
+                            raise ProviderError(
+                                f"{self.provider}: {method} {url} {response.status_code}"
+                            )
+                        return response.json(), getattr(response, "from_cache", False)
+                    error = str(response.status_code)
+                    # `Retry-After` may be a date as well, only seconds are honoured
+                    retry_after = response.headers.get("Retry-After", "")
+                    delay = int(retry_after) if retry_after.isdigit() else 2**attempt
+
+            if attempt < self.retries:
+                logger.warning(
+                    "%s: %s %s failed ( %s ), retrying", self.provider, method, url, error
+                )
+                await asyncio.sleep(delay)
+
+        raise ProviderError(f"{self.provider}: {method} {url} {error}")
+
+    async def get(self, path: str, params: dict[str, Any]) -> tuple[Any, bool]:
+        return await self.request("GET", path, params=params)
+
+    async def post(self, path: str, body: Any) -> tuple[Any, bool]:
+        return await self.request("POST", path, json=body)
@@ -0,0 +1,24 @@
+from django.db import models
+from mixins.models.updated_at import UpdatedAtMixin
+
+# Create your models here.
+
+
+class SyncCheckpointModel(UpdatedAtMixin):
+    # `<model label>:<provider>`, one checkpoint per synced source
+    name = models.CharField(unique=True, max_length=100)
+    # Last page whose rows were committed, a failed run resumes after it
+    page = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.name} ( page {self.page} )"
+
+    @property
+    def is_running(self) -> bool:
+        """A run started and did not finish, either in progress or failed."""
+        return self.started_at is not None and self.finished_at is None
+
+    class Meta:
+        verbose_name = "Sync Checkpoint"
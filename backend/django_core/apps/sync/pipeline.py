@@ -0,0 +1,229 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any, TypedDict
+
+from asgiref.sync import sync_to_async
+from django.db import connections, models, transaction
+from django.db.models import Q
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .client import ProviderClient
+from .models import SyncCheckpointModel
+from .providers import ID_FIELDS, Page
+
+logger = logging.getLogger(__name__)
+
+# Sent once per committed window of pages, bulk writes skip `post_save`
+rows_synced = Signal()
+
+
+class Source(TypedDict):
+    model: type[models.Model]
+    # Key of `settings.SYNC_PROVIDERS`
+    provider: str
+    # Fetches a page, numbered from 1
+    fetch: Callable[[ProviderClient, int], Awaitable[Page]]
+    # May create rows, otherwise only rows matched by an id are updated
+    creates: bool
+    # Owns the columns it returns, otherwise it only fills in blank ones
+    overwrites: bool
+
+
+class SyncResult(TypedDict):
+    pages: int
+    unchanged_pages: int
+    created: int
+    updated: int
+
+
+def _upsert(source: Source, records: list[dict[str, Any]]) -> tuple[set[int], set[int]]:
+    """
+    Diff `records` against the stored rows and write the difference in bulk.
+
+    Rows are matched on the id column of the provider, rows without one are
+    linked through `mal_id` when the provider knows it.
+    Locked rows are left alone and blank values are never written over stored ones.
+    Returns the created and the updated pks.
+    """
+    model, key = source["model"], ID_FIELDS[source["provider"]]
+    by_id = {record[key]: record for record in records}
+    links = {
+        record["mal_id"]
+        for record in by_id.values()
+        if key != "mal_id" and record.get("mal_id") is not None
+    }
+
+    stored = list(
+        model._default_manager.filter(Q(**{f"{key}__in": by_id}) | Q(mal_id__in=links))
+    )
+    by_key = {getattr(row, key): row for row in stored if getattr(row, key) is not None}
+    by_link = {row.mal_id: row for row in stored if getattr(row, key) is None}
+    stored_mal_ids = {row.mal_id for row in stored}
+
+    created, changed, update_fields = [], {}, set()
+    for value, record in by_id.items():
+        row = by_key.get(value) or by_link.pop(record.get("mal_id"), None)
+        if row is None:
+            # A `mal_id` taken by a row linked elsewhere would collide
+            if source["creates"] and record.get("mal_id") not in stored_mal_ids:
+                created.append(model(**record))
+            continue
+        if row.is_locked:
+            continue
+
+        for field, new in record.items():
+            old = getattr(row, field)
+            if old == new or (field == "mal_id" and old is not None):
+                continue
+            # Blanks never clear a value another provider filled in
+            if new in (None, "") or (
+                not source["overwrites"] and field != key and old not in (None, "")
+            ):
+                continue
+            setattr(row, field, new)
+            update_fields.add(field)
+            changed[row.pk] = row
+
+    model._default_manager.bulk_create(created)
+    if changed:
+        # `bulk_update` bypasses `auto_now`
+        now = timezone.now()
+        for row in changed.values():
+            row.updated_at = now
+        model._default_manager.bulk_update(
+            changed.values(), [*sorted(update_fields), "updated_at"]
+        )
+    return {row.pk for row in created}, set(changed)
+
+
+def _commit(
+    source: Source,
+    checkpoint: SyncCheckpointModel,
+    pages: list[tuple[int, Page]],
+    skip_unchanged: bool,
+) -> tuple[int, int]:
+    """Write a window of pages and move the checkpoint past it, in one transaction."""
+    records = [
+        record
+        for _, page in pages
+        if not (skip_unchanged and page["unchanged"])
+        for record in page["records"]
+    ]
+    with transaction.atomic():
+        created, updated = _upsert(source, records) if records else (set(), set())
+        checkpoint.page = pages[-1][0]
+        checkpoint.save(update_fields=["page", "updated_at"])
+        if created or updated:
+            transaction.on_commit(
+                lambda: rows_synced.send(
+                    sender=source["model"], created=created, updated=updated
+                )
+            )
+    return len(created), len(updated)
+
+
+def _start(name: str) -> tuple[SyncCheckpointModel, bool]:
+    """Checkpoint of `name`, reset unless its last run failed. Returns if it resumes."""
+    checkpoint, _ = SyncCheckpointModel.objects.get_or_create(name=name)
+    if checkpoint.is_running:
+        return checkpoint, True
+    checkpoint.page = 0
+    checkpoint.started_at = timezone.now()
+    checkpoint.finished_at = None
+    checkpoint.save()
+    return checkpoint, False
+
+
+def _finish(checkpoint: SyncCheckpointModel) -> None:
+    checkpoint.finished_at = timezone.now()
+    checkpoint.save(update_fields=["finished_at", "updated_at"])
+
+
+async def sync_source(name: str, source: Source, client: ProviderClient) -> SyncResult:
+    """
+    Fetch every page of `source` and upsert what changed.
+
+    Pages are fetched `client.concurrency` at a time and written a window at a time,
+    the checkpoint follows the last written page and a failed run resumes after it.
+    Unchanged pages of a creating source are skipped, except in a resumed run where
+    the previous run may have fetched them without writing them. Other sources never
+    skip them, their records may match rows created since they were last written.
+    """
+    checkpoint, resumed = await sync_to_async(_start)(
+        f"{source['model']._meta.label}:{name}"
+    )
+    if resumed:
+        logger.info("%s: resuming after page %s", checkpoint.name, checkpoint.page)
+    skip_unchanged = source["creates"] and not resumed
+
+    result = SyncResult(pages=0, unchanged_pages=0, created=0, updated=0)
+    number = checkpoint.page + 1
+    # The first page tells how many there are
+    window = [(number, await source["fetch"](client, number))]
+    while True:
+        last_page = window[-1][1]["last_page"]
+        created, updated = await sync_to_async(_commit)(
+            source, checkpoint, window, skip_unchanged
+        )
+        result["pages"] += len(window)
+        result["unchanged_pages"] += sum(page["unchanged"] for _, page in window)
+        result["created"] += created
+        result["updated"] += updated
+
+        start = window[-1][0] + 1
+        if start > last_page:
+            break
+        numbers = range(start, min(start + client.concurrency, last_page + 1))
+        pages = await asyncio.gather(*(source["fetch"](client, n) for n in numbers))
+        window = list(zip(numbers, pages))
+
+    await sync_to_async(_finish)(checkpoint)
+    return result
+
+
+def run_sync(sources: dict[str, Source]) -> dict[str, SyncResult]:
+    """
+    Sync every source, for celery tasks.
+
+    Creating sources run concurrently first, the ones only updating matched rows
+    run concurrently once they are done, so they find every row created.
+    Sources of one provider share its client and rate limit. A failing source
+    does not stop the others, its error is raised once they are done.
+    """
+    clients = {
+        provider: ProviderClient(provider)
+        for provider in {source["provider"] for source in sources.values()}
+    }
+    stages = [
+        [name for name, source in sources.items() if source["creates"]],
+        [name for name, source in sources.items() if not source["creates"]],
+    ]
+
+    async def main() -> dict[str, SyncResult | BaseException]:
+        outcomes: dict[str, SyncResult | BaseException] = {}
+        try:
+            for names in stages:
+                results = await asyncio.gather(
+                    *(
+                        sync_source(name, sources[name], clients[sources[name]["provider"]])
+                        for name in names
+                    ),
+                    return_exceptions=True,
+                )
+                outcomes.update(zip(names, results))
+            return outcomes
+        finally:
+            # Writes ran on the `sync_to_async` thread, with its own connection
+            await sync_to_async(connections.close_all)()
+
+    try:
+        outcomes = asyncio.run(main())
+    finally:
+        for client in clients.values():
+            client.close()
+
+    if errors := [e for e in outcomes.values() if isinstance(e, BaseException)]:
+        raise BaseExceptionGroup("Sync failed", errors)
+    return {name: outcomes[name] for name in sources}  # type: ignore[misc]
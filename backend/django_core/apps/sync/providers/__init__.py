@@ -0,0 +1,17 @@
+from typing import Any, TypedDict
+
+# Column holding the id a provider knows a row by
+ID_FIELDS = {
+    "mal": "mal_id",
+    "anilist": "anilist_id",
+    "kitsu": "kitsu_id",
+}
+
+
+class Page(TypedDict):
+    # Column values keyed by field name, ids included
+    records: list[dict[str, Any]]
+    # Number of the last page, as far as the provider knows it
+    last_page: int
+    # Every record is what the provider answered last time
+    unchanged: bool
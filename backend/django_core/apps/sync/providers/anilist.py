@@ -0,0 +1,89 @@
+"""
+AniList, a GraphQL API.
+
+Its characters and staff carry no MyAnimeList id, so they can not be matched
+to stored rows by anything but `anilist_id`. Only rows that already have one
+are looked up, `ids` pages through them.
+"""
+
+from collections.abc import Callable, Sequence
+import math
+from typing import Any
+
+from ..client import ProviderClient
+from . import Page
+
+PAGE_SIZE = 50
+
+CHARACTERS_QUERY = """
+query ($ids: [Int], $perPage: Int) {
+  Page(perPage: $perPage) {
+    characters(id_in: $ids) { id name { full native } description }
+  }
+}
+"""
+
+STAFF_QUERY = """
+query ($ids: [Int], $perPage: Int) {
+  Page(perPage: $perPage) {
+    staff(id_in: $ids) { id name { full first last } description }
+  }
+}
+"""
+
+Parser = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+async def _lookup(
+    client: ProviderClient,
+    ids: Sequence[int],
+    page: int,
+    query: str,
+    field: str,
+    parse: Parser,
+) -> Page:
+    last_page = max(1, math.ceil(len(ids) / PAGE_SIZE))
+    if not (chunk := ids[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]):
+        return Page(records=[], last_page=last_page, unchanged=True)
+
+    data, unchanged = await client.post(
+        "", {"query": query, "variables": {"ids": list(chunk), "perPage": PAGE_SIZE}}
+    )
+    return Page(
+        records=[parse(item) for item in data["data"]["Page"][field]],
+        last_page=last_page,
+        unchanged=unchanged,
+    )
+
+
+async def characters(ids: Sequence[int], client: ProviderClient, page: int) -> Page:
+    return await _lookup(
+        client,
+        ids,
+        page,
+        CHARACTERS_QUERY,
+        "characters",
+        lambda item: {
+            "anilist_id": item["id"],
+            "name": item["name"]["full"],
+            "name_kanji": item["name"].get("native"),
+            "about": item.get("description"),
+        },
+    )
+
+
+async def staff(ids: Sequence[int], client: ProviderClient, page: int) -> Page:
+    return await _lookup(
+        client,
+        ids,
+        page,
+        STAFF_QUERY,
+        "staff",
+        lambda item: {
+            "anilist_id": item["id"],
+            "name": item["name"]["full"],
+            "given_name": item["name"].get("first"),
+            "family_name": item["name"].get("last"),
+            "about": item.get("description"),
+        },
+    )
@@ -0,0 +1,57 @@
+"""Kitsu, a JSON:API paginated by offset."""
+
+from collections.abc import Callable
+import math
+from typing import Any
+
+from ..client import ProviderClient
+from . import Page
+
+PAGE_SIZE = 20
+
+Parser = Callable[[int, dict[str, Any]], dict[str, Any]]
+
+
+async def _listing(client: ProviderClient, path: str, page: int, parse: Parser) -> Page:
+    data, unchanged = await client.get(
+        path,
+        {
+            "page[limit]": PAGE_SIZE,
+            "page[offset]": (page - 1) * PAGE_SIZE,
+            "sort": "id",
+        },
+    )
+    return Page(
+        records=[parse(int(item["id"]), item["attributes"]) for item in data["data"]],
+        last_page=max(1, math.ceil(data["meta"]["count"] / PAGE_SIZE)),
+        unchanged=unchanged,
+    )
+
+
+async def characters(client: ProviderClient, page: int) -> Page:
+    return await _listing(
+        client,
+        "/characters",
+        page,
+        lambda pk, attributes: {
+            "kitsu_id": pk,
+            "mal_id": attributes.get("malId") or None,
+            "name": attributes.get("canonicalName") or attributes["name"],
+            "name_kanji": (attributes.get("names") or {}).get("ja_jp"),
+            "about": attributes.get("description") or None,
+        },
+    )
+
+
+async def people(client: ProviderClient, page: int) -> Page:
+    return await _listing(
+        client,
+        "/people",
+        page,
+        lambda pk, attributes: {
+            "kitsu_id": pk,
+            "mal_id": attributes.get("malId") or None,
+            "name": attributes["name"],
+            "about": attributes.get("description") or None,
+        },
+    )
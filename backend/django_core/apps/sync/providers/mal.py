@@ -0,0 +1,74 @@
+"""
+MyAnimeList, through the Jikan API.
+
+The official MyAnimeList API has no listing of characters, people or genres.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from ..client import ProviderClient
+from . import Page
+
+Parser = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+async def _listing(client: ProviderClient, path: str, page: int, parse: Parser) -> Page:
+    data, unchanged = await client.get(
+        path, {"page": page, "order_by": "mal_id", "sort": "asc"}
+    )
+    return Page(
+        records=[parse(item) for item in data["data"]],
+        last_page=data["pagination"]["last_visible_page"],
+        unchanged=unchanged,
+    )
+
+
+async def _genres(client: ProviderClient, kind: str) -> Page:
+    # Every genre fits in a single response
+    data, unchanged = await client.get("/genres/anime", {"filter": kind})
+    return Page(
+        records=[
+            {"mal_id": item["mal_id"], "name": item["name"], "type": "Anime"}
+            for item in data["data"]
+        ],
+        last_page=1,
+        unchanged=unchanged,
+    )
+
+
+async def characters(client: ProviderClient, page: int) -> Page:
+    return await _listing(
+        client,
+        "/characters",
+        page,
+        lambda item: {
+            "mal_id": item["mal_id"],
+            "name": item["name"],
+            "name_kanji": item.get("name_kanji"),
+            "about": item.get("about"),
+        },
+    )
+
+
+async def people(client: ProviderClient, page: int) -> Page:
+    return await _listing(
+        client,
+        "/people",
+        page,
+        lambda item: {
+            "mal_id": item["mal_id"],
+            "name": item["name"],
+            "given_name": item.get("given_name"),
+            "family_name": item.get("family_name"),
+            "about": item.get("about"),
+        },
+    )
+
+
+async def genres(client: ProviderClient, page: int) -> Page:
+    return await _genres(client, "genres")
+
+
+async def themes(client: ProviderClient, page: int) -> Page:
+    return await _genres(client, "themes")
@@ -0,0 +1,251 @@
+import asyncio
+from collections.abc import AsyncIterator
+from email.utils import parsedate_to_datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import IO, Any, TypedDict
+import weakref
+
+from django.conf import settings
+import httpx
+
+# Largest avatar kept, bigger ones are refused
+AVATAR_MAX_BYTES = 2 * 1024 * 1024
+# Freshness of responses without `Cache-Control` or `Expires`
+DEFAULT_MAX_AGE = 60 * 60
+CHUNK_SIZE = 64 * 1024
+# Eviction shrinks the cache to this share of its size, so it does not run on every miss
+EVICT_TO = 0.9
+
+
+class AvatarError(Exception):
+    pass
+
+
+class CachedAvatar(TypedDict):
+    url: str
+    content_type: str
+    # Unix time the avatar has to be revalidated at
+    expires: float
+    etag: str | None
+    last_modified: str | None
+
+
+def freshness(headers: httpx.Headers) -> float:
+    """Seconds a response stays fresh for, from its `Cache-Control` or `Expires`."""
+    directives = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+
+    # Kept to be served, but revalidated on every request
+    if directives.keys() & {"no-store", "no-cache", "private"}:
+        return 0
+    try:
+        age = int(headers.get("age", 0))
+    except ValueError:
+        age = 0
+
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                return max(int(directives[name]) - age, 0)
+            except ValueError:
+                return 0
+
+    if "expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["expires"]).timestamp()
+            date = parsedate_to_datetime(headers["date"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            # An invalid date means already expired
+            return 0
+        return max(expires - date - age, 0)
+    return DEFAULT_MAX_AGE
+
+
+async def iter_file(file: IO[bytes]) -> AsyncIterator[bytes]:
+    """Stream `file` without blocking the event loop, closes it when done."""
+    try:
+        while chunk := await asyncio.to_thread(file.read, CHUNK_SIZE):
+            yield chunk
+    finally:
+        await asyncio.to_thread(file.close)
+
+
+class AvatarProxy:
+    """
+    Fetches provider avatars into a size bounded disk cache.
+
+    Avatars are kept for as long as the provider allows and revalidated with
+    conditional requests after that. Concurrent misses for the same url share
+    one upstream request. The least recently served avatars are evicted once
+    the cache outgrows `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_bytes: int,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.transport = transport
+        # Estimated size of the cache, unknown until the first eviction scans it
+        self.size: int | None = None
+        self.evicting = False
+        # Clients and in-flight fetches belong to the event loop they were created on,
+        # the test client runs every request on a loop of its own
+        self.clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self.inflight: dict[str, asyncio.Task[CachedAvatar]] = {}
+
+    def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if loop not in self.clients:
+            self.clients[loop] = httpx.AsyncClient(
+                transport=self.transport,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+                timeout=httpx.Timeout(10, connect=5),
+                follow_redirects=True,
+            )
+        return self.clients[loop]
+
+    def files(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.path / f"{key}.body", self.path / f"{key}.json"
+
+    def open(self, url: str) -> tuple[IO[bytes], CachedAvatar] | None:
+        body, meta = self.files(url)
+        try:
+            with meta.open() as file:
+                avatar: CachedAvatar = json.load(file)
+            handle = body.open("rb")
+        except (OSError, ValueError):
+            return None
+        # Eviction goes by modification time
+        os.utime(body)
+        return handle, avatar
+
+    async def get(self, url: str) -> tuple[IO[bytes], CachedAvatar]:
+        """Open the cached avatar of `url`, fetching or revalidating it first if needed."""
+        cached = await asyncio.to_thread(self.open, url)
+        if cached and cached[1]["expires"] > time.time():
+            return cached
+        if cached:
+            await asyncio.to_thread(cached[0].close)
+
+        loop = asyncio.get_running_loop()
+        task = self.inflight.get(url)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self.fetch(url, cached[1] if cached else None))
+            self.inflight[url] = task
+            task.add_done_callback(
+                lambda done: self.inflight.pop(url, None)
+                if self.inflight.get(url) is done
+                else None
+            )
+        # A cancelled request must not cancel the fetch others wait on
+        await asyncio.shield(task)
+
+        if cached := await asyncio.to_thread(self.open, url):
+            return cached
+        raise AvatarError(f"{url} was evicted before it could be served")
+
+    async def fetch(self, url: str, stale: CachedAvatar | None) -> CachedAvatar:
+        headers = {}
+        if stale and stale["etag"]:
+            headers["If-None-Match"] = stale["etag"]
+        if stale and stale["last_modified"]:
+            headers["If-Modified-Since"] = stale["last_modified"]
+
+        body, meta = self.files(url)
+        async with self.client().stream("GET", url, headers=headers) as response:
+            if stale and response.status_code == 304:
+                avatar = stale.copy()
+                avatar["expires"] = time.time() + freshness(response.headers)
+                await asyncio.to_thread(self.write, meta, avatar, None)
+                return avatar
+
+            if response.status_code != 200:
+                raise AvatarError(f"{url} answered {response.status_code}")
+            if int(response.headers.get("content-length") or 0) > AVATAR_MAX_BYTES:
+                raise AvatarError(f"{url} is larger than {AVATAR_MAX_BYTES} bytes")
+
+            await asyncio.to_thread(self.path.mkdir, parents=True, exist_ok=True)
+            file = await asyncio.to_thread(
+                tempfile.NamedTemporaryFile, dir=self.path, suffix=".part", delete=False
+            )
+            size = 0
+            try:
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > AVATAR_MAX_BYTES:
+                        raise AvatarError(f"{url} is larger than {AVATAR_MAX_BYTES} bytes")
+                    await asyncio.to_thread(file.write, chunk)
+            except BaseException:
+                await asyncio.to_thread(self.discard, file)
+                raise
+            await asyncio.to_thread(file.close)
+
+        avatar = CachedAvatar(
+            url=url,
+            content_type=response.headers.get("content-type", "application/octet-stream"),
+            expires=time.time() + freshness(response.headers),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        await asyncio.to_thread(self.write, meta, avatar, (Path(file.name), body))
+
+        if self.size is not None:
+            self.size += size
+        if (self.size is None or self.size > self.max_bytes) and not self.evicting:
+            self.evicting = True
+            try:
+                await asyncio.to_thread(self.evict)
+            finally:
+                self.evicting = False
+        return avatar
+
+    def write(
+        self, meta: Path, avatar: CachedAvatar, body: tuple[Path, Path] | None
+    ) -> None:
+        """Move the fetched body and the metadata into place, each atomically."""
+        if body:
+            os.replace(*body)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path, suffix=".part", delete=False
+        ) as file:
+            json.dump(avatar, file)
+        os.replace(file.name, meta)
+
+    @staticmethod
+    def discard(file: Any) -> None:
+        file.close()
+        os.unlink(file.name)
+
+    def evict(self) -> None:
+        """Delete the least recently served avatars until the cache fits again."""
+        bodies = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".body"):
+                stat = entry.stat()
+                bodies.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+
+        size = sum(entry[1] for entry in bodies)
+        for _, length, body in sorted(bodies):
+            if size <= self.max_bytes * EVICT_TO:
+                break
+            body.with_suffix(".json").unlink(missing_ok=True)
+            body.unlink(missing_ok=True)
+            size -= length
+        self.size = size
+
+
+avatar_proxy = AvatarProxy(**settings.AVATAR_CACHE)
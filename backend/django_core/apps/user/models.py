@@ -68,6 +68,8 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     avatar_provider = models.URLField(
         default="https://seccdn.libravatar.org/avatar/{EMAIL}?s=512",
     )
+    # Resized copies of the images in modern formats, see `apps.api.images`
+    image_derivatives = models.JSONField(default=dict, blank=True, editable=False)
 
     objects = UserManager()
 
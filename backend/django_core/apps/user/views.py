@@ -1,13 +1,15 @@
+import asyncio
 import hashlib
+import mimetypes
 import textwrap
-from collections.abc import Iterator
+import time
 
-import requests
 from django.core.management.utils import get_random_secret_key
 from django.core.validators import URLValidator
-from django.http import FileResponse, HttpRequest, HttpResponse, StreamingHttpResponse
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.shortcuts import render
 
+from .avatars import avatar_proxy, iter_file
 from .models import CustomUser
 
 # Create your views here
@@ -16,7 +18,7 @@ from .models import CustomUser
 async def avatar_view(
     request: HttpRequest,
     user_id: int,
-) -> StreamingHttpResponse | HttpResponse | FileResponse:
+) -> StreamingHttpResponse | HttpResponse:
     try:
         user = await CustomUser.objects.aget(pk=user_id)
     except CustomUser.DoesNotExist:
@@ -32,8 +34,12 @@ async def avatar_view(
         )
 
     if user.avatar:
-        avatar_file = open(user.avatar.path, "rb")
-        return FileResponse(avatar_file)
+        avatar_file = await asyncio.to_thread(open, user.avatar.path, "rb")
+        return StreamingHttpResponse(
+            iter_file(avatar_file),
+            content_type=mimetypes.guess_type(user.avatar.name)[0]
+            or "application/octet-stream",
+        )
 
     try:
         avatar_url = user.avatar_provider.format(
@@ -41,16 +47,16 @@ async def avatar_view(
         )
         # Just a check Here
         URLValidator()(avatar_url)
-        _request_ = requests.get(avatar_url, stream=True)
+        avatar_file, avatar = await avatar_proxy.get(avatar_url)
 
-        def streaming_content() -> Iterator[bytes]:
-            # Iterate over the response content, and yield it in chunks
-            yield from _request_.iter_content(chunk_size=1024)
-
-        return StreamingHttpResponse(
-            streaming_content(),
-            content_type=_request_.headers["content-type"],
+        response = StreamingHttpResponse(
+            iter_file(avatar_file),
+            content_type=avatar["content_type"],
         )
+        # Browsers may keep it for as long as the cached copy stays fresh
+        max_age = max(int(avatar["expires"] - time.time()), 0)
+        response["Cache-Control"] = f"public, max-age={max_age}"
+        return response
 
     except Exception as e:
         return HttpResponse(
@@ -1,5 +1,7 @@
 import os
 
+from datetime import timedelta
+
 from celery import Celery
 from celery.schedules import crontab
 
@@ -43,6 +45,37 @@ app.conf.beat_schedule = {
         "task": "apps.anime.tasks.get_periodic_anime_genres",
         "schedule": crontab(hour=0, minute=00, day_of_week=5),
     },
+    # Episodes
+    # ========
+    # Playback positions buffered in Redis
+    "flush-watch-progress": {
+        "task": "apps.episodes.tasks.flush_watch_progress",
+        "schedule": timedelta(seconds=30),
+    },
+    # Search
+    # ======
+    # Anime changed since the last autocomplete snapshot
+    "update-autocomplete": {
+        "task": "apps.search.tasks.update_autocomplete",
+        "schedule": timedelta(seconds=30),
+    },
+    # Popularity of every anime
+    "rebuild-autocomplete-every-night": {
+        "task": "apps.search.tasks.rebuild_autocomplete",
+        "schedule": crontab(hour=4, minute=0),
+    },
+    # Comments
+    # ========
+    # Vote counters buffered in Redis
+    "flush-comment-votes": {
+        "task": "apps.comments.tasks.flush_comment_votes",
+        "schedule": timedelta(seconds=15),
+    },
+    # Executes every night at 3:00 a.m.
+    "reconcile-comment-votes-every-night": {
+        "task": "apps.comments.tasks.reconcile_comment_votes",
+        "schedule": crontab(hour=3, minute=00),
+    },
 }
 
 app.conf.timezone = "UTC"
@@ -96,6 +96,8 @@ INSTALLED_APPS = [
     "apps.producers",
     "apps.staffs",
     "apps.episodes",
+    "apps.sync",
+    "apps.search",
 ]
 
 
@@ -200,6 +202,67 @@ if CACHE_MIDDLEWARE_SECONDS != 0:
         }
     }
 
+# Tagged response cache of the API, see `apps.api.cache`
+# `0` disables it
+API_CACHE_SECONDS = int(os.environ.get("API_CACHE_SECONDS", 0))
+API_CACHE_LOCATION = os.environ.get(
+    "API_CACHE_LOCATION",
+    os.environ.get("DJANGO_CACHE_LOCATION", "redis://127.0.0.1:6379"),
+)
+# A slow Redis must not be slower than rendering the response
+API_CACHE_SOCKET_TIMEOUT = float(os.environ.get("API_CACHE_SOCKET_TIMEOUT", 0.1))
+
+# Users of bearer tokens, cached in Redis and in every process, see `apps.api.auth`
+# `0` disables it
+AUTH_CACHE_SECONDS = int(os.environ.get("AUTH_CACHE_SECONDS", 0))
+AUTH_CACHE_PROCESS_SIZE = int(os.environ.get("AUTH_CACHE_PROCESS_SIZE", 1024))
+# Process entries answer without Redis, invalidations reach other processes this late
+AUTH_CACHE_PROCESS_SECONDS = float(os.environ.get("AUTH_CACHE_PROCESS_SECONDS", 5))
+
+# Buffer comment vote counters in Redis, see `apps.comments.votes`
+# `0` writes them along with every vote
+COMMENT_VOTE_BUFFER = bool(int(os.environ.get("COMMENT_VOTE_BUFFER", 0)))
+
+# Buffer playback positions in Redis, see `apps.episodes.progress`
+# `0` writes every report
+WATCH_PROGRESS_BUFFER = bool(int(os.environ.get("WATCH_PROGRESS_BUFFER", 0)))
+
+# Workers check for a new autocomplete snapshot this often, see `apps.search.autocomplete`
+# `0` checks on every request
+AUTOCOMPLETE_REFRESH_SECONDS = int(os.environ.get("AUTOCOMPLETE_REFRESH_SECONDS", 30))
+
+# Upstream catalogue sync, see `apps.sync`
+SYNC_PROVIDERS = {
+    # Jikan, a MyAnimeList mirror
+    "mal": {
+        "url": os.environ.get("SYNC_MAL_URL", "https://api.jikan.moe/v4"),
+        "requests_per_minute": 60,
+        "concurrency": 3,
+    },
+    "anilist": {
+        "url": os.environ.get("SYNC_ANILIST_URL", "https://graphql.anilist.co"),
+        "requests_per_minute": 30,
+        "concurrency": 2,
+    },
+    "kitsu": {
+        "url": os.environ.get("SYNC_KITSU_URL", "https://kitsu.io/api/edge"),
+        "requests_per_minute": 60,
+        "concurrency": 3,
+        "headers": {"Accept": "application/vnd.api+json"},
+    },
+}
+# Keyword arguments of the `requests_cache.CachedSession` upstream requests go through
+SYNC_HTTP_CACHE = {
+    "cache_name": os.environ.get("SYNC_HTTP_CACHE", str(BASE_DIR / "sync_http_cache")),
+    "backend": "sqlite",
+}
+
+# Disk cache of provider avatars, see `apps.user.avatars`
+AVATAR_CACHE = {
+    "path": os.environ.get("AVATAR_CACHE", str(BASE_DIR / "avatar_cache")),
+    "max_bytes": int(os.environ.get("AVATAR_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+}
+
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
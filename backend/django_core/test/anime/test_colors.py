@@ -0,0 +1,87 @@
+import io
+import tempfile
+from typing import NoReturn
+
+from anime_mixins import ColorTaskMixin
+from apps.anime.models import AnimeModel
+from apps.anime.tasks import set_field_color
+from apps.api.cache import get_redis
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image
+from utilities.dominant_color import dominant_color
+
+
+def image_file(*colors: tuple[int, int, int], format: str = "JPEG") -> io.BytesIO:
+    """Vertical stripes of `colors`, the first one twice as wide as the others."""
+    image = Image.new("RGB", ((len(colors) + 1) * 100, 100), colors[0])
+    for index, color in enumerate(colors[1:], start=2):
+        image.paste(color, (index * 100, 0, (index + 1) * 100, 100))
+    file = io.BytesIO()
+    image.save(file, format)
+    file.seek(0)
+    return file
+
+
+class DominantColorTestCases(SimpleTestCase):
+    def test_most_frequent_color_wins(self) -> NoReturn:
+        self.assertEqual(
+            dominant_color(image_file((0, 0, 255), (255, 0, 0), format="PNG")),
+            "#0000FF",
+        )
+
+    def test_large_jpeg(self) -> NoReturn:
+        color = dominant_color(image_file((200, 30, 40), (10, 200, 30)))
+        red, green, blue = (int(color[i : i + 2], 16) for i in (1, 3, 5))
+        self.assertLess(abs(red - 200) + abs(green - 30) + abs(blue - 40), 15)
+
+
+class FieldColorEnqueueTestCases(ColorTaskMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(self.release_color_keys)
+
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings = override_settings(MEDIA_ROOT=media.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def release_color_keys(self) -> None:
+        redis = get_redis()
+        if keys := list(redis.scan_iter("anime:field_color:*")):
+            redis.delete(*keys)
+
+    def test_repeated_saves_enqueue_once(self) -> NoReturn:
+        with self.captureOnCommitCallbacks(execute=True):
+            anime = AnimeModel.objects.create(
+                mal_id=1,
+                name="Anime",
+                banner=SimpleUploadedFile("banner.png", image_file((1, 2, 3)).read()),
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            anime.save()
+
+        self.set_field_color.delay.assert_called_once_with(
+            anime.pk, "banner_background_color", "banner"
+        )
+
+    def test_enqueued_again_once_computed(self) -> NoReturn:
+        with self.captureOnCommitCallbacks(execute=True):
+            anime = AnimeModel.objects.create(
+                mal_id=1,
+                name="Anime",
+                banner=SimpleUploadedFile("banner.png", image_file((1, 2, 3)).read()),
+            )
+        # The worker releases the key the web process took
+        set_field_color(anime.pk, "banner_background_color", "banner")
+        anime.refresh_from_db()
+        anime.banner_background_color = None
+        with self.captureOnCommitCallbacks(execute=True):
+            anime.save()
+        self.assertEqual(self.set_field_color.delay.call_count, 2)
+
+    def test_anime_without_images_enqueue_nothing(self) -> NoReturn:
+        with self.captureOnCommitCallbacks(execute=True):
+            AnimeModel.objects.create(mal_id=1, name="Anime")
+        self.set_field_color.delay.assert_not_called()
@@ -0,0 +1,15 @@
+from unittest import mock
+
+
+class ColorTaskMixin:
+    """
+    Replaces the color task enqueued on anime saves, as `self.set_field_color`.
+
+    Colors are computed by celery, which is not under test here.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()  # type: ignore[misc]
+        patcher = mock.patch("apps.anime.signals.set_field_color")
+        self.set_field_color = patcher.start()
+        self.addCleanup(patcher.stop)  # type: ignore[attr-defined]
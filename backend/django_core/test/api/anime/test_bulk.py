@@ -0,0 +1,100 @@
+import json
+from typing import NoReturn
+
+from anime_mixins import ColorTaskMixin
+from apps.anime.models import AnimeModel
+from apps.anime.models.anime_genre import AnimeGenreModel
+from apps.api.models import Token
+from apps.user.models import CustomUser as User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+
+class AnimeBulkTestCases(ColorTaskMixin, TestCase):
+    def __init__(self, methodName: str = "runTest") -> None:
+        super().__init__(methodName)
+        self.url = "/api/v3/anime/bulk"
+
+    def setUp(self):
+        super().setUp()
+        super_user = User.objects.create_superuser(
+            username="testuser1#0001", email="admin1@django.com", password="testpassword"
+        )
+        self.headers = {
+            "Authorization": f"Bearer {Token.objects.create(user=super_user).token}"
+        }
+        self.genres = [
+            AnimeGenreModel.objects.create(
+                mal_id=index, name=f"Genre {index}", type="anime"
+            )
+            for index in range(3)
+        ]
+
+    def post(self, items: list[dict], content_type: str = "application/json"):
+        if content_type == "application/x-ndjson":
+            body = "\n".join(json.dumps(item) for item in items)
+        else:
+            body = json.dumps(items)
+        return self.client.post(
+            self.url, body, content_type=content_type, headers=self.headers
+        )
+
+    def items(self, count: int) -> list[dict]:
+        return [
+            {
+                "mal_id": index,
+                "name": f"Anime {index}",
+                "name_synonyms": [f"Synonym {index}"],
+                "genres": [genre.pk for genre in self.genres],
+            }
+            for index in range(count)
+        ]
+
+    def test_create_and_update(self) -> NoReturn:
+        response = self.post(self.items(3))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["created"], 3)
+        self.assertEqual(
+            AnimeModel.objects.get(mal_id=1).genres.count(), 3, "Through rows inserted"
+        )
+
+        items = self.items(3)
+        items[1]["synopsis"] = "Changed"
+        items[2]["genres"] = [self.genres[0].pk]
+        response = self.post(items, content_type="application/x-ndjson")
+        self.assertEqual(
+            response.json(),
+            {"created": 0, "updated": 2, "unchanged": 1, "errors": []},
+        )
+        self.assertEqual(AnimeModel.objects.get(mal_id=1).synopsis, "Changed")
+        self.assertEqual(AnimeModel.objects.get(mal_id=2).genres.count(), 1)
+
+    def test_item_errors(self) -> NoReturn:
+        items = self.items(4)
+        items[1]["genres"] = [0]
+        items[2]["name"] = None
+        del items[3]["mal_id"]
+
+        response = self.post(items)
+        self.assertEqual(response.json()["created"], 1, "Valid items are written")
+        self.assertEqual(
+            [error["index"] for error in response.json()["errors"]],
+            [1, 2, 3],
+            "Every invalid item is reported",
+        )
+
+    def test_query_count_is_constant(self) -> NoReturn:
+        def count_queries(items: list[dict]) -> int:
+            with CaptureQueriesContext(connection) as context:
+                self.post(items)
+            return len(context.captured_queries)
+
+        small = [dict(item, mal_id=item["mal_id"] + 100) for item in self.items(2)]
+        for item in small:
+            item["name"] += " small"
+        self.assertEqual(
+            count_queries(small),
+            count_queries(self.items(20)),
+            "Query count does not depend on the batch size",
+        )
@@ -0,0 +1,91 @@
+from typing import NoReturn
+from unittest import mock
+
+from anime_mixins import ColorTaskMixin
+from apps.anime.models import AnimeModel
+from apps.anime.models.anime_genre import AnimeGenreModel
+from apps.api.cache import get_redis, invalidate_tags
+from apps.api.documents import get_anime_document
+from apps.api.models import Token
+from apps.user.models import CustomUser
+from django.test import TestCase, override_settings
+
+
+@override_settings(API_CACHE_SECONDS=60)
+class AnimeResponseCacheTestCases(ColorTaskMixin, TestCase):
+    def __init__(self, methodName: str = "runTest") -> None:
+        super().__init__(methodName)
+        self.url = "/api/v3/anime"
+
+    def setUp(self):
+        super().setUp()
+        self.anime = AnimeModel.objects.create(mal_id=0, name="Anime 0")
+        self.detail_url = f"{self.url}/{self.anime.pk}"
+        self.addCleanup(self.clear_cache)
+
+    def clear_cache(self) -> None:
+        redis = get_redis()
+        for key in redis.scan_iter("api:cache:*"):
+            redis.delete(key)
+
+    def assertCache(self, url: str, status: str) -> None:
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Cache"], status, url)
+
+    def test_miss_then_hit(self) -> NoReturn:
+        for url in (self.url, self.detail_url):
+            self.assertCache(url, "MISS")
+            self.assertCache(url, "HIT")
+
+    def test_authenticated_requests_bypass_the_cache(self) -> NoReturn:
+        user = CustomUser.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        token = Token.objects.create(user=user)
+        self.assertCache(self.detail_url, "MISS")
+
+        response = self.client.get(
+            self.detail_url, headers={"Authorization": f"Bearer {token.token}"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Cache", response)
+
+    def test_save_invalidates_list_and_detail(self) -> NoReturn:
+        for url in (self.url, self.detail_url):
+            self.assertCache(url, "MISS")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.anime.name = "Renamed"
+            self.anime.save()
+
+        for url in (self.url, self.detail_url):
+            self.assertCache(url, "MISS")
+        self.assertEqual(self.client.get(self.detail_url).json()["name"], "Renamed")
+
+    def test_m2m_change_invalidates_list_and_detail(self) -> NoReturn:
+        genre = AnimeGenreModel.objects.create(mal_id=1, name="Genre", type="anime")
+        for url in (self.url, self.detail_url):
+            self.assertCache(url, "MISS")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.anime.genres.add(genre)
+
+        for url in (self.url, self.detail_url):
+            self.assertCache(url, "MISS")
+
+    def test_response_rendered_during_invalidation_is_not_stored(self) -> NoReturn:
+        def invalidate_while_rendering(anime_id: int) -> str | None:
+            # A write commits after the lookup missed, before the response is stored
+            with self.captureOnCommitCallbacks(execute=True):
+                invalidate_tags([f"anime:{anime_id}"])
+            return get_anime_document(anime_id)
+
+        with mock.patch(
+            "apps.api.views.anime.get_anime_document",
+            side_effect=invalidate_while_rendering,
+        ):
+            self.assertCache(self.detail_url, "MISS")
+
+        self.assertCache(self.detail_url, "MISS")
+        self.assertCache(self.detail_url, "HIT")
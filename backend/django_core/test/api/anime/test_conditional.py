@@ -0,0 +1,74 @@
+from typing import NoReturn
+
+from anime_mixins import ColorTaskMixin
+from apps.anime.models import AnimeModel, AnimeNameSynonymModel
+from apps.anime.models.anime_genre import AnimeGenreModel
+from django.test import TestCase
+
+
+class AnimeConditionalGetTestCases(ColorTaskMixin, TestCase):
+    def __init__(self, methodName: str = "runTest") -> None:
+        super().__init__(methodName)
+        self.url = "/api/v3/anime"
+
+    def setUp(self):
+        super().setUp()
+        for index in range(3):
+            AnimeModel.objects.create(mal_id=index, name=f"Anime {index}")
+
+    def test_detail_not_modified(self) -> NoReturn:
+        anime = AnimeModel.objects.get(mal_id=0)
+        response = self.client.get(f"{self.url}/{anime.pk}")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+
+        response = self.client.get(
+            f"{self.url}/{anime.pk}", headers={"If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304, "ETag matches")
+
+    def test_detail_modified_by_relation(self) -> NoReturn:
+        anime = AnimeModel.objects.get(mal_id=0)
+        etag = self.client.get(f"{self.url}/{anime.pk}")["ETag"]
+
+        anime.genres.add(
+            AnimeGenreModel.objects.create(mal_id=1, name="Genre", type="anime")
+        )
+        response = self.client.get(
+            f"{self.url}/{anime.pk}", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200, "Adding a genre changes the ETag")
+
+    def test_detail_modified_by_nested_edit(self) -> NoReturn:
+        anime = AnimeModel.objects.get(mal_id=0)
+        synonym = AnimeNameSynonymModel.objects.create(name="Synonym")
+        anime.name_synonyms.add(synonym)
+        etag = self.client.get(f"{self.url}/{anime.pk}")["ETag"]
+
+        synonym.name = "Renamed"
+        synonym.save()
+        response = self.client.get(
+            f"{self.url}/{anime.pk}", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200, "Renaming a synonym changes the ETag")
+
+    def test_list_not_modified(self) -> NoReturn:
+        response = self.client.get(self.url, {"limit": 2})
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(
+            self.url, {"limit": 2}, headers={"If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304, "ETag matches")
+
+        response = self.client.get(
+            self.url, {"limit": 3}, headers={"If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 200, "Another page has another ETag")
+
+    def test_list_modified_by_delete(self) -> NoReturn:
+        etag = self.client.get(self.url)["ETag"]
+
+        AnimeModel.objects.get(mal_id=0).delete()
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200, "Removed rows change the ETag")
@@ -0,0 +1,49 @@
+from typing import NoReturn
+
+from anime_mixins import ColorTaskMixin
+from apps.anime.models import AnimeModel, AnimeNameSynonymModel
+from django.test import TestCase
+
+
+class AnimeFullTextSearchTestCases(ColorTaskMixin, TestCase):
+    def __init__(self, methodName: str = "runTest") -> None:
+        super().__init__(methodName)
+        self.url = "/api/v3/anime"
+
+    def setUp(self):
+        super().setUp()
+        self.by_synopsis = AnimeModel.objects.create(
+            mal_id=1,
+            name="Brotherhood",
+            synopsis="Two brothers search for the stone of alchemy.",
+        )
+        self.by_name = AnimeModel.objects.create(mal_id=2, name="Alchemy Academy")
+        self.by_synonym = AnimeModel.objects.create(mal_id=3, name="Hagane")
+        self.by_synonym.name_synonyms.add(
+            AnimeNameSynonymModel.objects.create(name="Alchemy Steel")
+        )
+        AnimeModel.objects.create(mal_id=4, name="Unrelated", synopsis="Nothing here.")
+
+    def test_ranked_by_weight(self) -> NoReturn:
+        response = self.client.get(self.url, {"q": "alchemy"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item["id"] for item in response.json()["items"]],
+            [self.by_name.pk, self.by_synonym.pk, self.by_synopsis.pk],
+        )
+
+    def test_headline(self) -> NoReturn:
+        response = self.client.get(self.url, {"q": "brothers stone"})
+        (item,) = response.json()["items"]
+        self.assertEqual(item["id"], self.by_synopsis.pk)
+        self.assertIn("<b>brothers</b>", item["headline"])
+
+    def test_synopsis_updated(self) -> NoReturn:
+        self.by_name.synopsis = "A story about dragons."
+        self.by_name.save()
+        response = self.client.get(self.url, {"q": "dragon"})
+        self.assertEqual([item["id"] for item in response.json()["items"]], [self.by_name.pk])
+
+    def test_no_match(self) -> NoReturn:
+        response = self.client.get(self.url, {"q": "spaceship"})
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,75 @@
+import datetime
+from typing import Any, NoReturn
+
+from anime_mixins import ColorTaskMixin
+from apps.anime.models import AnimeModel
+from django.test import TestCase
+from django.utils import timezone
+
+
+class AnimeCursorPaginationTestCases(ColorTaskMixin, TestCase):
+    def __init__(self, methodName: str = "runTest") -> None:
+        super().__init__(methodName)
+        self.url = "/api/v3/anime"
+
+    def setUp(self):
+        super().setUp()
+        # Equal names score equally, every page boundary falls inside a tie
+        self.anime = [
+            AnimeModel.objects.create(
+                mal_id=index, name="Alchemy" if index < 5 else f"Alchemy {index}"
+            )
+            for index in range(8)
+        ]
+
+    def walk(self, **params: Any) -> list[int]:
+        """Ids of every page, following `next` until the last one."""
+        ids, cursor = [], None
+        while True:
+            response = self.client.get(
+                self.url, params | {"limit": 2} | ({"cursor": cursor} if cursor else {})
+            )
+            self.assertEqual(response.status_code, 200)
+            ids += [item["id"] for item in response.json()["items"]]
+            if (cursor := response.json()["next"]) is None:
+                return ids
+
+    def test_walk_by_pk(self) -> NoReturn:
+        self.assertEqual(self.walk(), sorted(anime.pk for anime in self.anime))
+
+    def test_walk_by_updated_at(self) -> NoReturn:
+        # Ties on `updated_at` are broken by `pk`
+        now = timezone.now()
+        for index, anime in enumerate(self.anime):
+            AnimeModel.objects.filter(pk=anime.pk).update(
+                updated_at=now - datetime.timedelta(microseconds=index // 3)
+            )
+        expected = sorted(
+            self.anime, key=lambda anime: (-(self.anime.index(anime) // 3), anime.pk)
+        )
+        self.assertEqual(self.walk(ordering="updated_at"), [anime.pk for anime in expected])
+
+    def test_walk_by_tied_similarity(self) -> NoReturn:
+        ids = self.walk(name="Alchemy")
+        self.assertCountEqual(
+            ids, [anime.pk for anime in self.anime], "No row is skipped or repeated"
+        )
+
+    def test_walk_by_tied_rank(self) -> NoReturn:
+        ids = self.walk(q="alchemy")
+        self.assertCountEqual(
+            ids, [anime.pk for anime in self.anime], "No row is skipped or repeated"
+        )
+
+    def test_invalid_cursor(self) -> NoReturn:
+        response = self.client.get(self.url, {"cursor": "forged"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["detail"], "Invalid cursor")
+
+    def test_cursor_of_another_ordering(self) -> NoReturn:
+        cursor = self.client.get(self.url, {"limit": 2}).json()["next"]
+        response = self.client.get(self.url, {"cursor": cursor, "ordering": "updated_at"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["detail"], "Cursor does not match the requested ordering"
+        )
@@ -0,0 +1,97 @@
+from typing import NoReturn
+
+from anime_mixins import ColorTaskMixin
+from apps.anime.models import AnimeModel, AnimeNameSynonymModel
+from apps.anime.models.anime_openings_and_endings import (
+    AnimeEndingModel,
+    AnimeOpeningModel,
+)
+from apps.episodes.models import EpisodeModel
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+
+class AnimeQueryCountTestCases(ColorTaskMixin, TestCase):
+    def __init__(self, methodName: str = "runTest") -> None:
+        super().__init__(methodName)
+        self.url = "/api/v3/anime"
+
+    def setUp(self):
+        super().setUp()
+        for index in range(12):
+            anime = AnimeModel.objects.create(mal_id=index, name=f"Anime {index}")
+            anime.name_synonyms.add(
+                AnimeNameSynonymModel.objects.create(name=f"Synonym {index}")
+            )
+            anime.openings.add(
+                AnimeOpeningModel.objects.create(name=f"Opening {index}", entry=1)
+            )
+            anime.endings.add(
+                AnimeEndingModel.objects.create(name=f"Ending {index}", entry=1)
+            )
+            for episode_number in range(1, 4):
+                anime.episodes.add(
+                    EpisodeModel.objects.create(
+                        episode_number=episode_number,
+                        episode_name=f"Episode {episode_number}",
+                        episode_length=episode_number * 10,
+                    )
+                )
+
+    def count_queries(self, url: str, **params: int) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, "Response looks okay")
+        return len(context.captured_queries)
+
+    def test_list_query_count_is_constant(self) -> NoReturn:
+        self.assertEqual(
+            self.count_queries(self.url, limit=2),
+            self.count_queries(self.url, limit=12),
+            "Query count does not depend on the page size",
+        )
+
+    def test_detail_query_count(self) -> NoReturn:
+        anime = AnimeModel.objects.get(mal_id=0)
+        response = self.client.get(f"{self.url}/{anime.pk}")
+
+        self.assertEqual(response.json()["episodes_count"], 3)
+        self.assertEqual(response.json()["average_episode_length"], 20)
+
+        live = self.count_queries(f"{self.url}/{AnimeModel.objects.get(mal_id=1).pk}")
+        self.assertEqual(
+            live,
+            self.count_queries(f"{self.url}/{AnimeModel.objects.get(mal_id=2).pk}"),
+            "Query count does not depend on the anime",
+        )
+        self.assertLess(
+            self.count_queries(f"{self.url}/{anime.pk}"),
+            live,
+            "The stored document is served without rendering",
+        )
+
+    def test_detail_document_expires(self) -> NoReturn:
+        anime = AnimeModel.objects.get(mal_id=0)
+        self.client.get(f"{self.url}/{anime.pk}")
+
+        anime.episodes.add(
+            EpisodeModel.objects.create(
+                episode_number=4, episode_name="Episode 4", episode_length=40
+            )
+        )
+        response = self.client.get(f"{self.url}/{anime.pk}")
+        self.assertEqual(response.json()["episodes_count"], 4, "Document was rebuilt")
+
+    def test_episode_stats_follow_episodes(self) -> NoReturn:
+        anime = AnimeModel.objects.get(mal_id=0)
+        first, *_, last = anime.episodes.order_by("episode_number")
+
+        first.episode_length = 40
+        first.save()
+        last.delete()
+        anime.refresh_from_db()
+
+        self.assertEqual(anime.episodes_count, 2)
+        self.assertEqual(anime.average_episode_length, 30)
+        self.assertEqual(anime.latest_episode_number, 2)
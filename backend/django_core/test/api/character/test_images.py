@@ -0,0 +1,78 @@
+import io
+import tempfile
+from typing import NoReturn
+from unittest import mock
+
+from apps.api.cache import get_redis
+from apps.api.tasks import build_image_derivatives, image_derivatives_key
+from apps.characters.models import CharacterModel
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+
+def png(width: int, height: int) -> bytes:
+    file = io.BytesIO()
+    Image.new("RGB", (width, height), (20, 40, 60)).save(file, "PNG")
+    return file.getvalue()
+
+
+class CharacterImageDerivativesTestCases(TestCase):
+    def setUp(self):
+        patcher = mock.patch("apps.api.signals.build_image_derivatives")
+        self.build = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings = override_settings(MEDIA_ROOT=media.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.character = CharacterModel.objects.create(
+                name="Character",
+                character_image=SimpleUploadedFile("character.png", png(800, 400)),
+            )
+        self.url = f"/api/v3/characters/{self.character.pk}/"
+        self.addCleanup(
+            get_redis().delete,
+            image_derivatives_key("characters.CharacterModel", self.character.pk),
+        )
+
+    def test_upload_enqueues_render(self) -> NoReturn:
+        self.build.delay.assert_called_once_with(
+            "characters.CharacterModel", self.character.pk
+        )
+
+    def test_upload_after_render_is_queued(self) -> NoReturn:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.character.character_image = SimpleUploadedFile("other.png", png(40, 20))
+            self.character.save()
+        self.assertEqual(self.build.delay.call_count, 1, "The first one is still queued")
+
+        # The worker releases the key the web process took
+        build_image_derivatives("characters.CharacterModel", self.character.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.character.character_image = SimpleUploadedFile("third.png", png(40, 20))
+            self.character.save()
+        self.assertEqual(self.build.delay.call_count, 2)
+
+    def test_srcset_after_render(self) -> NoReturn:
+        self.assertEqual(self.client.get(self.url).json()["character_image_srcset"], {})
+
+        build_image_derivatives("characters.CharacterModel", self.character.pk)
+        srcset = self.client.get(self.url).json()["character_image_srcset"]
+        # Never wider than the original
+        self.assertRegex(srcset["image/webp"], r"^\S+ 320w, \S+ 640w, \S+ 800w$")
+
+    def test_rerender_is_noop(self) -> NoReturn:
+        build_image_derivatives("characters.CharacterModel", self.character.pk)
+        self.character.refresh_from_db()
+        derivatives = self.character.image_derivatives
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.character.save()
+        self.assertEqual(self.build.delay.call_count, 1)
+        self.character.refresh_from_db()
+        self.assertEqual(self.character.image_derivatives, derivatives)
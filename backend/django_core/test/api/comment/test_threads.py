@@ -0,0 +1,75 @@
+from typing import NoReturn
+
+from apps.anime.models import AnimeModel
+from apps.comments.models import CommentModel
+from django.test import TestCase
+
+
+class CommentThreadTestCases(TestCase):
+    def setUp(self):
+        self.anime = AnimeModel.objects.create(mal_id=1, name="Anime")
+        self.roots = [
+            CommentModel.objects.create_child(text=f"Root {index}") for index in range(3)
+        ]
+        self.anime.comments.add(*self.roots)
+        # Ranked by score, the best reply comes first
+        self.replies = [
+            CommentModel.objects.create_child(self.roots[0], text=f"Reply {index}")
+            for index in range(4)
+        ]
+        CommentModel.objects.filter(pk=self.replies[2].pk).update(score=5)
+        self.nested = CommentModel.objects.create_child(self.replies[2], text="Nested")
+        CommentModel.objects.create_child(self.nested, text="Too deep")
+        # Another anime, never part of the thread
+        CommentModel.objects.create_child(text="Elsewhere")
+
+        self.url = f"/api/v3/anime/{self.anime.pk}/comments"
+
+    def test_thread_in_one_query(self) -> NoReturn:
+        # The anime and the thread
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"limit": 2, "replies": 2, "depth": 2})
+        thread = response.json()
+
+        self.assertEqual([item["text"] for item in thread["items"]], ["Root 0", "Root 1"])
+        self.assertIsNotNone(thread["next"])
+        root = thread["items"][0]
+        self.assertEqual(root["reply_count"], 4)
+        self.assertEqual([reply["text"] for reply in root["replies"]], ["Reply 2", "Reply 0"])
+        nested = root["replies"][0]["replies"][0]
+        self.assertEqual(nested["text"], "Nested")
+        # Below the requested depth, only counted
+        self.assertEqual((nested["replies"], nested["reply_count"]), ([], 1))
+        self.assertIsNotNone(nested["next"])
+
+        remaining = self.client.get(self.url, {"limit": 2, "cursor": thread["next"]}).json()
+        self.assertEqual([item["text"] for item in remaining["items"]], ["Root 2"])
+        self.assertIsNone(remaining["next"])
+
+    def test_load_more_replies(self) -> NoReturn:
+        root = self.client.get(self.url, {"replies": 2}).json()["items"][0]
+        response = self.client.get(
+            f"/api/v3/comments/{root['id']}/replies", {"cursor": root["next"]}
+        )
+        self.assertEqual(
+            [reply["text"] for reply in response.json()["items"]], ["Reply 1", "Reply 3"]
+        )
+
+        other = self.roots[1].pk
+        response = self.client.get(
+            f"/api/v3/comments/{other}/replies", {"cursor": root["next"]}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_deleted_comments_are_collapsed(self) -> NoReturn:
+        CommentModel.objects.filter(pk=self.replies[2].pk).update(deleted=True)
+        CommentModel.objects.filter(pk=self.replies[0].pk).update(deleted=True)
+
+        root = self.client.get(self.url, {"replies": 4}).json()["items"][0]
+        replies = {reply["id"]: reply for reply in root["replies"]}
+        # Kept for its replies, without its content
+        self.assertEqual(
+            (replies[self.replies[2].pk]["text"], replies[self.replies[2].pk]["user"]),
+            ("", None),
+        )
+        self.assertNotIn(self.replies[0].pk, replies)
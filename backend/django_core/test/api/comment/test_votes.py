@@ -0,0 +1,144 @@
+from typing import NoReturn
+from unittest import mock
+
+from apps.api.cache import get_redis
+from apps.api.models import Token
+from apps.comments.models import CommentModel
+from apps.comments.tasks import flush_comment_votes, reconcile_comment_votes
+from apps.comments.votes import (
+    DELTAS_KEY,
+    FLUSHING_KEY,
+    buffered_deltas,
+    flush_deltas,
+    parse_deltas,
+)
+from apps.user.models import CustomUser
+from django.test import SimpleTestCase, TestCase, override_settings
+
+
+class ParseDeltasTestCases(SimpleTestCase):
+    def test_flat_reply(self) -> NoReturn:
+        self.assertEqual(
+            parse_deltas([b"1:up", b"3", b"1:down", b"-1", b"2:down", None, b"2:up", b"1"]),
+            {1: (3, -1), 2: (1, 0)},
+        )
+
+
+class CommentVoteTestCases(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        token = Token.objects.create(user=self.user)
+        self.headers = {"Authorization": f"Bearer {token.token}"}
+        self.comment = CommentModel.objects.create_child(text="Comment", user=self.user)
+        self.url = f"/api/v3/comments/{self.comment.pk}/vote"
+
+    def vote(self, vote: int) -> dict:
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url,
+                {"vote": vote},
+                content_type="application/json",
+                headers=self.headers,
+            )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def assertStored(self, upvote_count: int, downvote_count: int) -> None:
+        self.comment.refresh_from_db()
+        self.assertEqual(
+            (self.comment.upvote_count, self.comment.downvote_count, self.comment.ratio),
+            (upvote_count, downvote_count, upvote_count - downvote_count),
+        )
+
+    def test_vote_is_idempotent(self) -> NoReturn:
+        self.assertEqual(self.vote(1)["score"], 1)
+        self.assertEqual(self.vote(1)["score"], 1)
+        self.assertStored(1, 0)
+        self.assertEqual(self.comment.upvotes.count(), 1)
+
+    def test_vote_changes_and_is_taken_back(self) -> NoReturn:
+        self.vote(1)
+        result = self.vote(-1)
+        self.assertEqual((result["upvote_count"], result["downvote_count"]), (0, 1))
+        self.assertStored(0, 1)
+
+        self.assertEqual(self.vote(0)["score"], 0)
+        self.assertStored(0, 0)
+
+    def test_refresh_repairs_drift(self) -> NoReturn:
+        self.comment.upvotes.add(self.user)
+        CommentModel.objects.filter(pk=self.comment.pk).update(downvote_count=4, score=-4)
+
+        self.assertEqual(CommentModel.objects.refresh_vote_counts(), 1)
+        self.assertStored(1, 0)
+        self.assertEqual(CommentModel.objects.refresh_vote_counts(), 0)
+
+
+@override_settings(COMMENT_VOTE_BUFFER=True)
+class BufferedCommentVoteTestCases(CommentVoteTestCases):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(get_redis().delete, DELTAS_KEY, FLUSHING_KEY)
+
+    def test_vote_is_buffered(self) -> NoReturn:
+        self.assertEqual(self.vote(1)["score"], 1, "Pending deltas are read back")
+        self.assertEqual(self.comment.upvotes.count(), 1)
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.upvote_count, 0)
+
+        self.assertEqual(flush_deltas(), 1)
+        self.assertStored(1, 0)
+
+    def test_refresh_leaves_pending_deltas(self) -> NoReturn:
+        self.vote(1)
+        self.assertEqual(
+            CommentModel.objects.refresh_vote_counts(buffered_deltas()),
+            0,
+            "The vote is counted once its delta is flushed",
+        )
+        flush_deltas()
+        self.assertStored(1, 0)
+
+    def test_reconcile_flushes_first(self) -> NoReturn:
+        self.vote(1)
+        CommentModel.objects.filter(pk=self.comment.pk).update(downvote_count=4, score=-4)
+
+        self.assertEqual(reconcile_comment_votes(), 1)
+        self.assertStored(1, 0)
+        self.assertEqual(flush_deltas(), 0, "Nothing left to add twice")
+        self.assertStored(1, 0)
+
+    def test_overlapping_flushes_apply_once(self) -> NoReturn:
+        self.vote(1)
+        overlapping = []
+
+        def flush(*args, **kwargs) -> int:
+            # Another worker starts flushing while this one holds the lock
+            overlapping.append(flush_comment_votes())
+            return flush_deltas(*args, **kwargs)
+
+        with mock.patch("apps.comments.tasks.flush_deltas", side_effect=flush):
+            self.assertEqual(flush_comment_votes(), 1)
+        self.assertEqual(overlapping, [0])
+        self.assertStored(1, 0)
+
+        # Released by its holder
+        self.assertEqual(flush_comment_votes(), 0)
+        self.vote(-1)
+        self.assertEqual(flush_comment_votes(), 1)
+        self.assertStored(0, 1)
+
+    def test_vote_changes_and_is_taken_back(self) -> NoReturn:
+        self.vote(1)
+        self.vote(-1)
+        self.vote(0)
+        flush_deltas()
+        self.assertStored(0, 0)
+
+    def test_vote_is_idempotent(self) -> NoReturn:
+        self.vote(1)
+        self.vote(1)
+        flush_deltas()
+        self.assertStored(1, 0)
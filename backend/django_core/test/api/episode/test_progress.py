@@ -0,0 +1,86 @@
+import datetime
+from typing import NoReturn
+
+from apps.anime.models import AnimeModel
+from apps.api.models import Token
+from apps.episodes.models import EpisodeModel, EpisodeTimestampModel
+from apps.episodes.progress import Progress, merge_progress, parse_reports, upsert_progress
+from apps.user.models import CustomUser
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+
+class ParseReportsTestCases(SimpleTestCase):
+    def test_flat_reply(self) -> NoReturn:
+        self.assertEqual(
+            parse_reports([b"1:2", b"90:0.5", b"1:3", None]),
+            {
+                (1, 2): Progress(
+                    timestamp=90,
+                    updated_at=datetime.datetime(1970, 1, 1, 0, 0, 0, 500000, datetime.UTC),
+                )
+            },
+        )
+
+    def test_merge_keeps_newest(self) -> NoReturn:
+        now = timezone.now()
+        older = Progress(timestamp=10, updated_at=now - datetime.timedelta(minutes=1))
+        newer = Progress(timestamp=20, updated_at=now)
+        self.assertEqual(merge_progress({1: newer}, {1: older, 2: older}), {1: newer, 2: older})
+        self.assertEqual(merge_progress({1: older}, {1: newer}), {1: newer})
+
+
+@override_settings(WATCH_PROGRESS_BUFFER=False)
+class WatchProgressTestCases(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        token = Token.objects.create(user=self.user)
+        self.headers = {"Authorization": f"Bearer {token.token}"}
+        self.anime = AnimeModel.objects.create(mal_id=1, name="Anime")
+        self.episodes = [
+            EpisodeModel.objects.create(
+                episode_number=number, episode_name=f"{number}", episode_length=1440
+            )
+            for number in (1, 2)
+        ]
+        self.anime.episodes.add(*self.episodes)
+
+    def report(self, episode_number: int, timestamp: int) -> dict:
+        response = self.client.put(
+            f"/api/v3/anime/{self.anime.pk}/episodes/{episode_number}/progress",
+            {"timestamp": timestamp},
+            content_type="application/json",
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_latest_report_wins(self) -> NoReturn:
+        self.report(1, 30)
+        self.report(1, 90)
+        self.report(2, 5)
+
+        response = self.client.get(
+            f"/api/v3/anime/{self.anime.pk}/progress", headers=self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(item["episode_number"], item["timestamp"]) for item in response.json()],
+            [(1, 90), (2, 5)],
+        )
+        self.assertEqual(EpisodeTimestampModel.objects.filter(user=self.user).count(), 2)
+
+    def test_older_report_is_ignored(self) -> NoReturn:
+        self.report(1, 90)
+        stale = Progress(timestamp=30, updated_at=timezone.now() - datetime.timedelta(hours=1))
+        self.assertEqual(upsert_progress({(self.user.pk, self.episodes[0].pk): stale}), 0)
+        self.assertEqual(
+            EpisodeTimestampModel.objects.get(user=self.user).timestamp,
+            90,
+        )
+
+    def test_requires_user(self) -> NoReturn:
+        response = self.client.get(f"/api/v3/anime/{self.anime.pk}/progress")
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,104 @@
+import datetime
+import io
+from typing import NoReturn
+
+from apps.anime.models import AnimeModel
+from apps.api.models import Token
+from apps.episodes.models import EpisodeModel
+from apps.episodes.stats import stat_deltas
+from apps.user.models import CustomUser
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+JANUARY = datetime.datetime(2026, 1, 31, 23, tzinfo=datetime.UTC)
+FEBRUARY = datetime.datetime(2026, 2, 1, 1, tzinfo=datetime.UTC)
+
+
+class StatDeltasTestCases(SimpleTestCase):
+    def test_new_position(self) -> NoReturn:
+        totals, months = stat_deltas({}, [(1, 2, 1300, JANUARY, True)])
+        self.assertEqual(totals, {1: [1300, 1]})
+        self.assertEqual(months, {(1, datetime.date(2026, 1, 1)): [1, 1300]})
+
+    def test_moved_position(self) -> NoReturn:
+        totals, months = stat_deltas(
+            {(1, 2): (1300, JANUARY, True)}, [(1, 2, 1400, FEBRUARY, True)]
+        )
+        self.assertEqual(totals, {1: [100, 0]})
+        self.assertEqual(
+            months,
+            {
+                (1, datetime.date(2026, 1, 1)): [-1, -1300],
+                (1, datetime.date(2026, 2, 1)): [1, 1400],
+            },
+        )
+
+
+@override_settings(WATCH_PROGRESS_BUFFER=False)
+class WatchStatsTestCases(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        token = Token.objects.create(user=self.user)
+        self.headers = {"Authorization": f"Bearer {token.token}"}
+        self.anime = AnimeModel.objects.create(mal_id=1, name="Anime")
+        self.anime.episodes.add(
+            *[
+                EpisodeModel.objects.create(
+                    episode_number=number, episode_name=f"{number}", episode_length=1440
+                )
+                for number in (1, 2)
+            ]
+        )
+
+    def report(self, episode_number: int, timestamp: int) -> None:
+        response = self.client.put(
+            f"/api/v3/anime/{self.anime.pk}/episodes/{episode_number}/progress",
+            {"timestamp": timestamp},
+            content_type="application/json",
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def stats(self) -> tuple[dict, list[dict]]:
+        stats = self.client.get("/api/v3/user/stats", headers=self.headers)
+        histogram = self.client.get("/api/v3/user/stats/histogram", headers=self.headers)
+        return stats.json(), histogram.json()
+
+    def test_empty(self) -> NoReturn:
+        self.assertEqual(self.stats(), ({"total_watchtime": 0, "episodes_completed": 0}, []))
+
+    def test_incremental_matches_rebuild(self) -> NoReturn:
+        self.report(1, 600)
+        self.report(1, 1400)
+        self.report(2, 300)
+
+        stats, histogram = self.stats()
+        self.assertEqual(stats, {"total_watchtime": 1700, "episodes_completed": 1})
+        self.assertEqual([(item["count"], item["watchtime"]) for item in histogram], [(2, 1700)])
+
+        call_command("rebuild_watch_stats", stdout=io.StringIO())
+        self.assertEqual(self.stats(), (stats, histogram))
+
+    def test_episode_length_changed(self) -> NoReturn:
+        self.report(1, 1400)
+        self.assertEqual(self.stats()[0]["episodes_completed"], 1)
+
+        # Completed by the old length only, it takes back what it added
+        EpisodeModel.objects.filter(episode_number=1).update(episode_length=3000)
+        self.report(1, 1410)
+        stats, histogram = self.stats()
+        self.assertEqual(stats, {"total_watchtime": 1410, "episodes_completed": 0})
+
+        # Completed by the new length only
+        EpisodeModel.objects.filter(episode_number=2).update(episode_length=None)
+        self.report(2, 1000)
+        EpisodeModel.objects.filter(episode_number=2).update(episode_length=1000)
+        self.report(2, 1000)
+        self.report(2, 990)
+        stats, histogram = self.stats()
+        self.assertEqual(stats, {"total_watchtime": 2400, "episodes_completed": 1})
+
+        call_command("rebuild_watch_stats", stdout=io.StringIO())
+        self.assertEqual(self.stats(), (stats, histogram))
@@ -0,0 +1,88 @@
+from typing import NoReturn
+from unittest import mock
+
+from apps.api.cache import get_redis
+from apps.search.autocomplete import (
+    SNAPSHOT_KEY,
+    VERSION_KEY,
+    PrefixIndex,
+    Row,
+    SharedIndex,
+    normalize,
+    store_snapshot,
+)
+from django.test import SimpleTestCase
+
+ROWS = [
+    Row(1, "Fullmetal Alchemist", 10, [normalize("Fullmetal Alchemist")]),
+    Row(
+        2,
+        "Fullmetal Alchemist: Brotherhood",
+        50,
+        [normalize("Fullmetal Alchemist: Brotherhood"), normalize("Hagane no Renkinjutsushi")],
+    ),
+    Row(3, "Pokémon", 5, [normalize("Pokémon"), normalize("ポケットモンスター")]),
+]
+
+
+class PrefixIndexTestCases(SimpleTestCase):
+    def setUp(self):
+        self.index = PrefixIndex.build(ROWS)
+
+    def test_ranked_by_popularity(self) -> NoReturn:
+        self.assertEqual([pk for pk, _ in self.index.complete("full", 10)], [2, 1])
+        self.assertEqual([pk for pk, _ in self.index.complete("f", 1)], [2])
+
+    def test_word_prefix(self) -> NoReturn:
+        self.assertEqual([pk for pk, _ in self.index.complete("alch", 10)], [2, 1])
+        self.assertEqual([pk for pk, _ in self.index.complete("renkin", 10)], [2])
+        self.assertEqual(self.index.complete("chemist", 10), [])
+
+    def test_normalized(self) -> NoReturn:
+        self.assertEqual(self.index.complete("POKEMON", 10), [(3, "Pokémon")])
+        self.assertEqual(self.index.complete("ポケット", 10), [(3, "Pokémon")])
+        self.assertEqual(self.index.complete("  !", 10), [])
+
+    def test_kana_keep_their_marks(self) -> NoReturn:
+        self.assertEqual(normalize("Pokémon ポケモン"), "pokemon ポケモン")
+        self.assertNotEqual(normalize("バ"), normalize("ハ"))
+        self.assertEqual(self.index.complete("ホ", 10), [])
+
+    def test_update(self) -> NoReturn:
+        index = self.index.update([Row(1, "Metal", 100, ["metal"])], [1, 3])
+        self.assertEqual(index.complete("full", 10), [(2, "Fullmetal Alchemist: Brotherhood")])
+        self.assertEqual(index.complete("metal", 10), [(1, "Metal")])
+        self.assertEqual(index.complete("poke", 10), [])
+
+    def test_snapshot(self) -> NoReturn:
+        snapshot = self.index.dumps()
+        with mock.patch.object(PrefixIndex, "rank_top") as rank_top:
+            index = PrefixIndex.loads(snapshot)
+        rank_top.assert_not_called()
+        for query in ("f", "fullmetal a", "hagane", "ポ"):
+            self.assertEqual(index.complete(query, 10), self.index.complete(query, 10))
+
+    def test_endpoint(self) -> NoReturn:
+        with mock.patch("apps.search.autocomplete.shared_index.get", return_value=self.index):
+            response = self.client.get("/api/v3/search/autocomplete", {"q": "Full", "limit": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{"id": 2, "name": "Fullmetal Alchemist: Brotherhood"}])
+
+    def test_endpoint_before_the_first_snapshot(self) -> NoReturn:
+        with mock.patch("apps.search.autocomplete.shared_index.get", return_value=None):
+            response = self.client.get("/api/v3/search/autocomplete", {"q": "Full"})
+        self.assertEqual(response.status_code, 503)
+
+
+class SharedIndexTestCases(SimpleTestCase):
+    def setUp(self):
+        self.addCleanup(get_redis().delete, SNAPSHOT_KEY, VERSION_KEY)
+
+    def test_first_load_is_synchronous(self) -> NoReturn:
+        shared = SharedIndex()
+        self.assertIsNone(shared.get(), "No snapshot yet")
+
+        store_snapshot(PrefixIndex.build(ROWS))
+        index = shared.get()
+        self.assertIsNotNone(index)
+        self.assertEqual(index.complete("poke", 10), [(3, "Pokémon")])
@@ -0,0 +1,51 @@
+from typing import NoReturn
+
+from apps.anime.models import AnimeModel
+from apps.characters.models import CharacterModel
+from apps.producers.models import ProducerModel
+from apps.search.models import SearchEntryModel
+from apps.staffs.models import StaffAlternateNameModel, StaffModel
+from django.test import TestCase
+
+
+class SearchTestCases(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.anime = AnimeModel.objects.create(mal_id=1, name="Fullmetal Alchemist")
+            self.characters = [
+                CharacterModel.objects.create(name=f"Alchemist {number}")
+                for number in range(3)
+            ]
+            self.staff = StaffModel.objects.create(name="Hiromu Arakawa")
+            self.staff.alternate_names.add(
+                StaffAlternateNameModel.objects.create(name="Alchemist Author")
+            )
+            ProducerModel.objects.create(name="Bones")
+
+    def search(self, **params) -> dict:
+        response = self.client.get("/api/v3/search/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_grouped_by_kind(self) -> NoReturn:
+        results = self.search(q="alchemist", limit=2)
+        self.assertEqual([item["id"] for item in results["anime"]], [self.anime.pk])
+        self.assertEqual(len(results["character"]), 2)
+        # Found by its alternate name
+        self.assertEqual([item["id"] for item in results["staff"]], [self.staff.pk])
+        self.assertEqual(results["producer"], [])
+
+    def test_types(self) -> NoReturn:
+        results = self.search(q="alchemist", types=["staff"])
+        self.assertEqual(results["anime"], [])
+        self.assertEqual(len(results["staff"]), 1)
+
+    def test_deleted_entity(self) -> NoReturn:
+        # `delete()` clears the pk
+        pk = self.characters[0].pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.characters[0].delete()
+        self.assertTrue(SearchEntryModel.objects.filter(kind="character").exists())
+        self.assertFalse(
+            SearchEntryModel.objects.filter(kind="character", object_id=pk).exists()
+        )
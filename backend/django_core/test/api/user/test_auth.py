@@ -0,0 +1,127 @@
+from typing import NoReturn
+from unittest import mock
+
+from apps.api.auth import process_cache, resolve_token
+from apps.api.models import Token
+from apps.user.models import CustomUser
+from django.contrib.auth.models import update_last_login
+from django.test import TestCase, override_settings
+
+
+class TokenAuthTestCases(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.url = "/api/v3/user/"
+
+    def test_token_resolves_in_one_query(self) -> NoReturn:
+        with self.assertNumQueries(1):
+            self.assertEqual(resolve_token(self.token.token), self.user)
+
+        # Authentication and the view itself
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                self.url, headers={"Authorization": f"Bearer {self.token.token}"}
+            )
+        self.assertEqual(response.json()["username"], "user")
+
+    def test_deactivated_user_is_rejected(self) -> NoReturn:
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(resolve_token(self.token.token))
+
+    def test_logged_out_token_is_rejected(self) -> NoReturn:
+        token = self.token.token
+        response = self.client.delete(
+            f"{self.url}logout", headers={"Authorization": f"Bearer {token}"}
+        )
+        self.assertEqual(response.status_code, 202)
+        self.assertIsNone(resolve_token(token))
+
+
+@override_settings(AUTH_CACHE_SECONDS=60)
+class CachedTokenAuthTestCases(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        self.first = Token.objects.create(user=self.user)
+        self.second = Token.objects.create(user=self.user)
+        self.url = "/api/v3/user/"
+        process_cache.clear()
+        self.addCleanup(process_cache.clear)
+
+    def cache_tokens(self) -> None:
+        # The first token is stored before the second one
+        for token in (self.first, self.second):
+            self.assertEqual(resolve_token(token.token), self.user)
+        with self.assertNumQueries(0):
+            for token in (self.first, self.second):
+                self.assertEqual(resolve_token(token.token), self.user)
+
+    def test_every_token_of_an_invalidated_user_is_rejected(self) -> NoReturn:
+        self.cache_tokens()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        for token in (self.first, self.second):
+            self.assertIsNone(resolve_token(token.token))
+
+    def test_logged_out_token_is_rejected(self) -> NoReturn:
+        self.cache_tokens()
+        token = self.first.token
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                f"{self.url}logout", headers={"Authorization": f"Bearer {token}"}
+            )
+        self.assertEqual(response.status_code, 202)
+        self.assertIsNone(resolve_token(token))
+        self.assertEqual(resolve_token(self.second.token), self.user)
+
+    def test_login_keeps_the_cached_tokens(self) -> NoReturn:
+        self.cache_tokens()
+        with self.captureOnCommitCallbacks(execute=True):
+            update_last_login(None, self.user)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_token(self.second.token), self.user)
+
+    def test_process_hits_skip_redis(self) -> NoReturn:
+        self.cache_tokens()
+        with mock.patch("apps.api.auth.get_redis") as get_redis:
+            self.assertEqual(resolve_token(self.first.token), self.user)
+        get_redis.assert_not_called()
+
+    def test_invalidation_keeps_other_users(self) -> NoReturn:
+        other = CustomUser.objects.create_user(
+            email="other@example.com", password="password", username="other"
+        )
+        token = Token.objects.create(user=other)
+        self.cache_tokens()
+        resolve_token(token.token)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_token(token.token), other)
+
+    @override_settings(AUTH_CACHE_PROCESS_SECONDS=0)
+    def test_other_processes_see_invalidation_once_expired(self) -> NoReturn:
+        # Without a process tier every lookup asks Redis, like another process would
+        self.cache_tokens()
+        process_cache.set(self.first.token, self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        self.assertIsNone(resolve_token(self.first.token))
+
+    def test_process_counts_are_reported_in_batches(self) -> NoReturn:
+        self.cache_tokens()
+        # Misses were reported along with their Redis lookup
+        self.assertEqual(process_cache.take_counts(), (2, 0))
+        self.assertEqual(process_cache.take_counts(), (0, 0))
@@ -0,0 +1,65 @@
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+# Takes the query and the JSON body, returns a JSON body or an error status
+Route = Callable[[dict[str, str], Any], Any]
+
+
+class FixtureServer:
+    """
+    Local stand-in for the upstream providers.
+
+    Answers with `ETag`s and honours `If-None-Match`, so conditional requests
+    behave like they do against the real APIs.
+    """
+
+    def __init__(self, routes: dict[str, Route]) -> None:
+        self.routes = routes
+        # `(method, path, status)` of every request served
+        self.log: list[tuple[str, str, int]] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def handle_route(self) -> None:
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                result = server.routes[url.path](dict(parse_qsl(url.query)), body)
+
+                if isinstance(result, int):
+                    status, payload = result, b""
+                else:
+                    payload = json.dumps(result).encode()
+                    etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+                    status = 304 if self.headers.get("If-None-Match") == etag else 200
+
+                server.log.append((self.command, url.path, status))
+                self.send_response(status)
+                if status in (200, 304) and payload:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload) if status == 200 else 0))
+                self.end_headers()
+                if status == 200:
+                    self.wfile.write(payload)
+
+            do_GET = do_POST = handle_route
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def __enter__(self) -> "FixtureServer":
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from typing import NoReturn
+
+from apps.sync.client import ProviderClient, ProviderError
+from django.test import SimpleTestCase, override_settings
+from fixture_server import FixtureServer
+
+
+class ProviderClientTestCases(SimpleTestCase):
+    def setUp(self):
+        self.responses = [503, {"data": [1, 2]}]
+        self.server = FixtureServer(
+            {"/items": lambda query, body: self.responses[0]}
+        ).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+        settings = override_settings(
+            SYNC_PROVIDERS={
+                "mal": {
+                    "url": self.server.url,
+                    "requests_per_minute": 600,
+                    "concurrency": 2,
+                    "retries": 1,
+                }
+            },
+            SYNC_HTTP_CACHE={"backend": "memory"},
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_revalidated_response_is_unchanged(self) -> NoReturn:
+        self.responses = [{"data": [1, 2]}]
+        client = ProviderClient("mal")
+
+        async def fetch_twice():
+            return [await client.get("/items", {}) for _ in range(2)]
+
+        first, second = asyncio.run(fetch_twice())
+        self.assertEqual(first, ({"data": [1, 2]}, False))
+        self.assertEqual(second, ({"data": [1, 2]}, True), "Stored body is reused")
+        self.assertEqual([status for *_, status in self.server.log], [200, 304])
+
+    def test_retries_server_errors(self) -> NoReturn:
+        client = ProviderClient("mal")
+
+        async def fetch():
+            task = asyncio.create_task(client.get("/items", {}))
+            await asyncio.sleep(0.5)
+            self.responses.pop(0)
+            return await task
+
+        self.assertEqual(asyncio.run(fetch()), ({"data": [1, 2]}, False))
+
+        self.responses = [404]
+        with self.assertRaises(ProviderError, msg="Client errors are not retried"):
+            asyncio.run(client.get("/items", {"page": 2}))
+
+    def test_requests_are_rate_limited(self) -> NoReturn:
+        self.responses = [{"data": []}]
+        client = ProviderClient("mal")
+
+        async def fetch_many():
+            await asyncio.gather(*(client.get("/items", {"page": n}) for n in range(4)))
+
+        start = time.monotonic()
+        asyncio.run(fetch_many())
+        self.assertGreaterEqual(
+            time.monotonic() - start, 0.3, "600 requests per minute, 0.1s apart"
+        )
@@ -0,0 +1,115 @@
+from typing import NoReturn
+
+from apps.characters.models import CharacterModel
+from apps.characters.tasks import get_periodic_character
+from apps.sync.models import SyncCheckpointModel
+from django.test import TransactionTestCase, override_settings
+from fixture_server import FixtureServer
+
+PAGE_SIZE = 2
+
+
+class SyncPipelineTestCases(TransactionTestCase):
+    def setUp(self):
+        self.characters = [
+            {"mal_id": index, "name": f"Character {index}", "about": None}
+            for index in range(1, 6)
+        ]
+        self.failing_pages: set[str] = set()
+        self.kitsu_mal_id = 1
+        self.server = FixtureServer(
+            {
+                "/mal/characters": self.jikan,
+                "/kitsu/characters": lambda query, body: {
+                    "data": [
+                        {
+                            "id": "10",
+                            "attributes": {
+                                "malId": self.kitsu_mal_id,
+                                "canonicalName": "Kitsu name",
+                                "description": "From kitsu",
+                            },
+                        }
+                    ],
+                    "meta": {"count": 1},
+                },
+            }
+        ).__enter__()
+        self.addCleanup(self.server.__exit__)
+
+        provider = {"requests_per_minute": 60_000, "concurrency": 2, "retries": 0}
+        settings = override_settings(
+            SYNC_PROVIDERS={
+                "mal": {**provider, "url": f"{self.server.url}/mal"},
+                "kitsu": {**provider, "url": f"{self.server.url}/kitsu"},
+                "anilist": {**provider, "url": f"{self.server.url}/anilist"},
+            },
+            SYNC_HTTP_CACHE={"backend": "memory"},
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def jikan(self, query: dict[str, str], body: None) -> dict | int:
+        if query["page"] in self.failing_pages:
+            return 500
+        page = int(query["page"])
+        return {
+            "data": self.characters[(page - 1) * PAGE_SIZE : page * PAGE_SIZE],
+            "pagination": {"last_visible_page": -(-len(self.characters) // PAGE_SIZE)},
+        }
+
+    def mal_pages_requested(self) -> int:
+        return [path for _, path, _ in self.server.log].count("/mal/characters")
+
+    def test_creates_and_links(self) -> NoReturn:
+        results = get_periodic_character()
+        self.assertEqual(results["mal"]["created"], 5)
+        self.assertEqual(results["mal"]["pages"], 3)
+
+        character = CharacterModel.objects.get(mal_id=1)
+        self.assertEqual(character.kitsu_id, 10, "Linked through `malId`")
+        self.assertEqual(character.name, "Character 1", "Kitsu does not overwrite")
+        self.assertEqual(character.about, "From kitsu", "Kitsu fills in blanks")
+
+    def test_links_rows_created_after_an_unchanged_page(self) -> NoReturn:
+        # Kitsu knows a character before MAL does
+        self.kitsu_mal_id = 6
+        get_periodic_character()
+        self.assertFalse(CharacterModel.objects.filter(kitsu_id=10).exists())
+
+        self.characters.append({"mal_id": 6, "name": "Character 6", "about": None})
+        results = get_periodic_character()
+        self.assertEqual(results["mal"]["created"], 1)
+        self.assertEqual(CharacterModel.objects.get(mal_id=6).kitsu_id, 10)
+
+    def test_updates_changed_pages_only(self) -> NoReturn:
+        get_periodic_character()
+        CharacterModel.objects.filter(mal_id=2).update(is_locked=True)
+
+        self.characters[1]["name"] = "Renamed"
+        self.characters[2]["name"] = "Renamed too"
+        results = get_periodic_character()
+
+        self.assertEqual(results["mal"]["unchanged_pages"], 1)
+        self.assertEqual(results["mal"]["updated"], 1, "Locked rows are skipped")
+        self.assertEqual(CharacterModel.objects.get(mal_id=3).name, "Renamed too")
+        self.assertEqual(CharacterModel.objects.get(mal_id=2).name, "Character 2")
+
+    def test_resumes_after_failure(self) -> NoReturn:
+        self.failing_pages = {"3"}
+        with self.assertRaises(BaseExceptionGroup):
+            get_periodic_character()
+
+        checkpoint = SyncCheckpointModel.objects.get(
+            name="characters.CharacterModel:mal"
+        )
+        self.assertTrue(checkpoint.is_running)
+        self.assertEqual(checkpoint.page, 1, "Window of pages 2 and 3 was not written")
+        self.assertEqual(CharacterModel.objects.count(), 2)
+
+        self.failing_pages = set()
+        requested = self.mal_pages_requested()
+        results = get_periodic_character()
+        self.assertEqual(results["mal"]["pages"], 2, "Resumed after page 1")
+        self.assertEqual(self.mal_pages_requested() - requested, 2)
+        self.assertEqual(CharacterModel.objects.count(), 5)
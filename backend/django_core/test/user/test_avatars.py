@@ -0,0 +1,91 @@
+import asyncio
+import tempfile
+from typing import NoReturn
+
+from apps.user.avatars import AvatarProxy, freshness
+from django.test import SimpleTestCase
+import httpx
+
+URL = "https://avatars.test/avatar/0123"
+
+
+class AvatarProxyTestCases(SimpleTestCase):
+    def setUp(self):
+        cache = tempfile.TemporaryDirectory()
+        self.addCleanup(cache.cleanup)
+        self.requests: list[httpx.Request] = []
+        self.headers = {"Cache-Control": "max-age=300", "ETag": '"v1"'}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            # Lets concurrent misses pile up
+            await asyncio.sleep(0.01)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers=self.headers)
+            return httpx.Response(
+                200,
+                headers={"Content-Type": "image/png", **self.headers},
+                content=request.url.path.encode() * 10,
+            )
+
+        self.proxy = AvatarProxy(
+            cache.name, max_bytes=1024, transport=httpx.MockTransport(handler)
+        )
+
+    def read(self, url: str = URL) -> bytes:
+        async def main() -> bytes:
+            file, _ = await self.proxy.get(url)
+            with file:
+                return file.read()
+
+        return asyncio.run(main())
+
+    def test_fresh_avatar_is_served_from_disk(self) -> NoReturn:
+        self.assertEqual(self.read(), b"/avatar/0123" * 10)
+        self.assertEqual(self.read(), b"/avatar/0123" * 10)
+        self.assertEqual(len(self.requests), 1)
+
+    def test_concurrent_misses_share_a_fetch(self) -> NoReturn:
+        async def main() -> list[bytes]:
+            files = await asyncio.gather(*(self.proxy.get(URL) for _ in range(5)))
+            contents = []
+            for file, _ in files:
+                with file:
+                    contents.append(file.read())
+            return contents
+
+        self.assertEqual(len(set(asyncio.run(main()))), 1)
+        self.assertEqual(len(self.requests), 1)
+
+    def test_stale_avatar_is_revalidated(self) -> NoReturn:
+        self.headers["Cache-Control"] = "no-cache"
+        self.read()
+        self.assertEqual(self.read(), b"/avatar/0123" * 10)
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+
+    def test_cache_stays_bounded(self) -> NoReturn:
+        for number in range(20):
+            self.read(f"{URL}{number:04}")
+        self.assertLessEqual(self.proxy.size, 1024)
+        # The most recent one survives
+        self.read(f"{URL}0019")
+        self.assertEqual(len(self.requests), 20)
+
+    def test_freshness(self) -> NoReturn:
+        self.assertEqual(freshness(httpx.Headers({"Cache-Control": "max-age=60"})), 60)
+        self.assertEqual(
+            freshness(httpx.Headers({"Cache-Control": "max-age=60", "Age": "50"})), 10
+        )
+        self.assertEqual(freshness(httpx.Headers({"Cache-Control": "no-store"})), 0)
+        self.assertEqual(
+            freshness(
+                httpx.Headers(
+                    {
+                        "Date": "Mon, 19 Oct 2026 10:00:00 GMT",
+                        "Expires": "Mon, 19 Oct 2026 10:05:00 GMT",
+                    }
+                )
+            ),
+            300,
+        )
@@ -0,0 +1,30 @@
+from typing import IO
+
+from PIL import Image
+
+from .rgb_to_hex import rgb_to_hex
+
+# Longest side the image is reduced to before it is quantized
+SAMPLE_SIZE = 64
+# Colors the image is quantized to, the most frequent one wins
+PALETTE_SIZE = 8
+
+
+def dominant_color(file: str | IO[bytes]) -> str:
+    """
+    Most frequent color of an image, as `#RRGGBB`.
+
+    The image is decoded at reduced scale where the format allows it, downscaled to
+    `SAMPLE_SIZE` and median cut to `PALETTE_SIZE` colors, all of it inside Pillow.
+    """
+    with Image.open(file) as image:
+        # JPEG decodes straight to a fraction of its size
+        image.draft("RGB", (SAMPLE_SIZE, SAMPLE_SIZE))
+        sample = image.convert("RGB")
+    sample.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE), Image.Resampling.BOX)
+
+    quantized = sample.quantize(colors=PALETTE_SIZE, method=Image.Quantize.MEDIANCUT)
+    _, index = max(quantized.getcolors(PALETTE_SIZE) or [(0, 0)])
+    palette = quantized.getpalette() or [0, 0, 0]
+    red, green, blue = palette[index * 3 : index * 3 + 3]
+    return rgb_to_hex(red, green, blue)
@@ -2,4 +2,5 @@
 
 
 def rgb_to_hex(red: int, green: int, blue: int) -> str:
-    return ("{:X}{:X}{:X}").format(red, green, blue)
+    # `#RRGGBB`, the format `ColorField` stores
+    return ("#{:02X}{:02X}{:02X}").format(red, green, blue)
@@ -1,52 +1,34 @@
 import asyncio
-import functools
 import logging
 import sys
-from concurrent.futures import ProcessPoolExecutor
-from typing import Any
 
-import anyio
 import click
-from hypercorn import Config
-from hypercorn.asyncio import serve  # type: ignore
 
-from coreproject_tracker.app import make_app
+from coreproject_tracker.datastructures import SupervisorDatastructure
 from coreproject_tracker.enums import IP
-from coreproject_tracker.envs import WORKERS_COUNT
-from coreproject_tracker.functions import check_ip_type
-from coreproject_tracker.servers import run_udp_server as _run_udp_server
-
-logging.basicConfig(
-    level=logging.INFO, format="[%(asctime)s] [%(process)d] [%(levelname)s] %(message)s"
+from coreproject_tracker.envs import (
+    ADMIN_TOKEN,
+    BACKLOG,
+    GRACEFUL_TIMEOUT,
+    HEALTH_HOST,
+    HEALTH_PORT,
+    HEARTBEAT_INTERVAL,
+    HEARTBEAT_TIMEOUT,
+    KEEP_ALIVE_TIMEOUT,
+    PIN_WORKERS,
+    RESTART_BACKOFF,
+    RESTART_BACKOFF_MAX,
+    USE_UVLOOP,
+    WORKERS_COUNT,
 )
+from coreproject_tracker.functions import check_ip_type
+from coreproject_tracker.log import setup_logging
+from coreproject_tracker.supervisor import Supervisor
 
 
-async def run_udp_server_async(host: str, port: int) -> None:
-    # There has to be one Web Server on same port as udp server to avoid redis re-initialization
-    async with anyio.create_task_group() as tg:
-        tg.start_soon(functools.partial(_run_udp_server, host, port))
-
-
-async def create_servable_app(host: str, port: int) -> Any:
-    """Create a servable app for the HTTP server"""
-    config = Config()
-    config.bind = config.insecure_bind = [f"{host}:{port}"]
-    return await serve(make_app(), config)
-
-
-def run_udp_server(host: str, port: int) -> None:
-    anyio.run(run_udp_server_async, host, port, backend="asyncio")
-
-
-def run_http_websocket_server(host: str, port: int) -> None:
-    config = Config()
-    config.bind = [f"{host}:{port}"]
-    anyio.run(create_servable_app, host, port, backend="asyncio")
-
-
-async def _main_async_wrapper(host: str, port: int) -> None:
+async def _main_async_wrapper(options: SupervisorDatastructure) -> None:
     """Async context for server management"""
-    ip_type = await check_ip_type(host)
+    ip_type = await check_ip_type(options.host)
     if ip_type == IP.IPV6:
         if sys.platform == "win32":
             raise ValueError(
@@ -54,26 +36,102 @@ async def _main_async_wrapper(host: str, port: int) -> None:
                 + "See:https://github.com/agronholm/anyio/discussions/872"
             )
 
-    loop = asyncio.get_event_loop()
-
-    with ProcessPoolExecutor() as executor:
-        # Run one instance of UDP server in the main process
-        loop.run_in_executor(executor, run_udp_server, host, port)
-
-        for _ in range(WORKERS_COUNT - 1):
-            loop.run_in_executor(executor, run_http_websocket_server, host, port)
+    await Supervisor(options).run()
 
 
 @click.command()
 @click.option("--host", default="127.0.0.1", help="Host to bind")
 @click.option("--port", default=5000, help="Port to bind")
-def main(host: str, port: int):
+@click.option(
+    "--workers",
+    default=WORKERS_COUNT,
+    show_default=True,
+    help="Total worker processes, one of them serves UDP [env: WORKERS_COUNT]",
+)
+@click.option(
+    "--keep-alive-timeout",
+    default=KEEP_ALIVE_TIMEOUT,
+    show_default=True,
+    help="Seconds to keep idle HTTP connections open [env: KEEP_ALIVE_TIMEOUT]",
+)
+@click.option(
+    "--backlog",
+    default=BACKLOG,
+    show_default=True,
+    help="Listen backlog of the HTTP sockets [env: BACKLOG]",
+)
+@click.option(
+    "--graceful-timeout",
+    default=GRACEFUL_TIMEOUT,
+    show_default=True,
+    help="Seconds workers get to drain on SIGTERM [env: GRACEFUL_TIMEOUT]",
+)
+@click.option(
+    "--uvloop/--no-uvloop",
+    default=USE_UVLOOP,
+    show_default=True,
+    help="Run workers on uvloop when it is installed [env: USE_UVLOOP]",
+)
+@click.option(
+    "--pin-workers/--no-pin-workers",
+    default=PIN_WORKERS,
+    show_default=True,
+    help="Pin every worker to its own CPU core [env: PIN_WORKERS]",
+)
+@click.option(
+    "--restart-backoff",
+    default=RESTART_BACKOFF,
+    show_default=True,
+    help="Initial delay before restarting a crashed worker [env: RESTART_BACKOFF]",
+)
+@click.option(
+    "--restart-backoff-max",
+    default=RESTART_BACKOFF_MAX,
+    show_default=True,
+    help="Upper bound of the restart delay [env: RESTART_BACKOFF_MAX]",
+)
+@click.option(
+    "--heartbeat-interval",
+    default=HEARTBEAT_INTERVAL,
+    show_default=True,
+    help="Seconds between worker heartbeats [env: HEARTBEAT_INTERVAL]",
+)
+@click.option(
+    "--heartbeat-timeout",
+    default=HEARTBEAT_TIMEOUT,
+    show_default=True,
+    help="Kill workers whose event loop stalls for this long [env: HEARTBEAT_TIMEOUT]",
+)
+@click.option(
+    "--health-host",
+    default=HEALTH_HOST,
+    show_default=True,
+    help="Host of the worker health endpoint [env: HEALTH_HOST]",
+)
+@click.option(
+    "--health-port",
+    default=HEALTH_PORT,
+    show_default=True,
+    help="Port of the worker health endpoint, 0 disables it [env: HEALTH_PORT]",
+)
+def main(host: str, port: int, **kwargs):
     """Entry point for CoreProject Tracker"""
-
+    options = SupervisorDatastructure(
+        host=host,
+        port=port,
+        use_uvloop=kwargs.pop("uvloop"),
+        # Only read from the environment, secrets do not belong in the process arguments
+        admin_token=ADMIN_TOKEN,
+        **kwargs,
+    )
+
+    listener = setup_logging()
     try:
-        asyncio.run(_main_async_wrapper(host, port))
+        asyncio.run(_main_async_wrapper(options))
     except KeyboardInterrupt:
         logging.info("Application shutdown complete")
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
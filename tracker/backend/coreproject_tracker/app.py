@@ -1,3 +1,6 @@
+from http import HTTPStatus
+from math import ceil
+
 from quart import Quart
 from quart_cors import cors
 
@@ -9,6 +12,7 @@ except ImportError:
     HAS_FLASK_ORJSON = False
 
 from coreproject_tracker.envs import REDIS_URI
+from coreproject_tracker.exceptions import RedisUnavailable
 from coreproject_tracker.servers import http_blueprint, ws_blueprint
 
 
@@ -31,6 +35,15 @@ def make_app() -> Quart:
     async def after_serving():
         await redis_manager.close_redis()
 
+    @app.errorhandler(RedisUnavailable)
+    async def redis_unavailable(error: RedisUnavailable):
+        # Shed load while the Redis circuit breaker is open
+        return (
+            str(error),
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            {"Retry-After": str(ceil(error.retry_after))},
+        )
+
     app.register_blueprint(http_blueprint)
     app.register_blueprint(ws_blueprint)
 
@@ -1,12 +1,20 @@
 from .interval import (
     ANNOUNCE_INTERVAL as ANNOUNCE_INTERVAL,
 )
+from .log import LOG_FORMAT as LOG_FORMAT
 from .peers import (
     DEFAULT_ANNOUNCE_PEERS as DEFAULT_ANNOUNCE_PEERS,
     MAX_ANNOUNCE_PEERS as MAX_ANNOUNCE_PEERS,
 )
+from .profiler import (
+    LOOP_LAG_INTERVAL as LOOP_LAG_INTERVAL,
+    PROFILE_DEFAULT_INTERVAL as PROFILE_DEFAULT_INTERVAL,
+    PROFILE_DEFAULT_SECONDS as PROFILE_DEFAULT_SECONDS,
+    PROFILE_MAX_SECONDS as PROFILE_MAX_SECONDS,
+)
 from .redis import (
     HASH_EXPIRE_TIME as HASH_EXPIRE_TIME,
+    REDIS_METRICS as REDIS_METRICS,
     REDIS_SERVER_VERSION as REDIS_SERVER_VERSION,
 )
 from .ttl import (
@@ -0,0 +1 @@
+LOG_FORMAT = "[%(asctime)s] [%(process)d] [%(levelname)s] %(message)s"
@@ -0,0 +1,6 @@
+PROFILE_DEFAULT_SECONDS = 10
+PROFILE_MAX_SECONDS = 120
+# Seconds between two stack samples of the event loop thread
+PROFILE_DEFAULT_INTERVAL = 0.005
+# Seconds between two event loop lag probes
+LOOP_LAG_INTERVAL = 0.01
@@ -4,3 +4,16 @@ HASH_EXPIRE_TIME = int(timedelta(days=1).total_seconds())
 
 # Minimum redis version we support
 REDIS_SERVER_VERSION = "7.4.2"
+
+# Slots of the shared per worker metrics array, see `RedisHandler.metrics`
+REDIS_METRICS = (
+    "pool_max_connections",
+    "pool_in_use",
+    "pool_idle",
+    "pool_waits",
+    "pool_exhausted",
+    "breaker_state",
+    "breaker_trips",
+    "breaker_rejected",
+    "command_latency_ms",
+)
@@ -2,6 +2,7 @@
 from .immutable import (
     HttpDatastructure as HttpDatastructure,
     RedisDatastructure as RedisDatastructure,
+    SupervisorDatastructure as SupervisorDatastructure,
     UdpDatastructure as UdpDatastructure,
     WebsocketDatastructure as WebsocketDatastructure,
 )
@@ -1,4 +1,5 @@
 from .http import HttpDatastructure as HttpDatastructure
 from .redis import RedisDatastructure as RedisDatastructure
+from .supervisor import SupervisorDatastructure as SupervisorDatastructure
 from .udp import UdpDatastructure as UdpDatastructure
 from .websocket import WebsocketDatastructure as WebsocketDatastructure
@@ -0,0 +1,31 @@
+from attrs import define, field, validators
+
+from coreproject_tracker.validators import validate_port
+
+__all__ = ["SupervisorDatastructure"]
+
+
+@define(frozen=True)
+class SupervisorDatastructure:
+    host: str = field(validator=validators.instance_of(str))
+    port: int = field(converter=int, validator=[validate_port])
+    # 1 UDP worker + at least 1 HTTP/Websocket worker
+    workers: int = field(converter=int, validator=validators.ge(2))
+
+    # Hypercorn
+    keep_alive_timeout: float = field(converter=float, validator=validators.gt(0))
+    backlog: int = field(converter=int, validator=validators.gt(0))
+    graceful_timeout: float = field(converter=float, validator=validators.ge(0))
+
+    # Worker runtime
+    use_uvloop: bool = field(converter=bool)
+    pin_workers: bool = field(converter=bool)
+
+    # Supervision
+    restart_backoff: float = field(converter=float, validator=validators.gt(0))
+    restart_backoff_max: float = field(converter=float, validator=validators.gt(0))
+    heartbeat_interval: float = field(converter=float, validator=validators.gt(0))
+    heartbeat_timeout: float = field(converter=float, validator=validators.gt(0))
+    health_host: str = field(validator=validators.instance_of(str))
+    health_port: int = field(converter=int, validator=validators.ge(0))
+    admin_token: str = field(validator=validators.instance_of(str), repr=False)
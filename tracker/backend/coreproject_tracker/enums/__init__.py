@@ -1,4 +1,7 @@
 from .actions import ACTIONS as ACTIONS
+from .breaker import BREAKER_STATE as BREAKER_STATE
 from .enum import EVENT_NAMES as EVENT_NAMES
 from .ip import IP as IP
+from .log import LOG_EVENT as LOG_EVENT
 from .redis import REDIS_NAMESPACE_ENUM as REDIS_NAMESPACE_ENUM
+from .worker import WORKER_ROLE as WORKER_ROLE
@@ -0,0 +1,9 @@
+from enum import Enum
+
+__all__ = ["BREAKER_STATE"]
+
+
+class BREAKER_STATE(str, Enum):
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
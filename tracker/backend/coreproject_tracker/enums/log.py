@@ -0,0 +1,15 @@
+from enum import Enum
+
+__all__ = ["LOG_EVENT"]
+
+
+class LOG_EVENT(str, Enum):
+    """Event names attached to log records, sampling rates are configured per event."""
+
+    UDP_ANNOUNCE = "udp.announce"
+    HTTP_ANNOUNCE = "http.announce"
+    HTTP_BAD_REQUEST = "http.bad_request"
+    WEBSOCKET_ANNOUNCE = "websocket.announce"
+    WEBSOCKET_DISCONNECT = "websocket.disconnect"
+    PEER_INVALID = "peer.invalid"
+    REDIS_SHED = "redis.shed"
@@ -0,0 +1,8 @@
+from enum import Enum
+
+__all__ = ["WORKER_ROLE"]
+
+
+class WORKER_ROLE(str, Enum):
+    UDP = "udp"
+    HTTP = "http"
@@ -1,7 +1,37 @@
+from .log import (
+    LOG_JSON as LOG_JSON,
+    LOG_LEVEL as LOG_LEVEL,
+    LOG_SAMPLE_RATES as LOG_SAMPLE_RATES,
+)
 from .redis import (
+    REDIS_BREAKER_COOLDOWN as REDIS_BREAKER_COOLDOWN,
+    REDIS_BREAKER_LATENCY as REDIS_BREAKER_LATENCY,
+    REDIS_BREAKER_THRESHOLD as REDIS_BREAKER_THRESHOLD,
     REDIS_DATABASE as REDIS_DATABASE,
+    REDIS_HEALTH_CHECK_INTERVAL as REDIS_HEALTH_CHECK_INTERVAL,
     REDIS_HOST as REDIS_HOST,
+    REDIS_MAX_CONNECTIONS as REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT as REDIS_POOL_TIMEOUT,
     REDIS_PORT as REDIS_PORT,
+    REDIS_SOCKET_CONNECT_TIMEOUT as REDIS_SOCKET_CONNECT_TIMEOUT,
+    REDIS_SOCKET_PATH as REDIS_SOCKET_PATH,
+    REDIS_SOCKET_TIMEOUT as REDIS_SOCKET_TIMEOUT,
     REDIS_URI as REDIS_URI,
 )
+from .server import (
+    BACKLOG as BACKLOG,
+    GRACEFUL_TIMEOUT as GRACEFUL_TIMEOUT,
+    KEEP_ALIVE_TIMEOUT as KEEP_ALIVE_TIMEOUT,
+)
+from .supervisor import (
+    ADMIN_TOKEN as ADMIN_TOKEN,
+    HEALTH_HOST as HEALTH_HOST,
+    HEALTH_PORT as HEALTH_PORT,
+    HEARTBEAT_INTERVAL as HEARTBEAT_INTERVAL,
+    HEARTBEAT_TIMEOUT as HEARTBEAT_TIMEOUT,
+    PIN_WORKERS as PIN_WORKERS,
+    RESTART_BACKOFF as RESTART_BACKOFF,
+    RESTART_BACKOFF_MAX as RESTART_BACKOFF_MAX,
+    USE_UVLOOP as USE_UVLOOP,
+)
 from .workers import WORKERS_COUNT as WORKERS_COUNT
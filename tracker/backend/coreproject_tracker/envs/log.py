@@ -0,0 +1,26 @@
+import os
+
+from .utils import to_bool
+
+__all__ = ["LOG_LEVEL", "LOG_JSON", "LOG_SAMPLE_RATES"]
+
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+# Emit one JSON object per line instead of the plain text format
+LOG_JSON = to_bool(os.environ.get("LOG_JSON", "false"))
+
+
+def _parse_sample_rates(value: str) -> dict[str, float]:
+    """
+    Parse `event=rate` pairs, for example `udp.announce=0.01,http.announce=0`.
+
+    Events that are not listed are always logged.
+    """
+    rates: dict[str, float] = {}
+    for pair in filter(None, (item.strip() for item in value.split(","))):
+        event, _, rate = pair.partition("=")
+        rates[event.strip()] = min(max(float(rate), 0.0), 1.0)
+    return rates
+
+
+# Fraction of records kept per event, `WARNING` and above are never sampled
+LOG_SAMPLE_RATES = _parse_sample_rates(os.environ.get("LOG_SAMPLE_RATES", ""))
@@ -1,9 +1,43 @@
 import os
 
-__all__ = ["REDIS_HOST", "REDIS_PORT", "REDIS_DATABASE"]
+__all__ = [
+    "REDIS_HOST",
+    "REDIS_PORT",
+    "REDIS_DATABASE",
+    "REDIS_SOCKET_PATH",
+    "REDIS_URI",
+    "REDIS_MAX_CONNECTIONS",
+    "REDIS_POOL_TIMEOUT",
+    "REDIS_SOCKET_TIMEOUT",
+    "REDIS_SOCKET_CONNECT_TIMEOUT",
+    "REDIS_HEALTH_CHECK_INTERVAL",
+    "REDIS_BREAKER_LATENCY",
+    "REDIS_BREAKER_THRESHOLD",
+    "REDIS_BREAKER_COOLDOWN",
+]
 
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = os.environ.get("REDIS_PORT", 6379)
 REDIS_DATABASE = os.environ.get("REDIS_DATABASE", 0)
+# Connect through a unix socket instead of TCP when set
+REDIS_SOCKET_PATH = os.environ.get("REDIS_SOCKET_PATH", "")
 
-REDIS_URI = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DATABASE}"
+if REDIS_SOCKET_PATH:
+    REDIS_URI = f"unix://{REDIS_SOCKET_PATH}?db={REDIS_DATABASE}"
+else:
+    REDIS_URI = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DATABASE}"
+
+# Connection pool, one per worker process
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", 64))
+# Seconds a command waits for a free connection before failing
+REDIS_POOL_TIMEOUT = float(os.environ.get("REDIS_POOL_TIMEOUT", 1))
+REDIS_SOCKET_TIMEOUT = float(os.environ.get("REDIS_SOCKET_TIMEOUT", 2))
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.environ.get("REDIS_SOCKET_CONNECT_TIMEOUT", 2))
+# Seconds an idle connection may sit in the pool before it is pinged on checkout
+REDIS_HEALTH_CHECK_INTERVAL = int(os.environ.get("REDIS_HEALTH_CHECK_INTERVAL", 30))
+
+# Circuit breaker, commands slower than `REDIS_BREAKER_LATENCY` seconds count as failures.
+# `REDIS_BREAKER_THRESHOLD` consecutive failures shed load for `REDIS_BREAKER_COOLDOWN` seconds.
+REDIS_BREAKER_LATENCY = float(os.environ.get("REDIS_BREAKER_LATENCY", 0.25))
+REDIS_BREAKER_THRESHOLD = int(os.environ.get("REDIS_BREAKER_THRESHOLD", 10))
+REDIS_BREAKER_COOLDOWN = float(os.environ.get("REDIS_BREAKER_COOLDOWN", 5))
@@ -0,0 +1,9 @@
+import os
+
+__all__ = ["KEEP_ALIVE_TIMEOUT", "BACKLOG", "GRACEFUL_TIMEOUT"]
+
+# Hypercorn tuning, defaults mirror hypercorn's own defaults
+KEEP_ALIVE_TIMEOUT = float(os.environ.get("KEEP_ALIVE_TIMEOUT", 5))
+BACKLOG = int(os.environ.get("BACKLOG", 100))
+# Seconds a worker waits for in-flight requests after `SIGTERM`
+GRACEFUL_TIMEOUT = float(os.environ.get("GRACEFUL_TIMEOUT", 3))
@@ -0,0 +1,38 @@
+import os
+import sys
+
+from .utils import to_bool
+
+__all__ = [
+    "USE_UVLOOP",
+    "PIN_WORKERS",
+    "RESTART_BACKOFF",
+    "RESTART_BACKOFF_MAX",
+    "HEARTBEAT_INTERVAL",
+    "HEARTBEAT_TIMEOUT",
+    "HEALTH_HOST",
+    "HEALTH_PORT",
+    "ADMIN_TOKEN",
+]
+
+
+# uvloop is only installed on linux (see `pyproject.toml`)
+USE_UVLOOP = to_bool(os.environ.get("USE_UVLOOP", str(sys.platform == "linux")))
+# `sched_setaffinity` is only available on linux
+PIN_WORKERS = to_bool(os.environ.get("PIN_WORKERS", str(sys.platform == "linux")))
+
+# Exponential backoff ( in seconds ) used when restarting crashed workers
+RESTART_BACKOFF = float(os.environ.get("RESTART_BACKOFF", 0.5))
+RESTART_BACKOFF_MAX = float(os.environ.get("RESTART_BACKOFF_MAX", 30))
+
+# Workers stamp a shared heartbeat from their event loop.
+# A worker whose heartbeat is older than `HEARTBEAT_TIMEOUT` is considered stuck and killed.
+HEARTBEAT_INTERVAL = float(os.environ.get("HEARTBEAT_INTERVAL", 1))
+HEARTBEAT_TIMEOUT = float(os.environ.get("HEARTBEAT_TIMEOUT", 30))
+
+# Per worker health endpoint served by the supervisor, `0` disables it
+HEALTH_HOST = os.environ.get("HEALTH_HOST", "127.0.0.1")
+HEALTH_PORT = int(os.environ.get("HEALTH_PORT", 5001))
+
+# Bearer token guarding the admin routes ( `/profile` ) of the health endpoint, empty disables them
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
@@ -0,0 +1,5 @@
+__all__ = ["to_bool"]
+
+
+def to_bool(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "on"}
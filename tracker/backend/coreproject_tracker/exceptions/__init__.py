@@ -1 +1,4 @@
-from .redis import RedisNotInitialized as RedisNotInitialized
+from .redis import (
+    RedisNotInitialized as RedisNotInitialized,
+    RedisUnavailable as RedisUnavailable,
+)
@@ -1,2 +1,10 @@
 class RedisNotInitialized(Exception):
     pass
+
+
+class RedisUnavailable(Exception):
+    """Raised instead of calling Redis while its circuit breaker is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Redis is unavailable, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
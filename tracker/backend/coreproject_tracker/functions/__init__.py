@@ -1,4 +1,5 @@
 from .array import get_n_random_items as get_n_random_items
+from .bencode import bencode_announce as bencode_announce
 from .bytes import (
     from_uint16 as from_uint16,
     from_uint32 as from_uint32,
@@ -27,3 +28,4 @@ from .redis import (
     hget as hget,
     hset as hset,
 )
+from .signals import wait_for_shutdown_signal as wait_for_shutdown_signal
@@ -0,0 +1,67 @@
+from typing import Iterable
+
+from coreproject_tracker.constants import ANNOUNCE_INTERVAL
+
+__all__ = ["bencode_announce"]
+
+# Keys of a bencoded dictionary must be sorted, the fragments below are laid out in that order:
+# complete, incomplete, interval, min interval, peers, peers6
+_COMPLETE = b"d8:completei"
+_INCOMPLETE = b"e10:incompletei"
+_INTERVALS = b"".join(
+    [
+        b"e8:intervali",
+        str(ANNOUNCE_INTERVAL).encode(),
+        b"e12:min intervali",
+        str(ANNOUNCE_INTERVAL).encode(),
+        b"e",
+    ]
+)
+_PEERS = b"5:peersl"
+_PEERS6 = b"e6:peers6l"
+_END = b"ee"
+
+# A peer is a dictionary of ip, peer id, port
+_PEER_IP = b"d2:ip"
+_PEER_ID = b"7:peer id"
+_PEER_PORT = b"4:porti"
+_PEER_END = b"ee"
+
+
+def _append_string(parts: list[bytes], value: str) -> None:
+    encoded = value.encode()
+    parts.append(b"%d:" % len(encoded))
+    parts.append(encoded)
+
+
+def _append_peers(parts: list[bytes], peers: Iterable[tuple[str, str, int]]) -> None:
+    for peer_id, ip, port in peers:
+        parts.append(_PEER_IP)
+        _append_string(parts, ip)
+        parts.append(_PEER_ID)
+        _append_string(parts, peer_id)
+        parts.append(_PEER_PORT)
+        parts.append(b"%d" % port)
+        parts.append(_PEER_END)
+
+
+def bencode_announce(
+    complete: int,
+    incomplete: int,
+    peers: Iterable[tuple[str, str, int]],
+    peers6: Iterable[tuple[str, str, int]],
+) -> bytes:
+    """
+    Bencode an HTTP announce response.
+
+    Peers are `(peer_id, ip, port)` tuples.
+    Produces the same bytes as `bencodepy.bencode` on the equivalent dictionary,
+    the fixed keys are precomputed and everything is joined once.
+    """
+    parts = [_COMPLETE, b"%d" % complete, _INCOMPLETE, b"%d" % incomplete, _INTERVALS]
+    parts.append(_PEERS)
+    _append_peers(parts, peers)
+    parts.append(_PEERS6)
+    _append_peers(parts, peers6)
+    parts.append(_END)
+    return b"".join(parts)
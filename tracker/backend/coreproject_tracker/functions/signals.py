@@ -0,0 +1,19 @@
+import logging
+import signal
+import sys
+
+import anyio
+
+__all__ = ["wait_for_shutdown_signal"]
+
+
+async def wait_for_shutdown_signal() -> None:
+    """Block until the process receives `SIGTERM` or `SIGINT`."""
+    if sys.platform == "win32":
+        # No signal receivers on windows, `KeyboardInterrupt` tears the loop down instead
+        await anyio.sleep_forever()
+
+    with anyio.open_signal_receiver(signal.SIGTERM, signal.SIGINT) as signals:
+        async for signum in signals:
+            logging.info(f"Received {signum.name}, draining")
+            return
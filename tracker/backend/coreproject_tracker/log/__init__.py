@@ -0,0 +1,6 @@
+from .formatter import JsonFormatter as JsonFormatter
+from .handlers import (
+    LazyQueueHandler as LazyQueueHandler,
+    SamplingFilter as SamplingFilter,
+)
+from .setup import setup_logging as setup_logging
@@ -0,0 +1,37 @@
+import logging
+from datetime import UTC, datetime
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import]
+
+    HAS_ORJSON = True
+except ImportError:
+    import json
+
+    HAS_ORJSON = False
+
+__all__ = ["JsonFormatter"]
+
+
+class JsonFormatter(logging.Formatter):
+    """Render a record as a single line JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "pid": record.process,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if event := getattr(record, "event", None):
+            payload["event"] = str(getattr(event, "value", event))
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+
+        if HAS_ORJSON:
+            return orjson.dumps(payload, default=str).decode()
+        return json.dumps(payload, default=str)
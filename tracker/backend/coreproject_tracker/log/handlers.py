@@ -0,0 +1,43 @@
+import logging
+import logging.handlers
+import random
+
+__all__ = ["SamplingFilter", "LazyQueueHandler"]
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of the records of every configured event.
+
+    Records carry their event through `extra={"event": LOG_EVENT.X}`.
+    Records without an event, or at `WARNING` and above, always pass.
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        event = getattr(record, "event", None)
+        if event is None:
+            return True
+
+        rate = self.rates.get(getattr(event, "value", event), 1.0)
+        if rate >= 1.0:
+            return True
+        return rate > 0.0 and random.random() < rate
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hand records to the listener thread without formatting them.
+
+    `QueueHandler.prepare` formats the message on the calling thread so records can be pickled.
+    The queue never leaves the process, so the formatting is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
@@ -0,0 +1,41 @@
+import logging
+import logging.handlers
+import queue
+
+from coreproject_tracker.constants import LOG_FORMAT
+from coreproject_tracker.envs import LOG_JSON, LOG_LEVEL, LOG_SAMPLE_RATES
+
+from .formatter import JsonFormatter
+from .handlers import LazyQueueHandler, SamplingFilter
+
+__all__ = ["setup_logging"]
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Route the root logger through a queue drained by a background thread.
+
+    Sampling happens before a record is queued, formatting and writing happen on the listener.
+    The caller owns the returned listener and must `stop()` it to flush pending records.
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        JsonFormatter() if LOG_JSON else logging.Formatter(LOG_FORMAT)
+    )
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = LazyQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(LOG_SAMPLE_RATES))
+
+    root = logging.getLogger()
+    # Drop handlers inherited from the parent process or installed by `basicConfig`
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(LOG_LEVEL)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    return listener
@@ -4,17 +4,16 @@ from http import HTTPStatus
 from importlib.metadata import version
 from typing import cast
 
-import bencodepy  # type: ignore
 from quart import Blueprint, json, jsonify, request
 
-from coreproject_tracker.constants import ANNOUNCE_INTERVAL
 from coreproject_tracker.datastructures import (
     HttpDatastructure,
     MutableBox,
     RedisDatastructure,
 )
-from coreproject_tracker.enums import EVENT_NAMES, IP, REDIS_NAMESPACE_ENUM
+from coreproject_tracker.enums import EVENT_NAMES, IP, LOG_EVENT, REDIS_NAMESPACE_ENUM
 from coreproject_tracker.functions import (
+    bencode_announce,
     check_ip_type,
     convert_event_name_to_event_enum,
     decode_dictionary,
@@ -72,7 +71,12 @@ async def http_endpoint():
         data = HttpDatastructure(**_data)  # type: ignore[call-arg]
 
     except Exception as e:
-        print(e)
+        logging.warning(
+            "Invalid HTTP announce from %s: %s",
+            ip,
+            e,
+            extra={"event": LOG_EVENT.HTTP_BAD_REQUEST},
+        )
         return str(e), HTTPStatus.BAD_REQUEST
 
     if data.event_name == EVENT_NAMES.STOP:
@@ -94,8 +98,10 @@ async def http_endpoint():
 
     await redis_stroage.save()
 
-    peers = peers6 = MutableBox[list[dict[str, str]]]([])
-    seeders = leechers = MutableBox[int](0)
+    peers = MutableBox[list[tuple[str, str, int]]]([])
+    peers6 = MutableBox[list[tuple[str, str, int]]]([])
+    seeders = MutableBox[int](0)
+    leechers = MutableBox[int](0)
 
     redis_data = (
         await hget(data.info_hash, namespace=REDIS_NAMESPACE_ENUM.HTTP_UDP) or {}
@@ -112,11 +118,7 @@ async def http_endpoint():
                 else:
                     leechers.value += 1
 
-                appendable_data = {
-                    "peer id": peer_data.peer_id,
-                    "ip": peer_data.peer_ip,
-                    "port": peer_data.port,
-                }
+                appendable_data = (peer_data.peer_id, peer_data.peer_ip, peer_data.port)
 
                 match await check_ip_type(peer_data.peer_ip):
                     case IP.IPV4:
@@ -126,24 +128,26 @@ async def http_endpoint():
 
         except TypeError:
             # Error in the peer data, delete the peer
-            logging.error(f"Error in peer data, deleting the peer: {data.peer_id}")
+            logging.error(
+                "Error in peer data, deleting the peer: %s",
+                data.peer_id,
+                extra={"event": LOG_EVENT.PEER_INVALID},
+            )
             await hdel(
                 data.info_hash,
                 f"{data.peer_ip}:{data.port}",
                 namespace=REDIS_NAMESPACE_ENUM.HTTP_UDP,
             )
 
-    output = {
-        "peers": peers.value,
-        "peers6": peers6.value,
-        "min interval": ANNOUNCE_INTERVAL,
-        "complete": seeders.value,
-        "incomplete": leechers.value,
-    }
     logging.info(
-        f"Sent HTTP response for {data.info_hash}. Event: {data.event_name}. Peers: {len(peers.value)}. Peers6: {len(peers6.value)}."
+        "Sent HTTP response for %s. Event: %s. Peers: %d. Peers6: %d.",
+        data.info_hash,
+        data.event_name,
+        len(peers.value),
+        len(peers6.value),
+        extra={"event": LOG_EVENT.HTTP_ANNOUNCE},
     )
-    return bencodepy.bencode(output)
+    return bencode_announce(seeders.value, leechers.value, peers.value, peers6.value)
 
 
 @http_blueprint.route("/api")
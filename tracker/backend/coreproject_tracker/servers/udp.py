@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 from typing import cast
 
 import anyio
+from anyio.abc import UDPSocket
 from quart import json
 
 from coreproject_tracker.datastructures import (
@@ -11,8 +12,14 @@ from coreproject_tracker.datastructures import (
     RedisDatastructure,
     UdpDatastructure,
 )
-from coreproject_tracker.enums import ACTIONS, EVENT_NAMES, REDIS_NAMESPACE_ENUM
+from coreproject_tracker.enums import (
+    ACTIONS,
+    EVENT_NAMES,
+    LOG_EVENT,
+    REDIS_NAMESPACE_ENUM,
+)
 from coreproject_tracker.envs import REDIS_URI
+from coreproject_tracker.exceptions import RedisUnavailable
 from coreproject_tracker.functions import (
     addrs_to_compact,
     convert_event_id_to_event_enum,
@@ -79,6 +86,121 @@ async def make_udp_packet(params: UdpDatastructure) -> bytes:
     return packet
 
 
+async def handle_udp_packet(
+    udp: UDPSocket,
+    packet: bytes,
+    host: str,
+    port: int,
+) -> None:
+    """Parse one tracker request and answer it on the same socket."""
+    if len(packet) < 16:
+        await udp.sendto("Too small payload".encode(), host, port)
+        return
+
+    _data = {
+        "connection_id": packet[0:8],
+        "action": await from_uint32(packet[8:12]),
+        "transaction_id": await from_uint32(packet[12:16]),
+    }
+    data = UdpDatastructure(**_data)
+
+    if data.action == ACTIONS.ANNOUNCE:
+        _data |= {
+            "info_hash": packet[16:36],  # 20 bytes
+            "peer_id": packet[36:56].hex(),  # 20 bytes
+            "downloaded": from_uint64(
+                packet[56:64]  # Convert 64-bit unsigned integer
+            ),
+            "left": from_uint64(
+                packet[64:72]  # Convert 64-bit unsigned integer
+            ),
+            "uploaded": from_uint64(
+                packet[72:80]  # Convert 64-bit unsigned integer
+            ),
+            "event_name": await convert_event_id_to_event_enum(
+                await from_uint32(
+                    packet[80:84]  # Read 4-byte unsigned int (big-endian)
+                ),
+            ),
+            "ip": await from_uint32(packet[84:88]) or host,
+            "key": await from_uint32(packet[88:92]),
+            "numwant": await from_uint32(packet[92:96]),
+            "port": await from_uint16(packet[96:98]) or port,
+        }
+        data = UdpDatastructure(**_data)
+        redis_stroage = RedisDatastructure(
+            info_hash=data.info_hash.hex(),
+            type="udp",
+            peer_id=data.peer_id,
+            peer_ip=data.ip,
+            port=data.port,
+            left=data.left,
+        )
+
+        await redis_stroage.save()
+
+        redis_data = (
+            await hget(
+                data.info_hash.hex(),
+                namespace=REDIS_NAMESPACE_ENUM.HTTP_UDP,
+            )
+            or {}
+        )
+        peers_list = await get_n_random_items(redis_data.values(), data.numwant)
+
+        peers = MutableBox[list[str]]([])
+        seeders = leechers = MutableBox[int](0)
+
+        for peer in peers_list:
+            peer = cast(str, peer)
+
+            try:
+                with rollback_on_exception(peers, seeders, leechers):
+                    peer_data = RedisDatastructure(**json.loads(peer))
+                    if peer_data.left == 0:
+                        seeders.value += 1
+                    else:
+                        leechers.value += 1
+
+                    peers.value.append(f"{peer_data.peer_ip}:{peer_data.port}")
+
+            except TypeError:
+                # Error in the peer data, delete the peer
+                logging.error(
+                    "Error in peer data, deleting the peer: %s",
+                    data.peer_id,
+                    extra={"event": LOG_EVENT.PEER_INVALID},
+                )
+                await hdel(
+                    data.info_hash,
+                    f"{data.ip}:{data.port}",
+                    namespace=REDIS_NAMESPACE_ENUM.HTTP_UDP,
+                )
+
+        _data |= {
+            "peers": await addrs_to_compact(peers.value),
+            "complete": seeders.value,
+            "incomplete": leechers.value,
+        }
+        data = UdpDatastructure(**_data)
+
+    if data.event_name == EVENT_NAMES.STOP:
+        await hdel(
+            data.info_hash,
+            f"{data.ip}:{data.port}",
+            namespace=REDIS_NAMESPACE_ENUM.HTTP_UDP,
+        )
+
+    packet = await make_udp_packet(data)
+    logging.info(
+        "Sent UDP packet for %s:%s",
+        host,
+        port,
+        extra={"event": LOG_EVENT.UDP_ANNOUNCE},
+    )
+    await udp.sendto(packet, host, port)
+
+
 async def run_udp_server(server_host: str, server_port: int):
     logging.info(f"Running UDP server on udp://{server_host}:{server_port}")
     opts: dict[str, str | int | bool] = {
@@ -90,114 +212,18 @@ async def run_udp_server(server_host: str, server_port: int):
             "reuse_port": True,
         }
 
-    redis_manager = RedisHandler(REDIS_URI)
-    await redis_manager.init_redis()
-
     async with redis_lifecycle():
         async with await anyio.create_udp_socket(**opts) as udp:
             async for packet, (host, port) in udp:
-                if len(packet) < 16:
-                    await udp.sendto("Too small payload".encode(), host, port)
-                    continue
-
-                _data = {
-                    "connection_id": packet[0:8],
-                    "action": await from_uint32(packet[8:12]),
-                    "transaction_id": await from_uint32(packet[12:16]),
-                }
-                data = UdpDatastructure(**_data)
-
-                if data.action == ACTIONS.ANNOUNCE:
-                    _data |= {
-                        "info_hash": packet[16:36],  # 20 bytes
-                        "peer_id": packet[36:56].hex(),  # 20 bytes
-                        "downloaded": from_uint64(
-                            packet[56:64]  # Convert 64-bit unsigned integer
-                        ),
-                        "left": from_uint64(
-                            packet[64:72]  # Convert 64-bit unsigned integer
-                        ),
-                        "uploaded": from_uint64(
-                            packet[72:80]  # Convert 64-bit unsigned integer
-                        ),
-                        "event_name": await convert_event_id_to_event_enum(
-                            await from_uint32(
-                                packet[80:84]  # Read 4-byte unsigned int (big-endian)
-                            ),
-                        ),
-                        "ip": await from_uint32(packet[84:88]) or host,
-                        "key": await from_uint32(packet[88:92]),
-                        "numwant": await from_uint32(packet[92:96]),
-                        "port": await from_uint16(packet[96:98]) or port,
-                    }
-                    data = UdpDatastructure(**_data)
-                    redis_stroage = RedisDatastructure(
-                        info_hash=data.info_hash.hex(),
-                        type="udp",
-                        peer_id=data.peer_id,
-                        peer_ip=data.ip,
-                        port=data.port,
-                        left=data.left,
-                    )
-
-                    await redis_stroage.save()
-
-                    redis_data = (
-                        await hget(
-                            data.info_hash.hex(),
-                            namespace=REDIS_NAMESPACE_ENUM.HTTP_UDP,
+                # Shield the handler so a graceful shutdown finishes the packet in flight
+                with anyio.CancelScope(shield=True):
+                    try:
+                        await handle_udp_packet(udp, packet, host, port)
+                    except RedisUnavailable:
+                        # Drop the packet, clients retry with their own backoff
+                        logging.info(
+                            "Dropped UDP packet from %s:%s, Redis is unavailable",
+                            host,
+                            port,
+                            extra={"event": LOG_EVENT.REDIS_SHED},
                         )
-                        or {}
-                    )
-                    peers_list = await get_n_random_items(
-                        redis_data.values(), data.numwant
-                    )
-
-                    peers = MutableBox[list[str]]([])
-                    seeders = leechers = MutableBox[int](0)
-
-                    for peer in peers_list:
-                        peer = cast(str, peer)
-
-                        try:
-                            with rollback_on_exception(peers, seeders, leechers):
-                                peer_data = RedisDatastructure(**json.loads(peer))
-                                if peer_data.left == 0:
-                                    seeders.value += 1
-                                else:
-                                    leechers.value += 1
-
-                                peers.value.append(
-                                    f"{peer_data.peer_ip}:{peer_data.port}"
-                                )
-
-                        except TypeError:
-                            # Error in the peer data, delete the peer
-                            logging.error(
-                                f"Error in peer data, deleting the peer: {data.peer_id}"
-                            )
-                            await hdel(
-                                data.info_hash,
-                                f"{data.ip}:{data.port}",
-                                namespace=REDIS_NAMESPACE_ENUM.HTTP_UDP,
-                            )
-
-                    _data |= {
-                        "peers": await addrs_to_compact(peers.value),
-                        "complete": seeders.value,
-                        "incomplete": leechers.value,
-                    }
-                    data = UdpDatastructure(**_data)
-
-                if data.event_name == EVENT_NAMES.STOP:
-                    await hdel(
-                        data.info_hash,
-                        f"{data.ip}:{data.port}",
-                        namespace=REDIS_NAMESPACE_ENUM.HTTP_UDP,
-                    )
-
-                packet = await make_udp_packet(data)
-                logging.info(f"Sent UDP packet for {host}:{port}")
-                await udp.sendto(packet, host, port)
-
-        await redis_manager.close_redis()
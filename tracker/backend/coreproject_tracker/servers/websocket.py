@@ -11,7 +11,12 @@ from coreproject_tracker.datastructures import (
     RedisDatastructure,
     WebsocketDatastructure,
 )
-from coreproject_tracker.enums import ACTIONS, EVENT_NAMES, REDIS_NAMESPACE_ENUM
+from coreproject_tracker.enums import (
+    ACTIONS,
+    EVENT_NAMES,
+    LOG_EVENT,
+    REDIS_NAMESPACE_ENUM,
+)
 from coreproject_tracker.functions import (
     bytes_to_bin_str,
     convert_event_name_to_event_enum,
@@ -178,14 +183,22 @@ async def ws():
 
             # Log the event
             logging.info(
-                f"Sent `Websocket` response for {data.info_hash}. Event: {data.event}."
+                "Sent `Websocket` response for %s. Event: %s.",
+                data.info_hash,
+                data.event,
+                extra={"event": LOG_EVENT.WEBSOCKET_ANNOUNCE},
             )
 
             # Wait for next message from client
             data: WebsocketDatastructure = await parse_websocket()
 
     except asyncio.CancelledError:
-        logging.info(f"WebSocket disconneted for `{data.ip}:{data.port}`")
+        logging.info(
+            "WebSocket disconneted for `%s:%s`",
+            data.ip,
+            data.port,
+            extra={"event": LOG_EVENT.WEBSOCKET_DISCONNECT},
+        )
         raise
     finally:
         # Cleanup
@@ -1 +1,6 @@
-from .redis import RedisHandler as RedisHandler, get_redis as get_redis
+from .breaker import CircuitBreaker as CircuitBreaker
+from .redis import (
+    RedisHandler as RedisHandler,
+    get_redis as get_redis,
+    get_redis_handler as get_redis_handler,
+)
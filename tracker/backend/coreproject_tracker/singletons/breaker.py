@@ -0,0 +1,73 @@
+import time
+
+from attrs import define, field
+
+from coreproject_tracker.enums import BREAKER_STATE
+from coreproject_tracker.exceptions import RedisUnavailable
+
+__all__ = ["CircuitBreaker"]
+
+
+@define
+class CircuitBreaker:
+    """
+    Shed load while a dependency is slow or failing.
+
+    `threshold` consecutive failures, or calls slower than `latency`, open the circuit.
+    After `cooldown` seconds a single probe call is let through (half open),
+    its outcome closes the circuit or opens it again.
+    """
+
+    latency: float
+    threshold: int
+    cooldown: float
+
+    state: BREAKER_STATE = field(default=BREAKER_STATE.CLOSED)
+    failures: int = field(default=0)
+    opened_at: float = field(default=0.0)
+    probing: bool = field(default=False)
+    trips: int = field(default=0)
+    rejected: int = field(default=0)
+    # Exponentially weighted moving average of the call latency, in seconds
+    average_latency: float = field(default=0.0)
+
+    def before_call(self) -> None:
+        """:raises RedisUnavailable: when the call has to be shed"""
+        if self.state == BREAKER_STATE.CLOSED:
+            return
+
+        if self.state == BREAKER_STATE.OPEN:
+            remaining = self.opened_at + self.cooldown - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise RedisUnavailable(remaining)
+            self.state = BREAKER_STATE.HALF_OPEN
+
+        if self.probing:
+            self.rejected += 1
+            raise RedisUnavailable(self.cooldown)
+        self.probing = True
+
+    def record(self, succeeded: bool, elapsed: float) -> None:
+        self.average_latency += (elapsed - self.average_latency) * 0.1
+
+        if succeeded and elapsed <= self.latency:
+            self.failures = 0
+            self.probing = False
+            self.state = BREAKER_STATE.CLOSED
+            return
+
+        self.failures += 1
+        if self.state == BREAKER_STATE.HALF_OPEN or self.failures >= self.threshold:
+            self._open()
+
+    def release(self) -> None:
+        """Forget a call that was cancelled before it had an outcome."""
+        self.probing = False
+
+    def _open(self) -> None:
+        self.state = BREAKER_STATE.OPEN
+        self.opened_at = time.monotonic()
+        self.probing = False
+        self.failures = 0
+        self.trips += 1
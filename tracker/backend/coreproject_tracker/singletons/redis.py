@@ -1,22 +1,117 @@
 import asyncio
 import logging as logger
-from typing import Optional
+import time
+from typing import Any, Optional
 
-from redis.asyncio import Redis, RedisError, from_url
+from redis.asyncio import BlockingConnectionPool, Redis, RedisError
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    ResponseError,
+    TimeoutError as RedisTimeoutError,
+)
 
+from coreproject_tracker.constants import REDIS_METRICS
+from coreproject_tracker.enums import BREAKER_STATE
+from coreproject_tracker.envs import (
+    REDIS_BREAKER_COOLDOWN,
+    REDIS_BREAKER_LATENCY,
+    REDIS_BREAKER_THRESHOLD,
+    REDIS_HEALTH_CHECK_INTERVAL,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT,
+    REDIS_SOCKET_CONNECT_TIMEOUT,
+    REDIS_SOCKET_TIMEOUT,
+)
 from coreproject_tracker.exceptions import RedisNotInitialized
 
+from .breaker import CircuitBreaker
 
-class RedisHandler:
-    _connection: Optional[Redis] = None
+# The handler initialized in this process, workers never share connections
+_handler: Optional["RedisHandler"] = None
+
+
+class MeteredConnectionPool(BlockingConnectionPool):
+    """Blocking pool that counts how often callers had to wait for, or gave up on, a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.waits = 0
+        self.exhausted = 0
+
+    async def get_connection(self, *args: Any, **kwargs: Any):  # type: ignore[no-untyped-def]
+        if not self.can_get_connection():
+            self.waits += 1
+        try:
+            return await super().get_connection(*args, **kwargs)
+        except RedisError as e:
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                self.exhausted += 1
+            raise
+
+
+class BreakerRedis(Redis):
+    """Redis client whose commands go through a circuit breaker."""
+
+    def __init__(self, *args: Any, breaker: CircuitBreaker, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.breaker = breaker
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        self.breaker.before_call()
+
+        started = time.perf_counter()
+        try:
+            result = await super().execute_command(*args, **options)
+        except ResponseError:
+            # Redis answered, the command itself was wrong
+            self.breaker.record(True, time.perf_counter() - started)
+            raise
+        except (RedisConnectionError, RedisTimeoutError):
+            self.breaker.record(False, time.perf_counter() - started)
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
 
-    def __init__(self, redis_uri, connection_attempts=3):
+        self.breaker.record(True, time.perf_counter() - started)
+        return result
+
+
+class RedisHandler:
+    def __init__(
+        self,
+        redis_uri,
+        connection_attempts=3,
+        max_connections: int = REDIS_MAX_CONNECTIONS,
+        pool_timeout: float = REDIS_POOL_TIMEOUT,
+        socket_timeout: float = REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout: float = REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval: int = REDIS_HEALTH_CHECK_INTERVAL,
+    ):
         """
-        :param app: the quart app, defaults to None
-        :param redis_uri: the redis connection URI
+        :param redis_uri: the redis connection URI, `redis://` or `unix://`
+        :param connection_attempts: pings before giving up on startup
+        :param max_connections: size of the connection pool
+        :param pool_timeout: seconds to wait for a free connection
+        :param socket_timeout: seconds to wait for a reply
+        :param socket_connect_timeout: seconds to wait for a connection
+        :param health_check_interval: seconds after which idle connections are pinged on checkout
         """
         self.redis_uri = redis_uri
         self.connection_attempts = connection_attempts
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.socket_timeout = socket_timeout
+        self.socket_connect_timeout = socket_connect_timeout
+        self.health_check_interval = health_check_interval
+
+        self.breaker = CircuitBreaker(
+            latency=REDIS_BREAKER_LATENCY,
+            threshold=REDIS_BREAKER_THRESHOLD,
+            cooldown=REDIS_BREAKER_COOLDOWN,
+        )
+        self._pool: Optional[MeteredConnectionPool] = None
+        self._connection: Optional[Redis] = None
 
     @staticmethod
     async def __attempt_to_connect(conn: Redis, attempts: int):
@@ -36,30 +131,71 @@ class RedisHandler:
 
     # Start method
     async def init_redis(self, **kwargs) -> None:
-        RedisHandler._connection = from_url(self.redis_uri, **kwargs)
+        global _handler
+
+        self._pool = MeteredConnectionPool.from_url(
+            self.redis_uri,
+            max_connections=self.max_connections,
+            timeout=self.pool_timeout,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_connect_timeout,
+            health_check_interval=self.health_check_interval,
+            **kwargs,
+        )
+        self._connection = BreakerRedis(
+            connection_pool=self._pool, breaker=self.breaker
+        )
+        _handler = self
+
         if self.connection_attempts >= 0:
             await self.__attempt_to_connect(
-                RedisHandler._connection,
+                self._connection,
                 self.connection_attempts,
             )
         logger.info("Redis started")
 
     # End method
     async def close_redis(self) -> None:
-        if RedisHandler._connection is not None:
-            await RedisHandler._connection.aclose()
+        global _handler
+
+        if self._connection is not None:
+            await self._connection.aclose()
+            await self._pool.disconnect()  # type: ignore[union-attr]
+            self._connection = None
             logger.info("Redis shutdown")
+        if _handler is self:
+            _handler = None
 
-    @classmethod
-    def get_connection(cls) -> Redis:
+    def get_connection(self) -> Redis:
         """
-        get the shared redis connection
+        get the redis connection of this handler
 
             :raises RedisNotInitialized: if redis has not been initialized
         """
-        if cls._connection is None:
+        if self._connection is None:
             raise RedisNotInitialized("Redis has not been initialized")
-        return cls._connection
+        return self._connection
+
+    def metrics(self) -> tuple[float, ...]:
+        """Pool and breaker gauges, ordered like `REDIS_METRICS`."""
+        pool = self._pool
+        values = {
+            "pool_max_connections": self.max_connections,
+            "pool_in_use": len(pool._in_use_connections) if pool else 0,
+            "pool_idle": len(pool._available_connections) if pool else 0,
+            "pool_waits": pool.waits if pool else 0,
+            "pool_exhausted": pool.exhausted if pool else 0,
+            "breaker_state": list(BREAKER_STATE).index(self.breaker.state),
+            "breaker_trips": self.breaker.trips,
+            "breaker_rejected": self.breaker.rejected,
+            "command_latency_ms": self.breaker.average_latency * 1000,
+        }
+        return tuple(float(values[name]) for name in REDIS_METRICS)
+
+
+def get_redis_handler() -> Optional[RedisHandler]:
+    """The handler initialized in this process, if any."""
+    return _handler
 
 
 def get_redis() -> Redis:
@@ -68,4 +204,6 @@ def get_redis() -> Redis:
 
         :raises RedisNotInitialized: if redis has not been initialized
     """
-    return RedisHandler.get_connection()
+    if _handler is None:
+        raise RedisNotInitialized("Redis has not been initialized")
+    return _handler.get_connection()
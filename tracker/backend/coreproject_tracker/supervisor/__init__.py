@@ -0,0 +1,5 @@
+from .supervisor import Supervisor as Supervisor
+from .worker import (
+    Worker as Worker,
+    make_hypercorn_config as make_hypercorn_config,
+)
@@ -0,0 +1,167 @@
+import asyncio
+import hmac
+import json
+import logging
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
+from coreproject_tracker.constants import (
+    PROFILE_DEFAULT_INTERVAL,
+    PROFILE_DEFAULT_SECONDS,
+    PROFILE_MAX_SECONDS,
+    REDIS_METRICS,
+)
+
+if TYPE_CHECKING:
+    from .supervisor import Supervisor
+
+__all__ = ["serve_health"]
+
+
+def _response(
+    status: HTTPStatus,
+    body: bytes,
+    content_type: str = "application/json",
+    headers: dict[str, str] | None = None,
+) -> bytes:
+    head = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        "Connection: close",
+    ]
+    head.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    return ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+
+def _json_response(status: HTTPStatus, data: object) -> bytes:
+    return _response(status, json.dumps(data).encode())
+
+
+def _metrics(supervisor: "Supervisor") -> bytes:
+    """Per worker Redis gauges in the Prometheus text format."""
+    lines = []
+    for name in REDIS_METRICS:
+        lines.append(f"# TYPE coreproject_tracker_redis_{name} gauge")
+        for worker in supervisor.workers:
+            if not worker.is_alive:
+                continue
+            labels = (
+                f'worker="{worker.index}",role="{worker.role.value}",'
+                f'pid="{worker.process.pid}"'  # type: ignore[union-attr]
+            )
+            value = worker.metrics[REDIS_METRICS.index(name)]
+            lines.append(f"coreproject_tracker_redis_{name}{{{labels}}} {value}")
+
+    return _response(
+        HTTPStatus.OK,
+        ("\n".join(lines) + "\n").encode(),
+        content_type="text/plain; version=0.0.4",
+    )
+
+
+async def _profile(
+    supervisor: "Supervisor", query: dict[str, list[str]], authorization: str
+) -> bytes:
+    token = supervisor.options.admin_token
+    if not token:
+        return _json_response(
+            HTTPStatus.FORBIDDEN, {"error": "Profiling is disabled, set ADMIN_TOKEN"}
+        )
+    if not hmac.compare_digest(authorization.encode(), f"Bearer {token}".encode()):
+        return _json_response(HTTPStatus.UNAUTHORIZED, {"error": "Invalid token"})
+
+    try:
+        index = int(query.get("worker", ["0"])[0])
+        seconds = float(query.get("seconds", [str(PROFILE_DEFAULT_SECONDS)])[0])
+        interval = float(query.get("interval", [str(PROFILE_DEFAULT_INTERVAL)])[0])
+        if index < 0:
+            # Negative indexes would count from the end of the list
+            raise IndexError(index)
+        worker = supervisor.workers[index]
+    except (ValueError, IndexError):
+        return _json_response(HTTPStatus.BAD_REQUEST, {"error": "Invalid parameters"})
+    if not 0 < seconds <= PROFILE_MAX_SECONDS or not 0 < interval < seconds:
+        return _json_response(
+            HTTPStatus.BAD_REQUEST,
+            {"error": f"`seconds` must be in (0, {PROFILE_MAX_SECONDS}]"},
+        )
+
+    logging.warning(f"Profiling {worker.role.value} worker {index} for {seconds}s")
+    try:
+        report = await worker.profile(seconds, interval)
+    except RuntimeError as e:
+        return _json_response(HTTPStatus.CONFLICT, {"error": str(e)})
+    except (ConnectionError, EOFError, OSError, TimeoutError) as e:
+        return _json_response(HTTPStatus.BAD_GATEWAY, {"error": str(e)})
+
+    if "error" in report:
+        return _json_response(HTTPStatus.INTERNAL_SERVER_ERROR, report)
+
+    if query.get("format", ["json"])[0] == "collapsed":
+        # Raw input for `flamegraph.pl` / speedscope, lag statistics travel in the headers
+        return _response(
+            HTTPStatus.OK,
+            report["collapsed"].encode(),
+            content_type="text/plain; charset=utf-8",
+            headers={
+                f"X-Loop-Lag-{name.replace('_', '-')}": str(value)
+                for name, value in report["loop_lag"].items()
+            }
+            | {"X-Profile-Samples": str(report["samples"])},
+        )
+    return _json_response(
+        HTTPStatus.OK,
+        report | {"worker": index, "pid": worker.process.pid},  # type: ignore[union-attr]
+    )
+
+
+async def serve_health(
+    supervisor: "Supervisor", host: str, port: int
+) -> asyncio.Server:
+    """
+    Minimal HTTP endpoint reporting per worker health as JSON.
+
+    `GET /` answers `200` when every worker is alive and beating, `503` otherwise.
+    `GET /metrics` exports the Redis pool and circuit breaker gauges of every worker.
+    `GET /profile?worker=N&seconds=S[&interval=I][&format=collapsed]` samples a worker's
+    event loop and returns collapsed stacks with loop lag statistics,
+    it requires `Authorization: Bearer <ADMIN_TOKEN>`.
+    """
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            target = urlsplit(request_line[1] if len(request_line) > 1 else "/")
+            match target.path:
+                case "/metrics":
+                    response = _metrics(supervisor)
+                case "/profile":
+                    response = await _profile(
+                        supervisor,
+                        parse_qs(target.query),
+                        headers.get("authorization", ""),
+                    )
+                case _:
+                    health = supervisor.health()
+                    response = _json_response(
+                        HTTPStatus.OK
+                        if health["status"] == "ok"
+                        else HTTPStatus.SERVICE_UNAVAILABLE,
+                        health,
+                    )
+
+            writer.write(response)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
@@ -0,0 +1,140 @@
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from multiprocessing.connection import Connection
+from types import FrameType
+from typing import Any
+
+import anyio
+
+from coreproject_tracker.constants import LOOP_LAG_INTERVAL
+
+__all__ = ["StackSampler", "measure_loop_lag", "profile", "serve_profiler"]
+
+
+def _collapse(frame: FrameType | None) -> str:
+    """Render a stack root first, in the `a;b;c` format understood by flamegraph tools."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_qualname} ({code.co_filename}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Sample the stack of one thread from a background thread."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="coreproject_tracker-profiler", daemon=True
+        )
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.stacks[_collapse(frame)] += 1
+            self.samples += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        return "\n".join(
+            f"{stack} {count}" for stack, count in self.stacks.most_common()
+        )
+
+
+async def measure_loop_lag(seconds: float, interval: float) -> list[float]:
+    """Return how late every `interval` sleep woke up, in seconds."""
+    lags = []
+    deadline = time.perf_counter() + seconds
+    while (started := time.perf_counter()) < deadline:
+        await anyio.sleep(interval)
+        lags.append(max(time.perf_counter() - started - interval, 0.0))
+    return lags
+
+
+def _lag_statistics(lags: list[float]) -> dict[str, float | int]:
+    if not lags:
+        return {"probes": 0}
+
+    milliseconds = [lag * 1000 for lag in lags]
+    if len(milliseconds) == 1:
+        p50 = p90 = p99 = milliseconds[0]
+    else:
+        percentiles = statistics.quantiles(milliseconds, n=100, method="inclusive")
+        p50, p90, p99 = percentiles[49], percentiles[89], percentiles[98]
+
+    return {
+        "probes": len(milliseconds),
+        "mean_ms": statistics.fmean(milliseconds),
+        "p50_ms": p50,
+        "p90_ms": p90,
+        "p99_ms": p99,
+        "max_ms": max(milliseconds),
+    }
+
+
+async def profile(seconds: float, interval: float) -> dict[str, Any]:
+    """Sample the running event loop thread for `seconds` while probing its lag."""
+    sampler = StackSampler(threading.get_ident(), interval)
+    sampler.start()
+    try:
+        lags = await measure_loop_lag(seconds, LOOP_LAG_INTERVAL)
+    finally:
+        sampler.stop()
+
+    return {
+        "seconds": seconds,
+        "interval": interval,
+        "samples": sampler.samples,
+        "collapsed": sampler.collapsed(),
+        "loop_lag": _lag_statistics(lags),
+    }
+
+
+async def serve_profiler(control: Connection, poll_interval: float = 0.5) -> None:
+    """
+    Answer profiling requests sent by the supervisor over `control`.
+
+    The pipe is polled from the event loop so no thread stays blocked on it during shutdown.
+    """
+    while True:
+        try:
+            if not control.poll():
+                await anyio.sleep(poll_interval)
+                continue
+            request = control.recv()
+        except (EOFError, OSError):
+            # Supervisor went away
+            return
+
+        try:
+            result = await profile(request["seconds"], request["interval"])
+        except Exception as e:
+            result = {"error": repr(e)}
+        # Lets the supervisor tell this reply from ones it stopped waiting for.
+        # A report larger than the pipe buffer blocks until the supervisor reads it,
+        # which it may never do once it timed out, so it is sent off the event loop
+        try:
+            await anyio.to_thread.run_sync(
+                control.send, result | {"id": request.get("id")}, abandon_on_cancel=True
+            )
+        except OSError:
+            # Supervisor went away
+            return
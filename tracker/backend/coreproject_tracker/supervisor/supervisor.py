@@ -0,0 +1,150 @@
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import time
+from typing import Any
+
+from coreproject_tracker.datastructures import SupervisorDatastructure
+from coreproject_tracker.enums import WORKER_ROLE
+
+from .health import serve_health
+from .worker import Worker
+
+__all__ = ["Supervisor"]
+
+# A worker that stayed up this long is considered recovered, its backoff is reset
+STABLE_AFTER = 30
+POLL_INTERVAL = 0.5
+
+
+def _available_cpus() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+class Supervisor:
+    """
+    Start the UDP worker and the HTTP/Websocket workers, keep them alive and drain them on shutdown.
+
+    Slot `0` always runs the UDP server, every other slot runs Hypercorn.
+    """
+
+    def __init__(self, options: SupervisorDatastructure) -> None:
+        self.options = options
+        self.stopping = asyncio.Event()
+
+        cpus = _available_cpus()
+        self.workers = [
+            Worker(
+                index=index,
+                role=WORKER_ROLE.UDP if index == 0 else WORKER_ROLE.HTTP,
+                cpu=cpus[index % len(cpus)] if options.pin_workers else None,
+            )
+            for index in range(options.workers)
+        ]
+
+    def health(self) -> dict[str, Any]:
+        workers = [
+            worker.health(self.options.heartbeat_timeout) for worker in self.workers
+        ]
+        return {
+            "status": "ok"
+            if all(worker["healthy"] for worker in workers)
+            else "degraded",
+            "pid": os.getpid(),
+            "stopping": self.stopping.is_set(),
+            "workers": workers,
+        }
+
+    def _install_signal_handlers(self) -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            with contextlib.suppress(NotImplementedError):
+                # Not implemented on windows, `KeyboardInterrupt` is handled in `main`
+                loop.add_signal_handler(signum, self.stopping.set)
+
+    def _backoff(self, worker: Worker) -> float:
+        return min(
+            self.options.restart_backoff * 2 ** (worker.failures - 1),
+            self.options.restart_backoff_max,
+        )
+
+    def _supervise(self, worker: Worker) -> None:
+        now = time.time()
+
+        if worker.is_alive:
+            if worker.heartbeat_age > self.options.heartbeat_timeout:
+                logging.error(
+                    f"{worker.role.value} worker {worker.index} missed heartbeats "
+                    f"for {worker.heartbeat_age:.1f}s, killing it"
+                )
+                worker.process.kill()  # type: ignore[union-attr]
+            return
+
+        # Worker died since the last poll, schedule its restart
+        if worker.restart_at == 0.0:
+            if now - worker.started_at >= STABLE_AFTER:
+                worker.failures = 0
+            worker.failures += 1
+            delay = self._backoff(worker)
+            worker.restart_at = now + delay
+            exitcode = worker.process.exitcode if worker.process else None
+            logging.error(
+                f"{worker.role.value} worker {worker.index} exited with code {exitcode}, "
+                f"restarting in {delay:.1f}s"
+            )
+
+        if now >= worker.restart_at:
+            worker.restart_at = 0.0
+            worker.restarts += 1
+            worker.start(self.options)
+
+    async def _drain(self) -> None:
+        logging.info("Draining workers")
+        for worker in self.workers:
+            if worker.is_alive:
+                worker.process.terminate()  # type: ignore[union-attr]
+
+        deadline = time.time() + self.options.graceful_timeout + 5
+        while (
+            any(worker.is_alive for worker in self.workers) and time.time() < deadline
+        ):
+            await asyncio.sleep(0.1)
+
+        for worker in self.workers:
+            if worker.is_alive:
+                logging.warning(
+                    f"{worker.role.value} worker {worker.index} did not drain in time, killing it"
+                )
+                worker.process.kill()  # type: ignore[union-attr]
+            if worker.process is not None:
+                worker.process.join()
+
+    async def run(self) -> None:
+        self._install_signal_handlers()
+
+        for worker in self.workers:
+            worker.start(self.options)
+
+        health_server = None
+        if self.options.health_port:
+            health_server = await serve_health(
+                self, self.options.health_host, self.options.health_port
+            )
+
+        try:
+            while not self.stopping.is_set():
+                for worker in self.workers:
+                    self._supervise(worker)
+
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self.stopping.wait(), POLL_INTERVAL)
+        finally:
+            if health_server is not None:
+                health_server.close()
+            await self._drain()
+
+        logging.info("Application shutdown complete")
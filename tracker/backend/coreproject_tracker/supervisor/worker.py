@@ -0,0 +1,261 @@
+import asyncio
+import ctypes
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+import anyio
+from attrs import define, field
+from hypercorn import Config
+from hypercorn.asyncio import serve  # type: ignore
+
+from coreproject_tracker.constants import REDIS_METRICS
+from coreproject_tracker.datastructures import SupervisorDatastructure
+from coreproject_tracker.enums import WORKER_ROLE
+from coreproject_tracker.functions import wait_for_shutdown_signal
+from coreproject_tracker.log import setup_logging
+from coreproject_tracker.singletons import get_redis_handler
+
+from .profiler import serve_profiler
+
+try:
+    import uvloop  # type: ignore[import]  # noqa: F401
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+__all__ = ["Worker", "make_hypercorn_config"]
+
+
+def make_hypercorn_config(options: SupervisorDatastructure) -> Config:
+    config = Config()
+    config.bind = [f"{options.host}:{options.port}"]
+    config.keep_alive_timeout = options.keep_alive_timeout
+    config.backlog = options.backlog
+    config.graceful_timeout = options.graceful_timeout
+    # Every HTTP worker binds the same port.
+    # Hypercorn only sets `SO_REUSEPORT` when it thinks there is more than one worker.
+    config.workers = options.workers - 1
+    return config
+
+
+def _pin_to_cpu(cpu: int | None) -> None:
+    if cpu is None or not hasattr(os, "sched_setaffinity"):
+        return
+
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError as e:
+        logging.warning(f"Could not pin worker to CPU {cpu}: {e}")
+
+
+async def _beat(heartbeat: Any, metrics: Any, interval: float) -> None:
+    """
+    Stamp the shared heartbeat from the event loop, a blocked loop stops beating.
+
+    The Redis pool metrics of this process are published alongside.
+    """
+    while True:
+        heartbeat.value = time.time()
+        if (handler := get_redis_handler()) is not None:
+            metrics[:] = handler.metrics()
+        await anyio.sleep(interval)
+
+
+async def _serve_udp(
+    options: SupervisorDatastructure,
+    heartbeat: Any,
+    metrics: Any,
+    control: Connection,
+) -> None:
+    from coreproject_tracker.servers import run_udp_server
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_beat, heartbeat, metrics, options.heartbeat_interval)
+        tg.start_soon(serve_profiler, control)
+        tg.start_soon(run_udp_server, options.host, options.port)
+
+        await wait_for_shutdown_signal()
+        tg.cancel_scope.cancel()
+
+
+async def _serve_http(
+    options: SupervisorDatastructure,
+    heartbeat: Any,
+    metrics: Any,
+    control: Connection,
+) -> None:
+    from coreproject_tracker.app import make_app
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_beat, heartbeat, metrics, options.heartbeat_interval)
+        tg.start_soon(serve_profiler, control)
+
+        # Hypercorn stops accepting on `SIGTERM` and waits `graceful_timeout` for in-flight requests
+        await serve(
+            make_app(),
+            make_hypercorn_config(options),
+            shutdown_trigger=wait_for_shutdown_signal,
+        )
+        tg.cancel_scope.cancel()
+
+
+def run_worker(
+    role: WORKER_ROLE,
+    options: SupervisorDatastructure,
+    cpu: int | None,
+    heartbeat: Any,
+    metrics: Any,
+    control: Connection,
+) -> None:
+    """Entry point of a worker process."""
+    # Forked children inherit the supervisor's signal handlers, start from a clean slate
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    # Each worker drains its own log queue, records never cross process boundaries
+    listener = setup_logging()
+
+    if options.pin_workers:
+        _pin_to_cpu(cpu)
+
+    match role:
+        case WORKER_ROLE.UDP:
+            target = _serve_udp
+        case WORKER_ROLE.HTTP:
+            target = _serve_http
+
+    try:
+        anyio.run(
+            target,
+            options,
+            heartbeat,
+            metrics,
+            control,
+            backend="asyncio",
+            backend_options={"use_uvloop": options.use_uvloop and HAS_UVLOOP},
+        )
+    finally:
+        # `multiprocessing` exits with `os._exit`, flush pending records first
+        listener.stop()
+
+
+@define
+class Worker:
+    """Book-keeping for one supervised worker slot."""
+
+    index: int
+    role: WORKER_ROLE
+    cpu: int | None
+
+    process: BaseProcess | None = field(default=None)
+    heartbeat: Any = field(factory=lambda: multiprocessing.Value(ctypes.c_double, 0.0))
+    # Redis pool and circuit breaker gauges, laid out like `REDIS_METRICS`
+    metrics: Any = field(
+        factory=lambda: multiprocessing.Array(ctypes.c_double, len(REDIS_METRICS))
+    )
+    # Supervisor end of the pipe used to send profiling requests
+    control: Connection | None = field(default=None)
+    profiling: bool = field(default=False)
+    # Id of the last profiling request, replies to earlier ones are stale
+    profile_id: int = field(default=0)
+    started_at: float = field(default=0.0)
+    restarts: int = field(default=0)
+    # Consecutive crashes, drives the restart backoff
+    failures: int = field(default=0)
+    restart_at: float = field(default=0.0)
+
+    def start(self, options: SupervisorDatastructure) -> None:
+        self.heartbeat.value = time.time()
+        self.metrics[:] = [0.0] * len(REDIS_METRICS)
+        if self.control is not None:
+            self.control.close()
+        self.control, worker_control = multiprocessing.Pipe()
+        self.profiling = False
+
+        self.process = multiprocessing.Process(
+            target=run_worker,
+            args=(
+                self.role,
+                options,
+                self.cpu,
+                self.heartbeat,
+                self.metrics,
+                worker_control,
+            ),
+            name=f"coreproject_tracker-{self.role.value}-{self.index}",
+            daemon=False,
+        )
+        self.process.start()
+        worker_control.close()
+        self.started_at = time.time()
+        logging.info(
+            f"Started {self.role.value} worker {self.index} (pid {self.process.pid}, cpu {self.cpu})"
+        )
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    @property
+    def heartbeat_age(self) -> float:
+        return time.time() - self.heartbeat.value
+
+    def health(self, heartbeat_timeout: float) -> dict[str, Any]:
+        alive = self.is_alive
+        heartbeat_age = self.heartbeat_age if alive else None
+        return {
+            "index": self.index,
+            "role": self.role.value,
+            "pid": self.process.pid if self.process else None,
+            "cpu": self.cpu,
+            "alive": alive,
+            "healthy": alive
+            and heartbeat_age is not None
+            and heartbeat_age < heartbeat_timeout,
+            "uptime": time.time() - self.started_at if alive else 0,
+            "heartbeat_age": heartbeat_age,
+            "restarts": self.restarts,
+            "exitcode": self.process.exitcode if self.process else None,
+            "redis": dict(zip(REDIS_METRICS, self.metrics[:])) if alive else None,
+        }
+
+    async def profile(self, seconds: float, interval: float) -> dict[str, Any]:
+        """Ask the worker to profile its event loop and wait for the report."""
+        if self.control is None or not self.is_alive:
+            raise ConnectionError(
+                f"{self.role.value} worker {self.index} is not running"
+            )
+        if self.profiling:
+            raise RuntimeError(
+                f"{self.role.value} worker {self.index} is already profiling"
+            )
+
+        control = self.control
+        self.profiling = True
+        self.profile_id += 1
+        try:
+            control.send(
+                {"id": self.profile_id, "seconds": seconds, "interval": interval}
+            )
+            # The worker polls its pipe, give it some slack on top of the profiling time
+            deadline = time.monotonic() + seconds + 10
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not await asyncio.to_thread(
+                    control.poll, remaining
+                ):
+                    raise TimeoutError(
+                        f"{self.role.value} worker {self.index} did not answer"
+                    )
+                report = control.recv()
+                # Late replies of requests that timed out are still in the pipe
+                if report.pop("id", None) == self.profile_id:
+                    return report
+        finally:
+            self.profiling = False
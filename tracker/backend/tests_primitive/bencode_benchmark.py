@@ -0,0 +1,61 @@
+"""
+Compare `bencode_announce` against `bencodepy` for typical announce responses.
+
+Run with `python -m tests_primitive.bencode_benchmark` from the tracker backend directory.
+"""
+
+import secrets
+import timeit
+
+import bencodepy  # type: ignore
+
+from coreproject_tracker.constants import ANNOUNCE_INTERVAL
+from coreproject_tracker.functions import bencode_announce
+
+RUNS = 2_000
+
+
+def make_peers(n: int, ipv6: bool = False) -> list[tuple[str, str, int]]:
+    return [
+        (
+            secrets.token_hex(20),
+            f"2001:db8::{i:x}" if ipv6 else f"10.0.{i // 256}.{i % 256}",
+            6881 + i,
+        )
+        for i in range(n)
+    ]
+
+
+def with_bencodepy(peers, peers6) -> bytes:
+    return bencodepy.bencode(
+        {
+            "peers": [
+                {"peer id": peer_id, "ip": ip, "port": port}
+                for peer_id, ip, port in peers
+            ],
+            "peers6": [
+                {"peer id": peer_id, "ip": ip, "port": port}
+                for peer_id, ip, port in peers6
+            ],
+            "interval": ANNOUNCE_INTERVAL,
+            "min interval": ANNOUNCE_INTERVAL,
+            "complete": 12,
+            "incomplete": 34,
+        }
+    )
+
+
+def with_template(peers, peers6) -> bytes:
+    return bencode_announce(12, 34, peers, peers6)
+
+
+for count in (0, 10, 50, 200):
+    peers, peers6 = make_peers(count), make_peers(count // 4, ipv6=True)
+    assert with_template(peers, peers6) == with_bencodepy(peers, peers6)
+
+    generic = timeit.timeit(lambda: with_bencodepy(peers, peers6), number=RUNS)
+    template = timeit.timeit(lambda: with_template(peers, peers6), number=RUNS)
+    print(
+        f"{count:>4} peers: bencodepy {generic / RUNS * 1e6:8.1f}us, "
+        f"template {template / RUNS * 1e6:8.1f}us ({generic / template:.1f}x)"
+    )